@@ -0,0 +1,59 @@
+"""
+Benchmark ReAct agent setup overhead in MonitoringAgent.
+
+Compares rebuilding the ReAct agent (model init, tool binding and graph
+compilation) on every monitoring cycle with reusing the agent cached per
+(model, tool set). No LLM call is made.
+
+Usage:
+    uv run python benchmarks/bench_agent_setup.py
+"""
+
+import os
+import time
+
+from langchain_core.tools import StructuredTool
+from langgraph.prebuilt import create_react_agent
+
+from cartai.agents.observability.monitoring_agent import DEFAULT_MODEL, MonitoringAgent
+
+CYCLES = 50
+TOOLS = 20
+
+
+def make_tools() -> list:
+    def lookup(experiment_id: str, max_results: int = 100) -> str:
+        """Look up runs of an experiment"""
+        return experiment_id
+
+    return [
+        StructuredTool.from_function(lookup, name=f"tool_{i}") for i in range(TOOLS)
+    ]
+
+
+def main() -> None:
+    # Model clients are created but never called
+    os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+    tools = make_tools()
+
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        create_react_agent(
+            model=DEFAULT_MODEL, tools=tools, version="v2", name="monitoring_agent"
+        )
+    rebuilt = (time.perf_counter() - start) / CYCLES
+
+    agent = MonitoringAgent()
+    start = time.perf_counter()
+    for _ in range(CYCLES):
+        agent._get_react_agent(DEFAULT_MODEL, tools)
+    cached = (time.perf_counter() - start) / CYCLES
+
+    print(f"{CYCLES} cycles, {TOOLS} tools")
+    print(f"rebuild per cycle: {rebuilt * 1000:8.3f} ms")
+    print(f"cached per cycle:  {cached * 1000:8.3f} ms")
+    print(f"speedup:           {rebuilt / cached:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
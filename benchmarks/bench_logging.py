@@ -0,0 +1,139 @@
+"""
+Benchmark logging startup and per-call latency of LoggerFactory.
+
+Measures the cost of importing ``cartai.logging`` and of the first
+``get_logger`` call (which loads the config and builds the handlers), then
+the latency seen by callers of ``logger.debug`` with a file handler and
+with a simulated remote handler (200us per record, as a network log
+shipper), run synchronously or on the queue listener thread.
+
+Usage:
+    uv run python benchmarks/bench_logging.py
+"""
+
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from cartai.logging import LoggerFactory
+
+ROOT = Path(__file__).resolve().parents[1]
+
+CALLS = 20_000
+REMOTE_CALLS = 2_000
+REMOTE_LATENCY_S = 0.0002
+STARTUPS = 5
+
+STARTUP_SCRIPT = """
+import time
+start = time.perf_counter()
+import cartai.logging
+imported = time.perf_counter()
+cartai.logging.get_logger("bench")
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+class RemoteHandler(logging.Handler):
+    """Handler spending a fixed time per record, like a network shipper"""
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.format(record)
+        time.sleep(REMOTE_LATENCY_S)
+
+
+def measure_startup() -> Dict[str, float]:
+    """Median import and first get_logger time, in fresh interpreters"""
+    imports: List[float] = []
+    first_calls: List[float] = []
+    # Run from a scratch directory: the default config writes logs/cartai.log
+    env = {**os.environ, "PYTHONPATH": str(ROOT)}
+    with tempfile.TemporaryDirectory(prefix="cartai-bench-") as cwd:
+        for _ in range(STARTUPS):
+            output = subprocess.run(
+                [sys.executable, "-c", STARTUP_SCRIPT],
+                capture_output=True,
+                text=True,
+                check=True,
+                cwd=cwd,
+                env=env,
+            ).stdout.split()
+            imports.append(float(output[0]))
+            first_calls.append(float(output[1]))
+    return {
+        "import_ms": statistics.median(imports) * 1000,
+        "first_get_logger_ms": statistics.median(first_calls) * 1000,
+    }
+
+
+def measure_calls(handler: Dict, use_queue: bool, calls: int) -> Dict[str, float]:
+    """Latency of logger.debug calls with a single handler"""
+    LoggerFactory.reset()
+    factory = LoggerFactory(
+        {
+            "formatters": {"default": {"format": "%(asctime)s - %(message)s"}},
+            "handlers": {
+                "bench": {
+                    "formatter": "default",
+                    "level": "DEBUG",
+                    "queue": use_queue,
+                    **handler,
+                }
+            },
+            "root": {"level": "DEBUG", "handlers": ["bench"]},
+        }
+    )
+    logger = factory.get_logger("bench")
+
+    latencies: List[float] = []
+    for i in range(calls):
+        call_start = time.perf_counter_ns()
+        logger.debug("Agent step %d: %s", i, {"tool": "list_runs", "runs": 50})
+        latencies.append(time.perf_counter_ns() - call_start)
+
+    drain_start = time.perf_counter()
+    factory.shutdown()
+    drain = time.perf_counter() - drain_start
+
+    latencies.sort()
+    return {
+        "mean_us": statistics.fmean(latencies) / 1000,
+        "p99_us": latencies[int(0.99 * len(latencies))] / 1000,
+        "drain_ms": drain * 1000,
+    }
+
+
+def main() -> None:
+    startup = measure_startup()
+    print(f"import cartai.logging: {startup['import_ms']:8.2f} ms")
+    print(f"first get_logger:      {startup['first_get_logger_ms']:8.2f} ms")
+
+    directory = Path(tempfile.mkdtemp(prefix="cartai-bench-"))
+    scenarios = [
+        (
+            "file",
+            {"class": "logging.FileHandler", "filename": str(directory / "bench.log")},
+            CALLS,
+        ),
+        ("remote", {"class": "__main__.RemoteHandler"}, REMOTE_CALLS),
+    ]
+    print(f"\n{'handler':<8}{'mode':<8}{'mean us':>10}{'p99 us':>10}{'drain ms':>10}")
+    for name, handler, calls in scenarios:
+        for label, use_queue in (("sync", False), ("queue", True)):
+            stats = measure_calls(handler, use_queue, calls)
+            print(
+                f"{name:<8}{label:<8}{stats['mean_us']:>10.2f}"
+                f"{stats['p99_us']:>10.2f}{stats['drain_ms']:>10.2f}"
+            )
+    LoggerFactory.reset()
+    logging.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Benchmark the typed and compact state representations of CartaiGraph.
+
+Runs a linear workflow of 10 agents over a state with large
+``model_metrics`` and ``messages``, once with ``MLPipelineState`` and once
+with ``execution.state: compact``, and reports the wall time of a run and
+the size and serialization time of the final state as a snapshot.
+
+LangGraph dominates the run time, not the state representation. The
+compact schema is no faster: it measures within a few percent of the typed
+one, usually slightly slower. Its snapshot is barely smaller than the dict.
+The compact state is about validating the input once, not about speed.
+
+Usage:
+    uv run python benchmarks/bench_state_model.py
+"""
+
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping
+
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from cartai.agents.base.mcp_aware_agent import MCPAwareAgent
+from cartai.orchestration.graphs.dynamic_graph import CartaiGraph
+from cartai.orchestration.runtime.agent_pool import AgentPool
+from cartai.orchestration.states import CompactMLPipelineState
+
+NODES = 10
+METRICS = 2_000
+MESSAGES = 500
+REPEATS = 50
+STATES = ("typed", "compact")
+
+# Relative run time difference below which the schemas are reported as equal
+NOISE = 0.10
+
+
+class ReadingAgent(MCPAwareAgent):
+    """Agent reading a few state keys and returning a small delta"""
+
+    async def run(self, state: Mapping[str, Any]) -> Dict[str, Any]:
+        accuracy = state["model_metrics"].get("metric_0", 0.0)
+        return {"system_health": "HEALTHY" if accuracy >= 0 else "DEGRADED"}
+
+
+def initial_state() -> Dict[str, Any]:
+    return {
+        "experiment_id": "exp1",
+        "messages": [f"message {i}" * 10 for i in range(MESSAGES)],
+        "model_metrics": {f"metric_{i}": i / METRICS for i in range(METRICS)},
+    }
+
+
+def write_config(directory: Path, state: str) -> Path:
+    agents = "".join(
+        f"""
+  - name: agent_{i}
+    logic: "__main__.ReadingAgent"
+"""
+        for i in range(NODES)
+    )
+    config_file = directory / f"{state}.yaml"
+    config_file.write_text(
+        f"""
+name: "State benchmark"
+execution:
+  state: {state}
+  warmup: false
+agents:{agents}"""
+    )
+    return config_file
+
+
+async def time_runs(directory: Path) -> Dict[str, float]:
+    """Median seconds per run of each schema, run alternately"""
+    graphs = {
+        state: CartaiGraph(
+            config_file=write_config(directory, state), agent_pool=AgentPool()
+        )
+        for state in STATES
+    }
+    for graph in graphs.values():
+        await graph.ainvoke(initial_state())
+
+    # Alternated, so machine noise hits both schemas alike
+    timings: Dict[str, List[float]] = {state: [] for state in STATES}
+    for _ in range(REPEATS):
+        for state, graph in graphs.items():
+            start = time.perf_counter()
+            await graph.ainvoke(initial_state())
+            timings[state].append(time.perf_counter() - start)
+    return {state: statistics.median(runs) for state, runs in timings.items()}
+
+
+def snapshot_sizes(result: Dict[str, Any]) -> Dict[str, float]:
+    """Size and serialization time of a final state, as a dict and compact"""
+    serde = JsonPlusSerializer()
+    start = time.perf_counter()
+    _, typed_bytes = serde.dumps_typed(result)
+    typed_dump = time.perf_counter() - start
+
+    compact = CompactMLPipelineState.from_initial(result)
+    start = time.perf_counter()
+    compact_bytes = compact.to_bytes()
+    compact_dump = time.perf_counter() - start
+
+    return {
+        "dict_snapshot_bytes": len(typed_bytes),
+        "dict_snapshot_s": typed_dump,
+        "compact_snapshot_bytes": len(compact_bytes),
+        "compact_snapshot_s": compact_dump,
+    }
+
+
+async def main() -> None:
+    directory = Path(tempfile.mkdtemp(prefix="cartai-bench-"))
+    print(f"{NODES} nodes, {METRICS} metrics, {MESSAGES} messages")
+    print(f"{'state':<10}{'ms/run':>10}")
+    per_run = await time_runs(directory)
+    for state in STATES:
+        print(f"{state:<10}{per_run[state] * 1000:>10.2f}")
+
+    change = per_run["compact"] / per_run["typed"] - 1
+    verdict = "within noise" if abs(change) < NOISE else "beyond noise"
+    print(f"compact vs typed: {change:+.1%} ({verdict})")
+
+    graph = CartaiGraph(
+        config_file=write_config(directory, "typed"), agent_pool=AgentPool()
+    )
+    stats = snapshot_sizes(await graph.ainvoke(initial_state()))
+    print(
+        f"\nsnapshot of the final state:\n"
+        f"{'dict':<10}{stats['dict_snapshot_bytes']:>10,} bytes "
+        f"{stats['dict_snapshot_s'] * 1000:>8.3f} ms\n"
+        f"{'compact':<10}{stats['compact_snapshot_bytes']:>10,} bytes "
+        f"{stats['compact_snapshot_s'] * 1000:>8.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,97 @@
+"""
+Benchmark state handling of whole-state vs delta-based agent nodes.
+
+Runs a linear workflow of agents over MLPipelineState with large
+``model_metrics`` and ``messages`` and reports, per node, the bytes each
+node hands back to LangGraph and the wall time of the whole run.
+
+Usage:
+    uv run python benchmarks/bench_state_updates.py
+"""
+
+import asyncio
+import time
+from typing import Any, Callable, Dict, List
+
+from langgraph.graph import END, START, StateGraph
+
+from cartai.orchestration.runtime.telemetry import estimate_size
+from cartai.orchestration.states.ml_pipeline_state import MLPipelineState
+
+NODES = 10
+METRICS = 2_000
+MESSAGES = 500
+REPEATS = 5
+
+
+def initial_state() -> Dict[str, Any]:
+    return {
+        "messages": [f"message {i}" * 10 for i in range(MESSAGES)],
+        "model_metrics": {f"metric_{i}": i / METRICS for i in range(METRICS)},
+        "system_health": "UNKNOWN",
+        "error_messages": [],
+    }
+
+
+def whole_state_node(name: str, sizes: List[int]) -> Callable:
+    """Previous wrapper: copy the state, merge the full agent result back"""
+
+    async def node(state: Dict[str, Any]) -> Dict[str, Any]:
+        agent_state = dict(state)
+        agent_state["system_health"] = "HEALTHY"
+        agent_state["current_agent"] = name
+        state.update(agent_state)
+        sizes.append(estimate_size(state))
+        return state
+
+    return node
+
+
+def delta_node(name: str, sizes: List[int]) -> Callable:
+    """Current wrapper: agents return only the keys they change"""
+
+    async def node(state: Dict[str, Any]) -> Dict[str, Any]:
+        delta = {"system_health": "HEALTHY", "current_agent": name}
+        sizes.append(estimate_size(delta))
+        return delta
+
+    return node
+
+
+async def run(node_factory: Callable) -> Dict[str, float]:
+    sizes: List[int] = []
+    workflow = StateGraph(MLPipelineState)
+    names = [f"agent_{i}" for i in range(NODES)]
+    for name in names:
+        workflow.add_node(name, node_factory(name, sizes))
+    workflow.add_edge(START, names[0])
+    for current, following in zip(names, names[1:]):
+        workflow.add_edge(current, following)
+    workflow.add_edge(names[-1], END)
+    compiled = workflow.compile()
+
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        result = await compiled.ainvoke(initial_state())
+    elapsed = (time.perf_counter() - start) / REPEATS
+
+    return {
+        "bytes_per_node": sum(sizes) / len(sizes),
+        "final_messages": len(result["messages"]),
+        "seconds_per_run": elapsed,
+    }
+
+
+async def main() -> None:
+    print(f"{NODES} nodes, {METRICS} metrics, {MESSAGES} messages")
+    print(f"{'mode':<12}{'bytes/node':>14}{'messages':>10}{'s/run':>10}")
+    for label, factory in (("whole-state", whole_state_node), ("delta", delta_node)):
+        stats = await run(factory)
+        print(
+            f"{label:<12}{stats['bytes_per_node']:>14,.0f}"
+            f"{stats['final_messages']:>10}{stats['seconds_per_run']:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
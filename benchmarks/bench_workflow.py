@@ -0,0 +1,157 @@
+"""
+Benchmark end-to-end orchestration of the ML pipeline example workflow.
+
+Runs ``ml_pipeline_example minimal.yaml`` offline: the MonitoringAgent's LLM
+is a scripted chat model and its MCP servers run in process, so the timings
+only measure CartaiGraph and agent overhead. Reports per-phase timings:
+
+- graph_build: loading the YAML, building and compiling the graph
+- mcp_connect: opening MCP sessions while listing tools
+- tool_listing: listing tools once connected
+- agent_init: the rest of the warmup (agent construction, tool binding)
+- agent_loop: node execution, including the ReAct loop and tool calls
+- state_merge: the rest of the run (state creation and merging, routing)
+
+Usage:
+    uv run python benchmarks/bench_workflow.py [--iterations 20] [--warm] [--json]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from cartai.agents.base.tool_cache import default_tool_cache
+from cartai.mcps.registry.mcp_registry import MCPRegistry
+from cartai.orchestration.graphs.dynamic_graph import CartaiGraph
+from cartai.orchestration.runtime.agent_pool import AgentPool
+from cartai.testing import InProcessMCPClient, ScriptedChatModel, monitoring_script
+from cartai.testing.fake_mcp import create_fake_mlflow_server, create_fake_notion_server
+
+ROOT = Path(__file__).resolve().parent.parent
+CONFIG_FILE = ROOT / "cartai/orchestration/configs/ml_pipeline_example minimal.yaml"
+MCP_CONFIG_FILE = ROOT / "cartai/mcps/configs/mcp_configs.yaml"
+PHASES = [
+    "graph_build",
+    "mcp_connect",
+    "tool_listing",
+    "agent_init",
+    "agent_loop",
+    "state_merge",
+    "total",
+]
+
+
+def make_pool(servers: Dict, clients: List[InProcessMCPClient]) -> AgentPool:
+    """Agent pool with in-process MCP servers and the scripted LLM"""
+
+    def client_factory(config: Dict) -> InProcessMCPClient:
+        client = InProcessMCPClient(config, servers)
+        clients.append(client)
+        return client
+
+    return AgentPool(
+        mcp_client_factory=client_factory,
+        param_overrides={
+            "monitoring_agent": {"model": ScriptedChatModel(script=monitoring_script())}
+        },
+    )
+
+
+async def run_once(
+    registry: MCPRegistry, pool: AgentPool, clients: List[InProcessMCPClient]
+) -> Dict[str, float]:
+    """Run the workflow once and split its wall time into phases"""
+    timings: Dict[str, float] = {}
+    listed = {
+        phase: sum(client.timings[phase] for client in clients)
+        for phase in ("mcp_connect", "tool_listing")
+    }
+
+    start = time.perf_counter()
+    graph = CartaiGraph(config_file=CONFIG_FILE, mcp_registry=registry, agent_pool=pool)
+    graph.compile()
+    timings["graph_build"] = time.perf_counter() - start
+
+    started = time.perf_counter()
+    await graph.warmup()
+    warmup = time.perf_counter() - started
+    for phase, before in listed.items():
+        timings[phase] = sum(client.timings[phase] for client in clients) - before
+    timings["agent_init"] = warmup - timings["mcp_connect"] - timings["tool_listing"]
+
+    started = time.perf_counter()
+    _, report = await graph.ainvoke_with_report(
+        {"experiment_id": "1", "model_name": "model", "run_id": "run"}
+    )
+    run = time.perf_counter() - started
+    timings["agent_loop"] = sum(span.wall_time_s for span in report.spans)
+    timings["state_merge"] = run - timings["agent_loop"]
+
+    timings["total"] = time.perf_counter() - start
+    return timings
+
+
+def summarize(samples: List[Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Mean, median and p95 of every phase, in milliseconds"""
+    summary = {}
+    for phase in PHASES:
+        values = sorted(sample[phase] * 1000 for sample in samples)
+        summary[phase] = {
+            "mean_ms": statistics.fmean(values),
+            "p50_ms": statistics.median(values),
+            "p95_ms": values[min(len(values) - 1, int(0.95 * len(values)))],
+        }
+    return summary
+
+
+async def main(iterations: int, warm: bool) -> Dict[str, Dict[str, float]]:
+    registry = MCPRegistry(mcp_config_path=MCP_CONFIG_FILE, environment="development")
+    # Shared servers: every run sees a new MLflow run, so the agent never
+    # takes the no-change fast path and always runs its ReAct loop
+    servers = {
+        "mlflow": create_fake_mlflow_server(),
+        "notion": create_fake_notion_server(),
+    }
+    clients: List[InProcessMCPClient] = []
+    pool = make_pool(servers, clients)
+
+    samples = []
+    # The first run, paying for imports, is not reported
+    for i in range(iterations + 1):
+        default_tool_cache().clear()
+        if not warm:
+            # Cold start: new agents, MCP clients and tool lists every run
+            clients.clear()
+            pool = make_pool(servers, clients)
+        timings = await run_once(registry, pool, clients)
+        if i:
+            samples.append(timings)
+    return summarize(samples)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--warm", action="store_true", help="Reuse agents across iterations"
+    )
+    parser.add_argument("--json", action="store_true", help="Print JSON for CI")
+    args = parser.parse_args()
+
+    results = asyncio.run(main(args.iterations, args.warm))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        mode = "warm" if args.warm else "cold"
+        print(f"{args.iterations} iterations ({mode} agents)")
+        print(f"{'phase':<14}{'mean':>10}{'p50':>10}{'p95':>10}  (ms)")
+        for phase, stats in results.items():
+            print(
+                f"{phase:<14}{stats['mean_ms']:>10.2f}"
+                f"{stats['p50_ms']:>10.2f}{stats['p95_ms']:>10.2f}"
+            )
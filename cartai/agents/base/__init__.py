@@ -1,5 +1,7 @@
 """Base agent classes"""
 
 from .mcp_aware_agent import MCPAwareAgent
+from .tool_cache import ToolResultCache
+from .tool_filter import ToolFilter
 
-__all__ = ["MCPAwareAgent"]
+__all__ = ["MCPAwareAgent", "ToolFilter", "ToolResultCache"]
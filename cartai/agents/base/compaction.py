@@ -0,0 +1,213 @@
+"""Token budget and compaction of ReAct message histories"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, BaseMessage, ToolMessage
+from langchain_core.runnables import RunnableConfig
+
+from cartai.agents.base.tool_filter import CHARS_PER_TOKEN
+from cartai.agents.exceptions import TokenBudgetExceeded
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_TOOL_MESSAGE_TOKENS = 2000
+DEFAULT_CONTEXT_BUDGET_TOKENS = 12000
+DEFAULT_HARD_CAP_TOKENS = 60000
+
+# Key of the per-run TokenUsage in RunnableConfig["configurable"]
+TOKEN_USAGE_KEY = "token_usage"
+
+
+def message_text(message: BaseMessage) -> str:
+    """Text content of a message (text blocks joined for multi-part content)"""
+    if isinstance(message.content, str):
+        return message.content
+    return "\n".join(
+        block if isinstance(block, str) else str(block.get("text", block))
+        for block in message.content
+    )
+
+
+def estimate_tokens(message: BaseMessage) -> int:
+    """
+    Estimate the prompt tokens taken by a message.
+
+    Args:
+        message: Chat message
+
+    Returns:
+        Approximate number of tokens of its content and tool calls
+    """
+    size = len(message_text(message))
+    if isinstance(message, AIMessage) and message.tool_calls:
+        size += len(json.dumps([call["args"] for call in message.tool_calls]))
+    return size // CHARS_PER_TOKEN + 1
+
+
+@dataclass
+class TokenUsage:
+    """Tokens sent to the model over one ReAct run"""
+
+    model_calls: int = 0
+    tokens_sent: int = 0
+    tokens_saved: int = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Convert the usage to a plain dictionary"""
+        return asdict(self)
+
+
+class MessageCompactor:
+    """
+    Keeps the messages sent at every ReAct step within a token budget.
+
+    Used as the ``pre_model_hook`` of ``create_react_agent``: the state keeps
+    the full history, only the messages sent to the model are compacted.
+
+    - Tool messages larger than ``max_tool_message_tokens`` are truncated.
+    - While the history exceeds ``context_budget_tokens``, the oldest tool
+      outputs are replaced by a short placeholder. Messages are never
+      removed, so every tool call keeps its result.
+    - When the tokens sent over a run would exceed ``hard_cap_tokens``,
+      ``TokenBudgetExceeded`` is raised before calling the model.
+
+    Per-run usage is tracked in the ``TokenUsage`` passed as
+    ``config["configurable"]["token_usage"]``.
+    """
+
+    def __init__(
+        self,
+        max_tool_message_tokens: int = DEFAULT_MAX_TOOL_MESSAGE_TOKENS,
+        context_budget_tokens: int = DEFAULT_CONTEXT_BUDGET_TOKENS,
+        hard_cap_tokens: Optional[int] = DEFAULT_HARD_CAP_TOKENS,
+    ) -> None:
+        """
+        Initialize the compactor.
+
+        Args:
+            max_tool_message_tokens: Largest tool output kept verbatim
+            context_budget_tokens: Target size of the messages of a model call
+            hard_cap_tokens: Maximum tokens sent over a run; None disables it
+        """
+        self.max_tool_message_tokens = max_tool_message_tokens
+        self.context_budget_tokens = context_budget_tokens
+        self.hard_cap_tokens = hard_cap_tokens
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Dict[str, Any]]
+    ) -> Optional["MessageCompactor"]:
+        """
+        Build a compactor from its configuration.
+
+        Args:
+            config: Compaction settings; None uses the defaults
+
+        Returns:
+            MessageCompactor instance, or None when compaction is disabled
+        """
+        config = config or {}
+        if not config.get("enabled", True):
+            return None
+        return cls(
+            max_tool_message_tokens=config.get(
+                "max_tool_message_tokens", DEFAULT_MAX_TOOL_MESSAGE_TOKENS
+            ),
+            context_budget_tokens=config.get(
+                "context_budget_tokens", DEFAULT_CONTEXT_BUDGET_TOKENS
+            ),
+            hard_cap_tokens=config.get("hard_cap_tokens", DEFAULT_HARD_CAP_TOKENS),
+        )
+
+    def compact(self, messages: Sequence[BaseMessage]) -> Tuple[List[BaseMessage], int]:
+        """
+        Compact a message history to fit the budget.
+
+        Args:
+            messages: Full message history
+
+        Returns:
+            Tuple of the compacted messages and the estimated tokens saved
+        """
+        compacted = list(messages)
+        sizes = [estimate_tokens(message) for message in compacted]
+        original = sum(sizes)
+
+        for i, message in enumerate(compacted):
+            if isinstance(message, ToolMessage) and (
+                sizes[i] > self.max_tool_message_tokens
+            ):
+                compacted[i] = self._truncate(message, sizes[i])
+                sizes[i] = estimate_tokens(compacted[i])
+
+        # Outputs after the last model call are what the model must read next
+        last_ai = max(
+            (i for i, m in enumerate(compacted) if isinstance(m, AIMessage)),
+            default=-1,
+        )
+        for i, message in enumerate(compacted[:last_ai]):
+            if sum(sizes) <= self.context_budget_tokens:
+                break
+            if isinstance(message, ToolMessage):
+                compacted[i] = message.model_copy(
+                    update={
+                        "content": f"[Output of {message.name or 'tool'} omitted to "
+                        f"fit the context budget: ~{sizes[i]} tokens]"
+                    }
+                )
+                sizes[i] = estimate_tokens(compacted[i])
+
+        return compacted, original - sum(sizes)
+
+    def _truncate(self, message: ToolMessage, tokens: int) -> ToolMessage:
+        """Keep the beginning of a large tool output"""
+        keep = self.max_tool_message_tokens * CHARS_PER_TOKEN
+        omitted = tokens - self.max_tool_message_tokens
+        text = message_text(message)
+        return message.model_copy(
+            update={
+                "content": f"{text[:keep]}\n... [truncated ~{omitted} tokens of "
+                "tool output]"
+            }
+        )
+
+    def pre_model_hook(
+        self, state: Dict[str, Any], config: RunnableConfig
+    ) -> Dict[str, Any]:
+        """
+        Compact the messages of the next model call and enforce the hard cap.
+
+        Args:
+            state: ReAct agent state
+            config: Run configuration, optionally holding the run's TokenUsage
+
+        Returns:
+            ``llm_input_messages`` update; the state history is left untouched
+
+        Raises:
+            TokenBudgetExceeded: If the call would exceed the hard cap
+        """
+        messages, saved = self.compact(state["messages"])
+        tokens = sum(estimate_tokens(message) for message in messages)
+
+        usage = (config.get("configurable") or {}).get(TOKEN_USAGE_KEY)
+        if usage is not None:
+            if (
+                self.hard_cap_tokens is not None
+                and usage.tokens_sent + tokens > self.hard_cap_tokens
+            ):
+                raise TokenBudgetExceeded(
+                    f"Next model call would send {tokens} tokens after "
+                    f"{usage.tokens_sent} already sent "
+                    f"(hard cap {self.hard_cap_tokens})"
+                )
+            usage.model_calls += 1
+            usage.tokens_sent += tokens
+            usage.tokens_saved += saved
+
+        if saved:
+            logger.debug(f"Compacted ReAct context: ~{saved} tokens saved")
+        return {"llm_input_messages": messages}
@@ -1,9 +1,31 @@
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, TypeVar, Generic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+)
 
 from langchain_mcp_adapters.client import MultiServerMCPClient  # type: ignore
 
+from cartai.agents.base.tool_cache import (
+    ToolCachePolicy,
+    ToolResultCache,
+    default_tool_cache,
+)
+from cartai.agents.base.tool_filter import ToolFilter, ToolFilterReport
+from cartai.orchestration.runtime.execution import with_deadline
+from cartai.utils.disk_cache import stable_hash
+
 logger = logging.getLogger(__name__)
 
 StateT = TypeVar("StateT", bound=Dict[str, Any])
@@ -19,43 +41,108 @@ class MCPAwareAgent(ABC, Generic[StateT]):
     - Common agent patterns
     """
 
+    # State fields the agent reads; used to key memoized node results
+    input_fields: Tuple[str, ...] = ()
+
+    # Seconds before the cached tool list is checked against the MCP servers
+    # again; None caches it for the lifetime of the agent
+    tools_ttl_seconds: Optional[float] = 300.0
+
     def __init__(
-        self, mcp_client: Optional[MultiServerMCPClient] = None, **kwargs: Any
+        self,
+        mcp_client: Optional[MultiServerMCPClient] = None,
+        tool_filter: ToolFilter | Mapping[str, Any] | List[str] | None = None,
+        tool_cache_policies: Optional[Mapping[str, Any]] = None,
+        tool_cache: Optional[ToolResultCache] = None,
+        node_name: Optional[str] = None,
+        **kwargs: Any,
     ) -> None:
         """
         Initialize MCP-aware agent.
 
         Args:
             mcp_client: Optional MCP client instance
+            tool_filter: Tools to bind, as a ToolFilter or its ``allow``/``deny``
+                config; None binds every tool of the MCP servers
+            tool_cache_policies: ``tool_cache`` config (or ToolCachePolicy) of
+                each MCP server whose idempotent tool results may be cached
+            tool_cache: Cache of tool results; defaults to the process-wide one
+            node_name: Name of the workflow node running the agent; defaults
+                to the class name
             **kwargs: Additional agent-specific parameters
         """
         self.mcp_client = mcp_client
+        self.tool_filter = (
+            tool_filter
+            if isinstance(tool_filter, ToolFilter)
+            else ToolFilter.from_config(tool_filter)
+        )
+        self.tool_filter_report: Optional[ToolFilterReport] = None
+        self.tool_cache_policies: Dict[str, ToolCachePolicy] = {}
+        for server, policy in (tool_cache_policies or {}).items():
+            if not isinstance(policy, ToolCachePolicy):
+                policy = ToolCachePolicy.from_config(policy)
+            if policy is not None:
+                self.tool_cache_policies[server] = policy
+        self.tool_cache = tool_cache or default_tool_cache()
         self.name = self.__class__.__name__
+        self.node_name = node_name or self.name
         self._tools_cache: Optional[List[Dict[str, Any]]] = None
+        self._tools_fetched_at = 0.0
+        self._tools_lock = asyncio.Lock()
+        self._initialized = False
+
+        # Hash of the tool list; changes when the MCP servers change their tools
+        self.tools_version: Optional[str] = None
 
         # Store additional kwargs for agent-specific use
         for key, value in kwargs.items():
             setattr(self, key, value)
 
     async def initialize(self) -> None:
-        """Initialize the agent"""
+        """Initialize the agent once; later calls return immediately"""
+        if self._initialized:
+            return
         logger.info(f"Initializing {self.name}")
+        await self.warmup()
 
+    async def warmup(self) -> None:
+        """Fetch the tool list ahead of the first execution"""
         if self.mcp_client:
             # Test connection by trying to get tools
             try:
-                await self.get_tools()
-                logger.info(f"{self.name} initialized with MCP client")
+                tools = await self.get_tools()
+                logger.info(f"{self.name} warmed up with {len(tools)} MCP tools")
             except Exception as e:
                 logger.warning(f"{self.name} MCP client test failed: {str(e)}")
                 logger.info(f"{self.name} will run in mock mode")
         else:
             logger.info(f"{self.name} initialized without MCP client (mock mode)")
+        self._initialized = True
+
+    def invalidate_tools(self) -> None:
+        """Drop the cached tool list so the next call fetches it again"""
+        self._tools_cache = None
 
-    async def get_tools(self) -> List[Dict[str, Any]]:
+    def _tools_expired(self) -> bool:
+        """Whether the cached tool list is missing or older than its TTL"""
+        if self._tools_cache is None:
+            return True
+        if self.tools_ttl_seconds is None:
+            return False
+        return time.monotonic() - self._tools_fetched_at >= self.tools_ttl_seconds
+
+    async def get_tools(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """
         Get MCP tools for this agent.
 
+        The tool list is cached for ``tools_ttl_seconds``. When it expires it
+        is fetched again; if the MCP servers now expose different tools the
+        ``tools_version`` changes and :meth:`_on_tools_changed` is called.
+
+        Args:
+            refresh: Fetch the tool list even if the cached one is fresh
+
         Returns:
             List of available tools
         """
@@ -63,53 +150,160 @@ class MCPAwareAgent(ABC, Generic[StateT]):
             logger.debug(f"{self.name}: No MCP client available, returning empty tools")
             return []
 
-        try:
-            if self._tools_cache is None:
-                try:
-                    self._tools_cache = await self.mcp_client.get_tools()
-                    logger.debug(
-                        f"{self.name}: Retrieved {len(self._tools_cache)} tools"
+        if not refresh and not self._tools_expired():
+            return self._tools_cache or []
+
+        async with self._tools_lock:
+            # Another caller may have refreshed the tools while we waited
+            if not refresh and not self._tools_expired():
+                return self._tools_cache or []
+            try:
+                await self._fetch_tools()
+            except Exception as e:
+                if self._tools_cache is not None:
+                    logger.warning(
+                        f"{self.name}: Failed to refresh tools, keeping the "
+                        f"previous list: {str(e)}"
                     )
-                except Exception as e:
-                    # Log detailed error information
-                    logger.error(f"{self.name}: Failed to get tools: {str(e)}")
-                    if hasattr(e, "__cause__") and e.__cause__:
-                        logger.error(f"{self.name}:   Caused by: {str(e.__cause__)}")
-                    if hasattr(e, "__context__") and e.__context__:
-                        logger.error(f"{self.name}:   Context: {str(e.__context__)}")
-                    logger.error(f"{self.name}:   Traceback:", exc_info=e)
-
-                    # If it's an ExceptionGroup, log each sub-exception
-                    if isinstance(e, ExceptionGroup):
-                        for i, sub_e in enumerate(e.exceptions, 1):
-                            logger.error(
-                                f"{self.name}: Sub-exception {i}: {str(sub_e)}"
-                            )
-                            if hasattr(sub_e, "__cause__") and sub_e.__cause__:
-                                logger.error(
-                                    f"{self.name}:   Caused by: {str(sub_e.__cause__)}"
-                                )
-                            if hasattr(sub_e, "__context__") and sub_e.__context__:
-                                logger.error(
-                                    f"{self.name}:   Context: {str(sub_e.__context__)}"
-                                )
-                            logger.error(f"{self.name}:   Traceback:", exc_info=sub_e)
-                    raise
-            return self._tools_cache
+                    self._tools_fetched_at = time.monotonic()
+                    return self._tools_cache
+                logger.warning(f"{self.name}: Failed to get tools: {str(e)}")
+                return []
+        return self._tools_cache or []
+
+    async def _fetch_tools(self) -> None:
+        """Fetch the tool list from the MCP client and update its version"""
+        assert self.mcp_client is not None
+        try:
+            if self.tool_cache_policies:
+                tools = await with_deadline(self._get_tools_per_server())
+            else:
+                tools = await with_deadline(self.mcp_client.get_tools())
         except Exception as e:
-            logger.warning(f"{self.name}: Failed to get tools: {str(e)}")
-            return []
+            # Log detailed error information
+            logger.error(f"{self.name}: Failed to get tools: {str(e)}")
+            if hasattr(e, "__cause__") and e.__cause__:
+                logger.error(f"{self.name}:   Caused by: {str(e.__cause__)}")
+            if hasattr(e, "__context__") and e.__context__:
+                logger.error(f"{self.name}:   Context: {str(e.__context__)}")
+            logger.error(f"{self.name}:   Traceback:", exc_info=e)
+
+            # If it's an ExceptionGroup, log each sub-exception
+            if isinstance(e, ExceptionGroup):
+                for i, sub_e in enumerate(e.exceptions, 1):
+                    logger.error(f"{self.name}: Sub-exception {i}: {str(sub_e)}")
+                    if hasattr(sub_e, "__cause__") and sub_e.__cause__:
+                        logger.error(
+                            f"{self.name}:   Caused by: {str(sub_e.__cause__)}"
+                        )
+                    if hasattr(sub_e, "__context__") and sub_e.__context__:
+                        logger.error(
+                            f"{self.name}:   Context: {str(sub_e.__context__)}"
+                        )
+                    logger.error(f"{self.name}:   Traceback:", exc_info=sub_e)
+            raise
+
+        if self.tool_filter is not None:
+            tools, report = self.tool_filter.apply(tools)
+            self.tool_filter_report = report
+            logger.info(
+                f"{self.name}: Bound {report.tools_bound} of {report.tools_total} "
+                f"tools, ~{report.schema_tokens_saved} schema tokens saved per LLM call"
+            )
+
+        version = self._tools_hash(tools)
+        self._tools_fetched_at = time.monotonic()
+        if self._tools_cache is not None and version == self.tools_version:
+            # Keep the bound tools so agents built on them stay valid
+            logger.debug(f"{self.name}: Tool list unchanged")
+            return
+
+        if self.tools_version is not None:
+            logger.info(f"{self.name}: MCP tool list changed, refreshing tools")
+        self._tools_cache = self._cache_results(self._bind_deadline(tools))
+        self.tools_version = version
+        self._on_tools_changed()
+        logger.debug(f"{self.name}: Retrieved {len(self._tools_cache)} tools")
+
+    async def _get_tools_per_server(self) -> List[Any]:
+        """Fetch the tools of every MCP server, tagging each with its server"""
+        assert self.mcp_client is not None
+        servers = list(self.mcp_client.connections)
+        results = await asyncio.gather(
+            *(self.mcp_client.get_tools(server_name=server) for server in servers)
+        )
+        tools = []
+        for server, server_tools in zip(servers, results):
+            for tool in server_tools:
+                tool.metadata = {**(tool.metadata or {}), "mcp_server": server}
+                tools.append(tool)
+        return tools
+
+    def _cache_results(self, tools: List[Any]) -> List[Any]:
+        """Route calls of idempotent tools through the shared result cache"""
+        if not self.tool_cache_policies or self.mcp_client is None:
+            return tools
+        for tool in tools:
+            server = (getattr(tool, "metadata", None) or {}).get("mcp_server")
+            policy = self.tool_cache_policies.get(server) if server else None
+            if policy is not None:
+                # Same server for agents with separate clients: same connection
+                connection = self.mcp_client.connections.get(server)
+                self.tool_cache.wrap(tool, [server, connection], policy)
+        return tools
+
+    @staticmethod
+    def _tools_hash(tools: List[Any]) -> str:
+        """Version of a tool list: hash of the tool names, descriptions and schemas"""
+        return stable_hash(
+            [
+                [
+                    getattr(tool, "name", ""),
+                    getattr(tool, "description", ""),
+                    getattr(tool, "args", {}),
+                ]
+                for tool in tools
+            ]
+        )
+
+    def _on_tools_changed(self) -> None:
+        """Hook called when a new tool list is cached; drop state built on tools"""
+
+    def _bind_deadline(self, tools: List[Any]) -> List[Any]:
+        """
+        Bound every MCP tool call by the deadline of the running workflow.
+
+        Args:
+            tools: Tools returned by the MCP client
+
+        Returns:
+            The same tools, with their coroutines wrapped
+        """
+        for tool in tools:
+            coroutine = getattr(tool, "coroutine", None)
+            if coroutine is not None:
+                tool.coroutine = self._deadline_bound(coroutine)
+        return tools
+
+    @staticmethod
+    def _deadline_bound(coroutine: Callable[..., Awaitable[Any]]) -> Callable:
+        """Wrap a tool coroutine so it cannot outlive the workflow deadline"""
+
+        async def call_tool(*args: Any, **kwargs: Any) -> Any:
+            return await with_deadline(coroutine(*args, **kwargs))
+
+        return call_tool
 
     @abstractmethod
-    async def run(self, state: StateT) -> StateT:
+    async def run(self, state: Mapping[str, Any]) -> Dict[str, Any]:
         """
         Execute the agent's main logic.
 
         Args:
-            state: Current state/context for the agent
+            state: Current state/context for the agent (read-only view)
 
         Returns:
-            Updated state after agent execution
+            State updates: only the keys changed by the agent
         """
         pass
 
@@ -119,5 +313,9 @@ class MCPAwareAgent(ABC, Generic[StateT]):
             "name": self.name,
             "type": "mcp_aware",
             "has_mcp_client": bool(self.mcp_client),
+            "tools_version": self.tools_version,
+            "tool_filter": (
+                self.tool_filter_report.to_dict() if self.tool_filter_report else None
+            ),
             "description": self.__doc__ or "No description available",
         }
@@ -0,0 +1,207 @@
+"""Shared cache of idempotent MCP tool call results"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional, Sequence, Tuple
+
+from cartai.utils.disk_cache import stable_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TOOL_CACHE_TTL_SECONDS = 60.0
+DEFAULT_MAX_ENTRIES = 1024
+
+
+class ToolCachePolicy:
+    """
+    Which tools of an MCP server are idempotent, and for how long their
+    results stay valid. Configured per MCP in ``mcp_configs.yaml``:
+
+        tool_cache:
+          ttl_seconds: 60
+          idempotent: ["list_*", "get_*"]
+    """
+
+    def __init__(
+        self,
+        idempotent: Sequence[str],
+        ttl_seconds: float = DEFAULT_TOOL_CACHE_TTL_SECONDS,
+    ) -> None:
+        """
+        Initialize the policy.
+
+        Args:
+            idempotent: Glob patterns of the read-only tools
+            ttl_seconds: Time-to-live of cached results
+        """
+        self.idempotent = tuple(idempotent)
+        self.ttl_seconds = ttl_seconds
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ToolCachePolicy"]:
+        """
+        Build a policy from the ``tool_cache`` block of an MCP config.
+
+        Args:
+            config: Configuration dict, or a falsy value
+
+        Returns:
+            ToolCachePolicy instance, or None when no tool is cacheable
+        """
+        if not config or not config.get("enabled", True):
+            return None
+        idempotent = config.get("idempotent") or []
+        if not idempotent:
+            return None
+        return cls(
+            idempotent=idempotent,
+            ttl_seconds=config.get("ttl_seconds", DEFAULT_TOOL_CACHE_TTL_SECONDS),
+        )
+
+    def is_idempotent(self, tool_name: str) -> bool:
+        """Whether results of a tool may be cached"""
+        return any(fnmatchcase(tool_name, pattern) for pattern in self.idempotent)
+
+
+class ToolResultCache:
+    """
+    In-memory cache of tool results, shared by every agent of the process.
+
+    Results are keyed on the MCP server connection, the tool name and its
+    arguments, so agents with separate MCP clients to the same server share
+    entries. Concurrent identical calls are coalesced: the first one runs,
+    the others await its result. Failed calls are never cached.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of results kept (least recently used
+                are evicted first)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, Tuple[float, Any]] = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    @staticmethod
+    def key_for(server: Any, tool_name: str, arguments: Mapping[str, Any]) -> str:
+        """
+        Compute the cache key of a tool call.
+
+        Args:
+            server: Identity of the MCP server (e.g. its connection config)
+            tool_name: Name of the tool
+            arguments: Tool call arguments
+
+        Returns:
+            Cache key
+        """
+        return stable_hash([server, tool_name, dict(arguments)])
+
+    async def call(
+        self,
+        key: str,
+        factory: Callable[[], Awaitable[Any]],
+        ttl_seconds: float = DEFAULT_TOOL_CACHE_TTL_SECONDS,
+    ) -> Any:
+        """
+        Get the result of a call from the cache, or run it once.
+
+        Args:
+            key: Cache key of the call
+            factory: Function performing the call
+            ttl_seconds: Time-to-live of the result
+
+        Returns:
+            The result of the call
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, result = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self.coalesced += 1
+            # Shielded: a cancelled caller must not cancel the shared call
+            return await asyncio.shield(inflight)
+
+        self.misses += 1
+        task = asyncio.ensure_future(factory())
+        self._inflight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, done, ttl_seconds))
+        return await asyncio.shield(task)
+
+    def _settle(self, key: str, task: asyncio.Future, ttl_seconds: float) -> None:
+        """Store the result of a finished call and release its waiters"""
+        self._inflight.pop(key, None)
+        if task.cancelled():
+            return
+        if task.exception() is not None:
+            # Retrieved here so an error without waiters is not reported twice
+            return
+        self._entries[key] = (time.monotonic() + ttl_seconds, task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def wrap(self, tool: Any, server: Any, policy: ToolCachePolicy) -> Any:
+        """
+        Route the calls of an idempotent tool through the cache.
+
+        Args:
+            tool: LangChain tool with an async ``coroutine``
+            server: Identity of the MCP server of the tool
+            policy: Caching policy of the server
+
+        Returns:
+            The same tool, wrapped if it is idempotent
+        """
+        coroutine = getattr(tool, "coroutine", None)
+        if coroutine is None or not policy.is_idempotent(tool.name):
+            return tool
+
+        async def call_tool(**arguments: Any) -> Any:
+            key = self.key_for(server, tool.name, arguments)
+            return await self.call(
+                key, lambda: coroutine(**arguments), policy.ttl_seconds
+            )
+
+        tool.coroutine = call_tool
+        return tool
+
+    def clear(self) -> None:
+        """Drop every cached result"""
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        """Get usage statistics of the cache"""
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_cache = ToolResultCache()
+
+
+def default_tool_cache() -> ToolResultCache:
+    """Get the process-wide tool result cache shared by agents by default"""
+    return _default_cache
@@ -0,0 +1,128 @@
+"""Per-agent selection of the MCP tools bound to the LLM"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token in characters of JSON schema
+CHARS_PER_TOKEN = 4
+
+
+def estimate_schema_tokens(tool: Any) -> int:
+    """
+    Estimate the prompt tokens taken by a tool definition.
+
+    Args:
+        tool: LangChain tool
+
+    Returns:
+        Approximate number of tokens of its OpenAI function schema
+    """
+    try:
+        schema = json.dumps(convert_to_openai_tool(tool), default=str)
+    except Exception:
+        schema = f"{getattr(tool, 'name', '')} {getattr(tool, 'description', '')}"
+    return len(schema) // CHARS_PER_TOKEN
+
+
+@dataclass
+class ToolFilterReport:
+    """Tools kept and dropped by a filter, with the schema tokens saved"""
+
+    tools_total: int = 0
+    tools_bound: int = 0
+    dropped: List[str] = field(default_factory=list)
+    schema_tokens_bound: int = 0
+    schema_tokens_saved: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a plain dictionary"""
+        return asdict(self)
+
+
+class ToolFilter:
+    """
+    Allow and deny lists of tool names, with glob patterns.
+
+    A tool is kept when it matches an ``allow`` pattern (or there is no allow
+    list) and matches no ``deny`` pattern. Configured per agent in the
+    workflow YAML:
+
+        tools:
+          allow: ["mlflow_*", "API-post-page"]
+          deny: ["*delete*"]
+    """
+
+    def __init__(
+        self,
+        allow: Optional[Sequence[str]] = None,
+        deny: Optional[Sequence[str]] = None,
+    ) -> None:
+        """
+        Initialize the filter.
+
+        Args:
+            allow: Patterns of the tools to keep; None keeps every tool
+            deny: Patterns of the tools to drop, applied after ``allow``
+        """
+        self.allow = tuple(allow) if allow is not None else None
+        self.deny = tuple(deny or ())
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ToolFilter"]:
+        """
+        Build a filter from the ``tools`` block of an agent config.
+
+        Args:
+            config: Dict with ``allow``/``deny`` lists, or a list of allowed
+                patterns
+
+        Returns:
+            ToolFilter instance, or None when no filter is configured
+        """
+        if not config:
+            return None
+        if isinstance(config, (list, tuple)):
+            return cls(allow=config)
+        return cls(allow=config.get("allow"), deny=config.get("deny"))
+
+    def matches(self, name: str) -> bool:
+        """Whether a tool name passes the filter"""
+        if self.allow is not None and not any(
+            fnmatchcase(name, pattern) for pattern in self.allow
+        ):
+            return False
+        return not any(fnmatchcase(name, pattern) for pattern in self.deny)
+
+    def apply(self, tools: Sequence[Any]) -> Tuple[List[Any], ToolFilterReport]:
+        """
+        Select the tools passing the filter.
+
+        Args:
+            tools: Tools returned by the MCP client
+
+        Returns:
+            Tuple of the kept tools and the report of what was dropped
+        """
+        kept: List[Any] = []
+        report = ToolFilterReport(tools_total=len(tools))
+        for tool in tools:
+            name = getattr(tool, "name", "")
+            tokens = estimate_schema_tokens(tool)
+            if self.matches(name):
+                kept.append(tool)
+                report.schema_tokens_bound += tokens
+            else:
+                report.dropped.append(name)
+                report.schema_tokens_saved += tokens
+        report.tools_bound = len(kept)
+
+        if self.allow is not None and not kept and tools:
+            logger.warning("Tool filter matched none of the available tools")
+        return kept, report
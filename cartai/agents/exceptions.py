@@ -0,0 +1,15 @@
+"""
+Agent-specific exceptions
+"""
+
+
+class AgentError(Exception):
+    """Base exception for agent-related errors"""
+
+    pass
+
+
+class TokenBudgetExceeded(AgentError):
+    """Raised when a ReAct loop would send more tokens than its hard cap"""
+
+    pass
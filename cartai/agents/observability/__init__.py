@@ -1,5 +1,6 @@
 """Observability agents for monitoring, metrics, and alerting"""
 
 from .monitoring_agent import MonitoringAgent
+from .scheduler import MonitoringScheduler
 
-__all__ = ["MonitoringAgent"]
+__all__ = ["MonitoringAgent", "MonitoringScheduler"]
@@ -0,0 +1,162 @@
+"""Alert deduplication and cooldown for monitoring cycles"""
+
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from cartai.utils.disk_cache import stable_hash
+
+logger = logging.getLogger(__name__)
+
+AlertKey = Tuple[str, str, str]
+
+
+@dataclass
+class Alert:
+    """An alert raised for a metric of an experiment"""
+
+    experiment_id: str
+    metric: str
+    alert_type: str
+    severity: str
+    message: str
+    value: Optional[float] = None
+    threshold: Optional[float] = None
+    fingerprint: str = ""
+    first_seen: float = 0.0
+    last_emitted: float = 0.0
+    occurrences: int = 1
+
+    @property
+    def key(self) -> AlertKey:
+        """Identity of the incident the alert belongs to"""
+        return (self.experiment_id, self.metric, self.alert_type)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the alert to a plain dictionary"""
+        return asdict(self)
+
+
+class AlertStore:
+    """
+    Open alerts keyed by (experiment, metric, alert type).
+
+    An alert is emitted when its incident is new, when its fingerprint
+    (severity and threshold) changes, or when the cooldown since it was last
+    emitted has passed. Repeats within the cooldown are
+    suppressed, so downstream actions scale with incidents rather than with
+    the monitoring frequency. Lookups are single dictionary accesses.
+    """
+
+    def __init__(self, cooldown_seconds: float = 1800.0) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            cooldown_seconds: Minimum time between two emissions of the same alert
+        """
+        self.cooldown_seconds = cooldown_seconds
+        self._open: Dict[AlertKey, Alert] = {}
+        self.emitted = 0
+        self.suppressed = 0
+
+    @staticmethod
+    def fingerprint(
+        key: AlertKey, severity: str, threshold: Optional[float] = None
+    ) -> str:
+        """Fingerprint of an alert; the observed value is deliberately left out"""
+        return stable_hash([*key, severity, threshold])[:16]
+
+    def submit(
+        self,
+        experiment_id: str,
+        metric: str,
+        alert_type: str,
+        message: str,
+        severity: str = "warning",
+        value: Optional[float] = None,
+        threshold: Optional[float] = None,
+        now: Optional[float] = None,
+    ) -> Optional[Alert]:
+        """
+        Submit an alert observed in the current cycle.
+
+        Args:
+            experiment_id: Experiment the alert is about
+            metric: Metric that triggered the alert
+            alert_type: Kind of check that fired (e.g. "latency", "psi")
+            message: Human readable description
+            severity: Alert severity
+            value: Observed value
+            threshold: Threshold that was crossed
+            now: Current time (defaults to now)
+
+        Returns:
+            The alert if it should be emitted, None if it is suppressed
+        """
+        now = time.time() if now is None else now
+        key = (experiment_id, metric, alert_type)
+        fingerprint = self.fingerprint(key, severity, threshold)
+
+        alert = self._open.get(key)
+        if alert is None:
+            alert = self._open[key] = Alert(
+                experiment_id=experiment_id,
+                metric=metric,
+                alert_type=alert_type,
+                severity=severity,
+                message=message,
+                value=value,
+                threshold=threshold,
+                fingerprint=fingerprint,
+                first_seen=now,
+            )
+        else:
+            alert.occurrences += 1
+            alert.value = value
+            alert.message = message
+            if (
+                alert.fingerprint == fingerprint
+                and now - alert.last_emitted < self.cooldown_seconds
+            ):
+                self.suppressed += 1
+                logger.debug(f"Suppressed repeated alert {key}")
+                return None
+            alert.fingerprint = fingerprint
+            alert.severity = severity
+            alert.threshold = threshold
+
+        alert.last_emitted = now
+        self.emitted += 1
+        return alert
+
+    def resolve(self, experiment_id: str, active: Iterable[AlertKey]) -> List[Alert]:
+        """
+        Close the open alerts of an experiment that no longer fire.
+
+        A recurrence after resolution is a new incident and is emitted again.
+
+        Args:
+            experiment_id: Experiment checked in the current cycle
+            active: Keys of the alerts that fired in the current cycle
+
+        Returns:
+            Alerts that were closed
+        """
+        active = set(active)
+        resolved = [
+            key for key in self._open if key[0] == experiment_id and key not in active
+        ]
+        return [self._open.pop(key) for key in resolved]
+
+    def get(self, key: AlertKey) -> Optional[Alert]:
+        """Get the open alert of an incident"""
+        return self._open.get(key)
+
+    def open_alerts(self) -> List[Alert]:
+        """All alerts that are currently open"""
+        return list(self._open.values())
+
+    def __len__(self) -> int:
+        return len(self._open)
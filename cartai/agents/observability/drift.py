@@ -0,0 +1,315 @@
+"""
+Vectorized drift and anomaly detection on metric histories.
+
+Metric histories are batched into a (runs x metrics) matrix, oldest run first,
+with NaN where a run did not log a metric. Every statistic is computed for all
+metrics at once; the most recent ``window`` runs are compared against the
+runs before them.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from cartai.agents.observability.metrics_summary import numeric_metrics
+
+logger = logging.getLogger(__name__)
+
+# PSI above 0.25 is the usual "significant shift"; slightly higher here because
+# a monitoring window only holds a handful of runs
+DEFAULT_THRESHOLDS = {
+    "psi": 0.3,
+    "ks": 0.5,
+    "zscore": 3.0,
+    "ewma": 3.0,
+}
+DEFAULT_WINDOW = 10
+DEFAULT_BINS = 10
+DEFAULT_EWMA_ALPHA = 0.3
+MIN_REFERENCE_RUNS = 5
+# Expected number of current runs per PSI bin; fewer bins are used for small windows
+MIN_RUNS_PER_BIN = 5
+
+# Smallest bin proportion used by PSI, avoids log(0)
+_EPSILON = 1e-4
+
+
+def runs_to_matrix(runs: Sequence[Mapping[str, Any]]) -> Tuple[List[str], np.ndarray]:
+    """
+    Batch the metrics of MLflow runs into a matrix.
+
+    Args:
+        runs: Runs as returned by ``list_runs``, newest first
+
+    Returns:
+        (metric names, matrix of shape (runs, metrics)) with the oldest run first
+    """
+    run_metrics = [numeric_metrics(run) for run in reversed(runs)]
+    names = sorted({name for metrics in run_metrics for name in metrics})
+    columns = {name: j for j, name in enumerate(names)}
+
+    matrix = np.full((len(run_metrics), len(names)), np.nan)
+    for i, metrics in enumerate(run_metrics):
+        for name, value in metrics.items():
+            matrix[i, columns[name]] = value
+    return names, matrix
+
+
+def psi(
+    reference: np.ndarray,
+    current: np.ndarray,
+    bins: int = DEFAULT_BINS,
+    debias: bool = False,
+) -> np.ndarray:
+    """
+    Population Stability Index of each column.
+
+    Bins are the quantiles of the reference column, so each holds roughly the
+    same share of reference values.
+
+    Args:
+        reference: Reference matrix (n_ref, metrics)
+        current: Current matrix (n_cur, metrics)
+        bins: Number of quantile bins
+        debias: Subtract the PSI expected from sampling noise alone,
+            ``(bins - 1) * (1 / n_ref + 1 / n_cur)``, which dominates on the
+            few dozen runs an experiment usually has
+
+    Returns:
+        PSI per metric (NaN where a side has no values)
+    """
+    quantiles = np.linspace(0, 1, bins + 1)[1:-1]
+    edges = _quantiles(reference, quantiles)  # (bins - 1, metrics)
+
+    def proportions(values: np.ndarray) -> np.ndarray:
+        valid = ~np.isnan(values)
+        index = np.zeros(values.shape, dtype=np.intp)
+        for edge in edges:
+            index += values > edge
+        # One bincount over all columns: bin b of metric j lands at j * bins + b
+        flat = (index + bins * np.arange(values.shape[1]))[valid]
+        counts = np.bincount(flat, minlength=bins * values.shape[1])
+        counts = counts.reshape(values.shape[1], bins).T  # (bins, metrics)
+        totals = valid.sum(axis=0)
+        with np.errstate(all="ignore"):
+            return np.maximum(counts / totals, _EPSILON)
+
+    expected = proportions(reference)
+    actual = proportions(current)
+    values = ((actual - expected) * np.log(actual / expected)).sum(axis=0)
+    if debias:
+        with np.errstate(all="ignore"):
+            noise = (bins - 1) * (
+                1 / (~np.isnan(reference)).sum(axis=0)
+                + 1 / (~np.isnan(current)).sum(axis=0)
+            )
+        values = np.maximum(values - noise, 0.0)
+    return values
+
+
+def ks_statistic(reference: np.ndarray, current: np.ndarray) -> np.ndarray:
+    """
+    Two-sample Kolmogorov-Smirnov statistic of each column.
+
+    Both samples are sorted once for all columns; the statistic is the largest
+    gap between the two empirical CDFs evaluated at every observed value.
+
+    Args:
+        reference: Reference matrix (n_ref, metrics)
+        current: Current matrix (n_cur, metrics)
+
+    Returns:
+        KS statistic per metric in [0, 1] (NaN where a side has no values)
+    """
+    ref_sorted, ref_counts = _sorted_columns(reference)
+    cur_sorted, cur_counts = _sorted_columns(current)
+
+    statistic = np.full(reference.shape[1], np.nan)
+    for j in np.flatnonzero((ref_counts > 0) & (cur_counts > 0)):
+        ref = ref_sorted[: ref_counts[j], j]
+        cur = cur_sorted[: cur_counts[j], j]
+        points = np.concatenate([ref, cur])
+        cdf_ref = np.searchsorted(ref, points, side="right") / ref.size
+        cdf_cur = np.searchsorted(cur, points, side="right") / cur.size
+        statistic[j] = np.abs(cdf_ref - cdf_cur).max()
+    return statistic
+
+
+def _sorted_columns(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Sort each column (NaN last) and count its non-NaN values"""
+    return np.sort(matrix, axis=0), (~np.isnan(matrix)).sum(axis=0)
+
+
+def _quantiles(matrix: np.ndarray, quantiles: np.ndarray) -> np.ndarray:
+    """
+    Linearly interpolated quantiles of each column, ignoring NaN.
+
+    Equivalent to ``np.nanquantile(matrix, quantiles, axis=0)`` without its
+    per-column Python loop.
+    """
+    ordered, counts = _sorted_columns(matrix)
+    position = quantiles[:, None] * np.maximum(counts - 1, 0)
+    lower = np.floor(position).astype(np.intp)
+    upper = np.ceil(position).astype(np.intp)
+    fraction = position - lower
+    values = np.take_along_axis(ordered, lower, axis=0) * (1 - fraction)
+    values += np.take_along_axis(ordered, upper, axis=0) * fraction
+    return np.where(counts > 0, values, np.nan)
+
+
+def zscore(reference: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Z-score of values against the reference mean and standard deviation.
+
+    Args:
+        reference: Reference matrix (n_ref, metrics)
+        values: Values to score, one per metric
+
+    Returns:
+        Z-score per metric (0 where the reference is constant and matches)
+    """
+    with np.errstate(all="ignore"):
+        mean = np.nanmean(reference, axis=0)
+        std = np.nanstd(reference, axis=0)
+        deviation = values - mean
+        return np.where(
+            std > 0, deviation / std, np.where(deviation == 0, 0.0, np.inf * deviation)
+        )
+
+
+def ewma(matrix: np.ndarray, alpha: float = DEFAULT_EWMA_ALPHA) -> np.ndarray:
+    """
+    Exponentially weighted moving average of each column, skipping NaN.
+
+    Args:
+        matrix: Matrix (runs, metrics), oldest run first
+        alpha: Smoothing factor in (0, 1]
+
+    Returns:
+        Final EWMA per metric (NaN for columns without values)
+    """
+    # Closed form of s = alpha * x + (1 - alpha) * s, seeded with the first
+    # value: a value followed by k others weighs alpha * (1 - alpha) ** k, the
+    # seed (1 - alpha) ** k.
+    valid = ~np.isnan(matrix)
+    later = np.cumsum(valid[::-1], axis=0)[::-1] - valid
+    first = valid & (np.cumsum(valid, axis=0) == 1)
+    with np.errstate(all="ignore"):
+        decay = np.where(later == 0, 1.0, np.exp(later * np.log1p(-alpha)))
+    weights = np.where(first, 1.0, alpha) * decay
+    weights = np.where(valid, weights, 0.0)
+    smoothed = (weights * np.nan_to_num(matrix)).sum(axis=0)
+    return np.where(valid.any(axis=0), smoothed, np.nan)
+
+
+@dataclass
+class DriftReport:
+    """Drift statistics of every metric and the alerts they raised"""
+
+    metrics: List[str]
+    psi: np.ndarray
+    ks: np.ndarray
+    zscore: np.ndarray
+    ewma_zscore: np.ndarray
+    alerts: List[Dict[str, Any]] = field(default_factory=list)
+
+    @property
+    def drift_detected(self) -> bool:
+        """Whether any metric crossed a drift threshold"""
+        return bool(self.alerts)
+
+    @property
+    def drift_score(self) -> float:
+        """Highest PSI across metrics (0 if not computable)"""
+        if not self.metrics or np.all(np.isnan(self.psi)):
+            return 0.0
+        return round(float(np.nanmax(self.psi)), 6)
+
+    def to_state(self) -> Dict[str, Any]:
+        """State updates for the ``MLPipelineState`` drift fields"""
+        return {
+            "drift_detected": self.drift_detected,
+            "drift_score": self.drift_score,
+            "drift_alerts": self.alerts,
+        }
+
+
+def detect_drift(
+    metrics: List[str],
+    matrix: np.ndarray,
+    window: int = DEFAULT_WINDOW,
+    thresholds: Optional[Mapping[str, float]] = None,
+    bins: int = DEFAULT_BINS,
+    alpha: float = DEFAULT_EWMA_ALPHA,
+) -> Optional[DriftReport]:
+    """
+    Compare the latest runs of every metric against the runs before them.
+
+    Args:
+        metrics: Metric names, one per matrix column
+        matrix: Matrix (runs, metrics), oldest run first
+        window: Number of most recent runs forming the current sample
+        thresholds: Alert thresholds for "psi", "ks", "zscore" and "ewma"
+        bins: Number of PSI bins
+        alpha: EWMA smoothing factor
+
+    Returns:
+        DriftReport, or None if there are too few runs for a reference
+    """
+    thresholds = {**DEFAULT_THRESHOLDS, **(thresholds or {})}
+    window = min(window, len(matrix) // 2)
+    if window < 1 or len(matrix) - window < MIN_REFERENCE_RUNS:
+        return None
+
+    reference, current = matrix[:-window], matrix[-window:]
+    bins = max(2, min(bins, window // MIN_RUNS_PER_BIN))
+
+    # Latest value of each metric within the current window
+    latest_index = np.where(~np.isnan(current), np.arange(window)[:, None], -1).max(
+        axis=0
+    )
+    latest = np.where(
+        latest_index >= 0,
+        current[np.maximum(latest_index, 0), np.arange(len(metrics))],
+        np.nan,
+    )
+
+    with np.errstate(all="ignore"):
+        ewma_std = np.nanstd(reference, axis=0) * np.sqrt(alpha / (2 - alpha))
+        ewma_deviation = ewma(matrix, alpha) - np.nanmean(reference, axis=0)
+        ewma_z = np.where(ewma_std > 0, ewma_deviation / ewma_std, 0.0)
+
+    report = DriftReport(
+        metrics=metrics,
+        psi=psi(reference, current, bins, debias=True),
+        ks=ks_statistic(reference, current),
+        zscore=zscore(reference, latest),
+        ewma_zscore=ewma_z,
+    )
+
+    for alert_type, values in (
+        ("psi", report.psi),
+        ("ks", report.ks),
+        ("zscore", report.zscore),
+        ("ewma", report.ewma_zscore),
+    ):
+        threshold = thresholds[alert_type]
+        with np.errstate(invalid="ignore"):
+            breached = np.abs(values) > threshold
+        for j in np.flatnonzero(breached):
+            report.alerts.append(
+                {
+                    "metric": metrics[j],
+                    "type": alert_type,
+                    "value": round(float(values[j]), 6),
+                    "threshold": threshold,
+                }
+            )
+
+    if report.alerts:
+        logger.info(
+            f"Drift detected on {len({a['metric'] for a in report.alerts})} metrics"
+        )
+    return report
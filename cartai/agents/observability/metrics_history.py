@@ -0,0 +1,371 @@
+"""
+Bounded, persistent history of experiment metrics.
+
+Each (experiment, metric) pair is stored as a fixed-capacity NumPy ring buffer
+of timestamps and values, so memory stays bounded in long-lived processes and
+rolling baselines are cheap vectorized reductions. Points are optionally
+persisted to SQLite and reloaded on start.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CAPACITY = 1000
+DEFAULT_HISTORY_DIR = Path(".cartai/monitoring")
+
+
+class MetricSeries:
+    """Fixed-capacity ring buffer of (timestamp, value) points"""
+
+    __slots__ = ("capacity", "_timestamps", "_values", "_start", "_size")
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initialize the series.
+
+        Args:
+            capacity: Maximum number of points kept; the oldest are overwritten
+        """
+        self.capacity = capacity
+        self._timestamps = np.empty(capacity, dtype=np.float64)
+        self._values = np.empty(capacity, dtype=np.float64)
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, value: float) -> None:
+        """Append a point, overwriting the oldest one when full"""
+        index = (self._start + self._size) % self.capacity
+        self._timestamps[index] = timestamp
+        self._values[index] = value
+        if self._size < self.capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self.capacity
+
+    def _order(self) -> np.ndarray:
+        """Buffer indices in chronological order"""
+        return (self._start + np.arange(self._size)) % self.capacity
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Timestamps of the points, oldest first"""
+        return self._timestamps[self._order()]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Values of the points, oldest first"""
+        return self._values[self._order()]
+
+    def prune(self, cutoff: float) -> int:
+        """
+        Drop points older than a timestamp.
+
+        Args:
+            cutoff: Points with a timestamp below this are dropped
+
+        Returns:
+            Number of dropped points
+        """
+        dropped = int(np.searchsorted(self.timestamps, cutoff, side="left"))
+        self._start = (self._start + dropped) % self.capacity
+        self._size -= dropped
+        return dropped
+
+
+class MetricsHistory:
+    """
+    Per-experiment metric series with retention and SQLite persistence.
+
+    Besides the series, the latest snapshot of each experiment (run id, run
+    count and metrics) is kept to detect whether anything changed between
+    monitoring cycles.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS metric_points (
+            experiment_id TEXT NOT NULL,
+            metric TEXT NOT NULL,
+            timestamp REAL NOT NULL,
+            value REAL NOT NULL
+        )
+        """,
+        """
+        CREATE INDEX IF NOT EXISTS metric_points_series
+        ON metric_points (experiment_id, metric, timestamp)
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS experiment_snapshots (
+            experiment_id TEXT PRIMARY KEY,
+            run_id TEXT,
+            total_runs INTEGER,
+            timestamp REAL NOT NULL
+        )
+        """,
+    )
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_CAPACITY,
+        retention_seconds: Optional[float] = None,
+        path: Optional[Path | str] = None,
+    ) -> None:
+        """
+        Initialize the history, reloading persisted points if any.
+
+        Args:
+            capacity: Maximum number of points kept per metric series
+            retention_seconds: Age after which points are dropped; None keeps
+                them until the capacity is reached
+            path: SQLite file to persist to; None keeps the history in memory
+        """
+        self.capacity = capacity
+        self.retention_seconds = retention_seconds
+        self.path = Path(path) if path else None
+
+        self._series: Dict[Tuple[str, str], MetricSeries] = {}
+        self._snapshots: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Tuple[str, str, float, float]] = []
+
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+            self.load()
+
+    @classmethod
+    def from_config(
+        cls, config: Optional[Mapping[str, Any]], name: str = "history"
+    ) -> "MetricsHistory":
+        """
+        Build a history from the ``history`` block of the monitoring config.
+
+        Persistence is opt-in (``persist: true``). The file is ``path`` if
+        set, otherwise ``<root>/<name>.sqlite`` so agents keep separate
+        histories; the ``name`` setting overrides the given name.
+
+        Args:
+            config: History settings (capacity, retention_days, persist, root,
+                name, path)
+            name: Workflow node name of the owning agent
+
+        Returns:
+            MetricsHistory instance
+        """
+        config = config or {}
+        retention_days = config.get("retention_days")
+        path = None
+        if config.get("persist", False):
+            path = config.get("path") or (
+                Path(config.get("root", DEFAULT_HISTORY_DIR))
+                / f"{config.get('name', name)}.sqlite"
+            )
+        return cls(
+            capacity=config.get("capacity", DEFAULT_CAPACITY),
+            retention_seconds=retention_days * 86400 if retention_days else None,
+            path=path,
+        )
+
+    def record(
+        self,
+        experiment_id: str,
+        metrics: Mapping[str, float],
+        run_id: Optional[str] = None,
+        total_runs: Optional[int] = None,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Record the metrics of an experiment observed in a monitoring cycle.
+
+        Args:
+            experiment_id: Experiment the metrics belong to
+            metrics: Metric values
+            run_id: Run the metrics were read from
+            total_runs: Number of runs of the experiment at that time
+            timestamp: Observation time (defaults to now)
+        """
+        timestamp = time.time() if timestamp is None else timestamp
+        with self._lock:
+            for metric, value in metrics.items():
+                self._get_series(experiment_id, metric).append(timestamp, value)
+                self._pending.append((experiment_id, metric, timestamp, value))
+            self._snapshots[experiment_id] = {
+                "run_id": run_id,
+                "total_runs": total_runs,
+                "timestamp": timestamp,
+                "metrics": dict(metrics),
+            }
+
+    def _get_series(self, experiment_id: str, metric: str) -> MetricSeries:
+        """Get the series of a metric, creating it if needed"""
+        series = self._series.get((experiment_id, metric))
+        if series is None:
+            series = self._series[(experiment_id, metric)] = MetricSeries(self.capacity)
+        return series
+
+    def latest(self, experiment_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the last recorded snapshot of an experiment.
+
+        Returns:
+            Dictionary with run_id, total_runs, timestamp and metrics, or None
+        """
+        return self._snapshots.get(experiment_id)
+
+    def metrics(self, experiment_id: str) -> List[str]:
+        """Get the names of the metrics recorded for an experiment"""
+        return sorted(metric for exp, metric in self._series if exp == experiment_id)
+
+    def series(self, experiment_id: str, metric: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get the history of a metric.
+
+        Returns:
+            (timestamps, values) arrays, oldest first; empty if unknown
+        """
+        series = self._series.get((experiment_id, metric))
+        if series is None:
+            return np.empty(0), np.empty(0)
+        return series.timestamps, series.values
+
+    def baseline(
+        self, experiment_id: str, metric: str, window: Optional[int] = None
+    ) -> Optional[Dict[str, float]]:
+        """
+        Compute the rolling baseline of a metric.
+
+        Args:
+            experiment_id: Experiment of the metric
+            metric: Metric name
+            window: Number of most recent points used; None uses all
+
+        Returns:
+            Dictionary with mean, std and count, or None without history
+        """
+        _, values = self.series(experiment_id, metric)
+        if window is not None:
+            values = values[-window:]
+        if not values.size:
+            return None
+        return {
+            "mean": float(values.mean()),
+            "std": float(values.std()),
+            "count": int(values.size),
+        }
+
+    def prune(self, now: Optional[float] = None) -> int:
+        """
+        Drop points older than the retention window.
+
+        Returns:
+            Number of points dropped from memory
+        """
+        if self.retention_seconds is None:
+            return 0
+        cutoff = (time.time() if now is None else now) - self.retention_seconds
+        with self._lock:
+            dropped = sum(series.prune(cutoff) for series in self._series.values())
+            self._series = {key: s for key, s in self._series.items() if len(s)}
+            if self._conn is not None:
+                self._conn.execute(
+                    "DELETE FROM metric_points WHERE timestamp < ?", (cutoff,)
+                )
+        return dropped
+
+    def flush(self) -> None:
+        """Persist points recorded since the last flush and trim the file"""
+        if self._conn is None:
+            return
+        with self._lock:
+            if not self._pending:
+                return
+            pending, self._pending = self._pending, []
+            touched = {(exp, metric) for exp, metric, _, _ in pending}
+
+            self._conn.execute("BEGIN")
+            try:
+                self._conn.executemany(
+                    "INSERT INTO metric_points VALUES (?, ?, ?, ?)", pending
+                )
+                # Keep at most `capacity` points per series on disk too
+                for experiment_id, metric in touched:
+                    self._conn.execute(
+                        "DELETE FROM metric_points WHERE rowid IN ("
+                        "SELECT rowid FROM metric_points "
+                        "WHERE experiment_id = ? AND metric = ? "
+                        "ORDER BY timestamp DESC LIMIT -1 OFFSET ?)",
+                        (experiment_id, metric, self.capacity),
+                    )
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO experiment_snapshots VALUES (?, ?, ?, ?)",
+                    [
+                        (exp, snap["run_id"], snap["total_runs"], snap["timestamp"])
+                        for exp, snap in self._snapshots.items()
+                    ],
+                )
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                self._pending = pending + self._pending
+                raise
+
+    def load(self) -> None:
+        """Reload persisted points and snapshots into memory"""
+        if self._conn is None:
+            return
+        cutoff = (
+            time.time() - self.retention_seconds
+            if self.retention_seconds is not None
+            else float("-inf")
+        )
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT experiment_id, metric, timestamp, value FROM metric_points "
+                "WHERE timestamp >= ? ORDER BY timestamp",
+                (cutoff,),
+            ).fetchall()
+            for experiment_id, metric, timestamp, value in rows:
+                self._get_series(experiment_id, metric).append(timestamp, value)
+
+            for experiment_id, run_id, total_runs, timestamp in self._conn.execute(
+                "SELECT experiment_id, run_id, total_runs, timestamp "
+                "FROM experiment_snapshots"
+            ):
+                self._snapshots[experiment_id] = {
+                    "run_id": run_id,
+                    "total_runs": total_runs,
+                    "timestamp": timestamp,
+                    "metrics": {
+                        metric: float(series.values[-1])
+                        for (exp, metric), series in self._series.items()
+                        if exp == experiment_id and series.timestamps[-1] == timestamp
+                    },
+                }
+        logger.debug(f"Loaded {len(rows)} metric points from {self.path}")
+
+    def close(self) -> None:
+        """Flush pending points and close the database connection"""
+        if self._conn is not None:
+            self.flush()
+            self._conn.close()
+            self._conn = None
+
+    def __len__(self) -> int:
+        return sum(len(series) for series in self._series.values())
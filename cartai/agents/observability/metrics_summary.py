@@ -0,0 +1,235 @@
+"""Deterministic aggregation of experiment run metrics and threshold checks"""
+
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+HEALTHY = "HEALTHY"
+DEGRADED = "DEGRADED"
+UNHEALTHY = "UNHEALTHY"
+UNKNOWN = "UNKNOWN"
+
+# Metric names probed for each threshold, in order of preference
+ACCURACY_METRICS = ("accuracy", "acc", "val_accuracy", "test_accuracy")
+LATENCY_METRICS = ("latency_ms", "latency", "inference_latency_ms", "p95_latency_ms")
+ERROR_RATE_METRICS = ("error_rate", "failure_rate")
+MEMORY_METRICS = ("memory_usage", "memory_utilization")
+
+
+@dataclass
+class ThresholdCheck:
+    """Result of comparing a metric against a configured threshold"""
+
+    name: str
+    metric: str
+    value: float
+    threshold: float
+    passed: bool
+    message: str
+
+
+@dataclass
+class MetricsSummary:
+    """Compact summary of the runs of an experiment"""
+
+    experiment_id: str
+    total_runs: int = 0
+    finished_runs: int = 0
+    failed_runs: int = 0
+    latest_run_id: Optional[str] = None
+    best_run_id: Optional[str] = None
+    latest_metrics: Dict[str, float] = field(default_factory=dict)
+    best_metrics: Dict[str, float] = field(default_factory=dict)
+    metric_stats: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    checks: List[ThresholdCheck] = field(default_factory=list)
+
+    @property
+    def failed_checks(self) -> List[ThresholdCheck]:
+        """Threshold checks that did not pass"""
+        return [check for check in self.checks if not check.passed]
+
+    @property
+    def system_health(self) -> str:
+        """Health derived from the threshold checks"""
+        if not self.total_runs:
+            return UNKNOWN
+        failures = len(self.failed_checks)
+        if failures == 0:
+            return HEALTHY
+        return DEGRADED if failures == 1 else UNHEALTHY
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the summary to a plain dictionary"""
+        data = asdict(self)
+        data["system_health"] = self.system_health
+        return data
+
+    def to_prompt(self) -> str:
+        """Render the summary as compact JSON for the LLM prompt"""
+        return json.dumps(
+            {
+                "experiment_id": self.experiment_id,
+                "runs": {
+                    "total": self.total_runs,
+                    "finished": self.finished_runs,
+                    "failed": self.failed_runs,
+                },
+                "latest_run": {"run_id": self.latest_run_id, **self.latest_metrics},
+                "best_run": {"run_id": self.best_run_id, **self.best_metrics},
+                "metric_stats": self.metric_stats,
+                "threshold_checks": [
+                    {"check": c.name, "passed": c.passed, "detail": c.message}
+                    for c in self.checks
+                ],
+                "computed_health": self.system_health,
+            },
+            separators=(",", ":"),
+        )
+
+
+def parse_runs(payload: Any) -> List[Dict[str, Any]]:
+    """
+    Parse the output of the MLflow MCP ``list_runs`` tool.
+
+    Args:
+        payload: JSON string, content blocks or already decoded dictionary
+
+    Returns:
+        List of run dictionaries (empty if the payload holds an error)
+    """
+    if isinstance(payload, list):
+        payload = "".join(
+            block.get("text", "") if isinstance(block, dict) else str(block)
+            for block in payload
+        )
+    if isinstance(payload, str):
+        try:
+            payload = json.loads(payload)
+        except json.JSONDecodeError:
+            logger.warning("Could not decode list_runs output")
+            return []
+    if not isinstance(payload, Mapping):
+        return []
+    if "error" in payload:
+        logger.warning(f"list_runs returned an error: {payload['error']}")
+    return list(payload.get("runs", []))
+
+
+def numeric_metrics(run: Mapping[str, Any]) -> Dict[str, float]:
+    """Get the numeric metrics of a run"""
+    return {
+        name: float(value)
+        for name, value in (run.get("metrics") or {}).items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    }
+
+
+def _find_metric(metrics: Mapping[str, float], candidates: tuple) -> Optional[str]:
+    """Find the first candidate metric name present in a run"""
+    for name in candidates:
+        if name in metrics:
+            return name
+    return None
+
+
+def summarize_runs(
+    experiment_id: str,
+    runs: List[Dict[str, Any]],
+    thresholds: Mapping[str, Any],
+) -> MetricsSummary:
+    """
+    Aggregate runs and evaluate the configured thresholds.
+
+    Runs are expected newest first (the order returned by MLflow). The latest
+    finished run is compared against the best run for accuracy degradation,
+    and against absolute limits for latency, error rate and memory usage.
+
+    Args:
+        experiment_id: Experiment the runs belong to
+        runs: Runs as returned by ``parse_runs``
+        thresholds: ``monitoring_config["thresholds"]``
+
+    Returns:
+        MetricsSummary with threshold checks
+    """
+    summary = MetricsSummary(experiment_id=experiment_id, total_runs=len(runs))
+    finished = [run for run in runs if run.get("status") == "FINISHED"]
+    summary.finished_runs = len(finished)
+    summary.failed_runs = sum(1 for run in runs if run.get("status") == "FAILED")
+    if not finished:
+        return summary
+
+    latest = finished[0]
+    latest_metrics = numeric_metrics(latest)
+    summary.latest_run_id = latest.get("run_id")
+    summary.latest_metrics = latest_metrics
+
+    # Per-metric statistics across finished runs
+    series: Dict[str, List[float]] = {}
+    for run in finished:
+        for name, value in numeric_metrics(run).items():
+            series.setdefault(name, []).append(value)
+    summary.metric_stats = {
+        name: {
+            "min": min(values),
+            "max": max(values),
+            "mean": round(sum(values) / len(values), 6),
+        }
+        for name, values in series.items()
+    }
+
+    # Best run by accuracy (falls back to the latest run)
+    accuracy_metric = _find_metric(latest_metrics, ACCURACY_METRICS)
+    best = latest
+    if accuracy_metric:
+        best = max(
+            finished,
+            key=lambda run: numeric_metrics(run).get(accuracy_metric, float("-inf")),
+        )
+    summary.best_run_id = best.get("run_id")
+    summary.best_metrics = numeric_metrics(best)
+
+    if accuracy_metric and "accuracy_degradation_threshold" in thresholds:
+        threshold = float(thresholds["accuracy_degradation_threshold"])
+        degradation = (
+            summary.best_metrics[accuracy_metric] - latest_metrics[accuracy_metric]
+        )
+        summary.checks.append(
+            ThresholdCheck(
+                name="accuracy_degradation",
+                metric=accuracy_metric,
+                value=round(degradation, 6),
+                threshold=threshold,
+                passed=degradation <= threshold,
+                message=(
+                    f"latest {accuracy_metric} {latest_metrics[accuracy_metric]:.4f} "
+                    f"vs best {summary.best_metrics[accuracy_metric]:.4f}"
+                ),
+            )
+        )
+
+    for check_name, candidates, threshold_key in (
+        ("latency", LATENCY_METRICS, "latency_threshold_ms"),
+        ("error_rate", ERROR_RATE_METRICS, "error_rate_threshold"),
+        ("memory_usage", MEMORY_METRICS, "memory_usage_threshold"),
+    ):
+        metric = _find_metric(latest_metrics, candidates)
+        if metric is None or threshold_key not in thresholds:
+            continue
+        threshold = float(thresholds[threshold_key])
+        value = latest_metrics[metric]
+        summary.checks.append(
+            ThresholdCheck(
+                name=check_name,
+                metric=metric,
+                value=value,
+                threshold=threshold,
+                passed=value <= threshold,
+                message=f"{metric} {value:g} (limit {threshold:g})",
+            )
+        )
+
+    return summary
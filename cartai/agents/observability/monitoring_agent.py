@@ -1,16 +1,75 @@
+import asyncio
 import logging
 import json
-from typing import Dict, Any, List
-from datetime import datetime
-
-from langchain_core.messages import HumanMessage, SystemMessage
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+from langchain.chat_models import init_chat_model
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable
+from langchain_core.tools import StructuredTool
+from langgraph.graph.graph import CompiledGraph
 from langgraph.prebuilt import create_react_agent
-
+from pydantic import ValidationError
+
+from cartai.agents.base.compaction import (
+    DEFAULT_CONTEXT_BUDGET_TOKENS,
+    DEFAULT_HARD_CAP_TOKENS,
+    DEFAULT_MAX_TOOL_MESSAGE_TOKENS,
+    TOKEN_USAGE_KEY,
+    MessageCompactor,
+    TokenUsage,
+)
 from cartai.agents.base.mcp_aware_agent import MCPAwareAgent
+from cartai.agents.exceptions import TokenBudgetExceeded
+from cartai.agents.observability.alerts import Alert, AlertStore
+from cartai.agents.observability.drift import (
+    DEFAULT_BINS,
+    DEFAULT_EWMA_ALPHA,
+    DEFAULT_THRESHOLDS,
+    DEFAULT_WINDOW,
+    DriftReport,
+    detect_drift,
+    runs_to_matrix,
+)
+from cartai.agents.observability.metrics_history import (
+    DEFAULT_CAPACITY,
+    MetricsHistory,
+)
+from cartai.agents.observability.metrics_summary import (
+    UNHEALTHY,
+    UNKNOWN,
+    MetricsSummary,
+    parse_runs,
+    summarize_runs,
+)
+from cartai.agents.observability.schemas import MonitoringAnalysis
 from cartai.agents.prompts import MCP_TOOLS_GUIDANCE
+from cartai.utils.llm_cache import LLMResponseCache
+from cartai.utils.model_client_utils import LowCostOpenAIModels
+from cartai.utils.model_router import ModelRouter, estimate_prompt_tokens
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MODEL = "openai:gpt-4o-mini"
+DEFAULT_MAX_RUNS = 50
+RUNS_TOOL_NAME = "list_runs"
+SUBMIT_TOOL_NAME = "submit_analysis"
+
+
+class _ModelCallCounter(BaseCallbackHandler):
+    """Count the chat model calls made during one ReAct analysis"""
+
+    run_inline = True
+
+    def __init__(self, stats: Dict[str, int]) -> None:
+        self.stats = stats
+
+    def on_llm_end(self, response: LLMResult, **kwargs: Any) -> None:
+        self.stats["llm_calls"] += 1
+
 
 class MonitoringAgent(MCPAwareAgent):
     """
@@ -24,12 +83,16 @@ class MonitoringAgent(MCPAwareAgent):
     - Generate alerts and reports
     """
 
+    input_fields = ("experiment_id", "model_name", "run_id")
+
     def __init__(
         self,
         mcp_client=None,
         monitoring_config: Dict[str, Any] | None = None,
         core_prompt: str | None = None,
         instructions: str | None = None,
+        model: str | BaseChatModel | None = None,
+        debug: bool = False,
         **kwargs,
     ):
         """
@@ -38,14 +101,53 @@ class MonitoringAgent(MCPAwareAgent):
         Args:
             mcp_client: Optional MCP client instance
             monitoring_config: Monitoring configuration (thresholds, intervals, etc.)
+            model: Chat model used by the ReAct agent ("provider:model" or
+                instance); None picks it per cycle with ``model_routing``
+            debug: Print every ReAct step and the formatted analysis
         """
         super().__init__(mcp_client=mcp_client, **kwargs)
 
         self.monitoring_config = monitoring_config or self._get_default_config()
-        self.metrics_history: List[Dict] = []
-        self.alerts: List[Dict] = []
+        self.metrics_history = MetricsHistory.from_config(
+            self.monitoring_config.get("history"), name=self.node_name
+        )
+        intervals = self.monitoring_config.get("monitoring_intervals", {})
+        self.alerts = AlertStore(
+            cooldown_seconds=intervals.get("alert_cooldown_minutes", 30) * 60
+        )
+        # Opt-in on-disk cache of LLM responses, for development and reruns
+        self.llm_cache = LLMResponseCache.from_config(
+            self.monitoring_config.get("llm_cache")
+        )
+        # Bounds the context resent at every ReAct step
+        self.compactor = MessageCompactor.from_config(
+            self.monitoring_config.get("compaction")
+        )
         self.core_prompt = core_prompt
         self.instructions = instructions
+        # Per-cycle model selection, unless a model is given explicitly
+        self.model_router = (
+            ModelRouter.from_config(self.monitoring_config.get("model_routing"))
+            if model is None
+            else None
+        )
+        self.model = model or DEFAULT_MODEL
+        self.debug = debug
+
+        # Built ReAct agents keyed by (model, bound tools)
+        self._react_agents: Dict[Tuple[Any, Tuple], CompiledGraph] = {}
+        self._submit_tool = self._create_submit_tool()
+
+        # Monitoring cycles, how many were answered without the LLM, and the
+        # ReAct analyses run versus the chat model calls they made
+        self.stats: Dict[str, int] = {
+            "cycles": 0,
+            "fast_path_hits": 0,
+            "llm_analyses": 0,
+            "llm_calls": 0,
+            "llm_tokens_sent": 0,
+            "llm_budget_aborts": 0,
+        }
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Default monitoring configuration"""
@@ -61,6 +163,45 @@ class MonitoringAgent(MCPAwareAgent):
                 "health_check_minutes": 1,
                 "alert_cooldown_minutes": 30,
             },
+            "max_runs": DEFAULT_MAX_RUNS,
+            "fast_path": {"enabled": True, "change_tolerance": 0.0},
+            "drift": {
+                "window": DEFAULT_WINDOW,
+                "bins": DEFAULT_BINS,
+                "ewma_alpha": DEFAULT_EWMA_ALPHA,
+                "thresholds": dict(DEFAULT_THRESHOLDS),
+            },
+            "history": {
+                "capacity": DEFAULT_CAPACITY,
+                "retention_days": 30,
+                "persist": False,
+            },
+            "llm_cache": {"enabled": False},
+            "model_routing": {
+                "enabled": True,
+                "default": LowCostOpenAIModels.GPT_4O_MINI.value,
+                "rules": [
+                    {
+                        "task": "analysis",
+                        "max_prompt_tokens": 4000,
+                        "model": LowCostOpenAIModels.GPT_4_1_NANO.value,
+                    },
+                    {
+                        "task": "investigation",
+                        "model": LowCostOpenAIModels.GPT_4_1_MINI.value,
+                    },
+                ],
+                "fallbacks": [
+                    LowCostOpenAIModels.GPT_4O_MINI.value,
+                    LowCostOpenAIModels.GPT_4_1_MINI.value,
+                ],
+            },
+            "compaction": {
+                "enabled": True,
+                "max_tool_message_tokens": DEFAULT_MAX_TOOL_MESSAGE_TOKENS,
+                "context_budget_tokens": DEFAULT_CONTEXT_BUDGET_TOKENS,
+                "hard_cap_tokens": DEFAULT_HARD_CAP_TOKENS,
+            },
             "alert_settings": {
                 "enable_drift_alerts": True,
                 "enable_performance_alerts": True,
@@ -68,30 +209,58 @@ class MonitoringAgent(MCPAwareAgent):
             },
         }
 
-    async def run(self, state: Dict[str, Any]) -> Dict[str, Any]:
+    async def run(self, state: Mapping[str, Any]) -> Dict[str, Any]:
         """
         Execute monitoring and analysis using LLM reasoning.
 
         Args:
-            state: Current pipeline state
+            state: Current pipeline state (read-only)
 
         Returns:
-            Updated state with monitoring results
+            State updates with monitoring results
         """
         logger.info("MonitoringAgent: Starting LLM-powered monitoring analysis")
+        self.stats["cycles"] += 1
 
         tools = await self.get_tools()
-
-        # Create agent with debugging enabled and proper configuration
-        agent = create_react_agent(
-            model="openai:gpt-4o-mini",
-            tools=tools,  # type: ignore[arg-type]
-            debug=True,
-            version="v2",
-            name="monitoring_agent",
-        )
-
-        context = None  # self._prepare_monitoring_context(state)
+        runs = await self._fetch_runs(state, tools)
+        summary: Optional[MetricsSummary] = None
+        drift: Optional[DriftReport] = None
+        new_alerts: List[Alert] = []
+        drift_updates: Dict[str, Any] = {}
+
+        if runs is not None:
+            summary = self._summarize_runs(str(state["experiment_id"]), runs)
+            drift = self._detect_drift(runs)
+            new_alerts = self._raise_alerts(summary, drift)
+            if drift is not None:
+                # Only newly raised drift alerts go downstream
+                drift_updates = {
+                    **drift.to_state(),
+                    "drift_alerts": [
+                        alert.to_dict()
+                        for alert in new_alerts
+                        if alert.alert_type in DEFAULT_THRESHOLDS
+                    ],
+                }
+
+            unchanged = self._is_unchanged(summary)
+            await self._record_metrics(summary)
+            # Failing checks keep being analysed while their alerts cool down
+            if unchanged and not new_alerts and not summary.failed_checks:
+                self.stats["fast_path_hits"] += 1
+                logger.info(
+                    f"{self.name}: No metric changes and no new alerts - "
+                    "skipping LLM analysis"
+                )
+                return {
+                    "model_metrics": summary.latest_metrics,
+                    "system_health": summary.system_health,
+                    "actions_taken": [],
+                    **drift_updates,
+                }
+
+        context = self._prepare_monitoring_context(state, summary, drift, new_alerts)
 
         system_prompt = f"{self.core_prompt}\n\n{MCP_TOOLS_GUIDANCE}"
         user_prompt = f"""
@@ -104,17 +273,12 @@ class MonitoringAgent(MCPAwareAgent):
         1. Generate monitoring insights and recommendations
         2. Provide a system health status (HEALTHY/DEGRADED/UNHEALTHY)
 
+        The metrics summary and threshold checks in the context were computed from
+        the latest runs. Only call tools for information the summary does not contain.
+
         If there is an error in tool usage, please incorporate the feedback from the error message, think how to solve it perfectly and try to fix it and try again.
 
-        Please respond with a JSON structure containing:
-        {{
-            "system_health": "HEALTHY|DEGRADED|UNHEALTHY",
-            "model_metrics": {{"accuracy": 0.0, "precision": 0.0, ...}},
-            "alerts": [list of alert objects],
-            "analysis_summary": "text summary",
-            "recommendations": [list of recommendations],
-            "actions_taken": [list of actions taken]
-        }}
+        When you are done, call the `{SUBMIT_TOOL_NAME}` tool exactly once with your final analysis.
         """
 
         messages = [
@@ -122,34 +286,383 @@ class MonitoringAgent(MCPAwareAgent):
             HumanMessage(content=user_prompt),
         ]
 
-        # Get LLM analysis with debugging
-        logger.info("Starting agent execution with debugging enabled")
-        response = await agent.ainvoke({"messages": messages})
-        logger.info("Agent execution completed")
-
-        # Extract and parse LLM response
-        formatted_response = self._format_response(response)
-        print(formatted_response)
-        analysis_results = self._extract_analysis_results(response)
-
-        # Update state with LLM analysis
-        state.update(
-            {
-                "model_metrics": analysis_results.get("model_metrics", {}),
-                "monitoring_analysis": analysis_results,
-                "alerts_generated": analysis_results.get("alerts", []),
-                "monitoring_timestamp": datetime.utcnow().isoformat(),
-                "system_health": analysis_results.get("system_health", "UNKNOWN"),
-                "actions_taken": analysis_results.get("actions_taken", []),
-            }
+        react_tools = [*tools, self._submit_tool]
+        model = self.model
+        if self.model_router is not None:
+            # Escalate when alerts need investigating or there is no summary
+            task = "investigation" if new_alerts or summary is None else "analysis"
+            model = self.model_router.select(
+                task,
+                estimate_prompt_tokens(system_prompt + user_prompt),
+                len(react_tools),
+            )
+        agent = self._get_react_agent(model, react_tools)
+
+        # Get LLM analysis
+        logger.info("Starting agent execution")
+        self.stats["llm_analyses"] += 1
+        usage = TokenUsage()
+        try:
+            response = await agent.ainvoke(
+                {"messages": messages},
+                config={
+                    "configurable": {TOKEN_USAGE_KEY: usage},
+                    "callbacks": [_ModelCallCounter(self.stats)],
+                },
+            )
+            logger.info("Agent execution completed")
+
+            # Parse the structured analysis once, reuse it for state and output
+            analysis = self._extract_analysis(response)
+            if self.debug:
+                print(self._format_response(response, analysis))
+        except TokenBudgetExceeded as e:
+            # Stop the investigation, keep the deterministic results
+            self.stats["llm_budget_aborts"] += 1
+            logger.warning(f"{self.name}: LLM analysis aborted - {str(e)}")
+            analysis = MonitoringAnalysis(
+                system_health="UNKNOWN",
+                actions_taken=["LLM analysis stopped at its token budget"],
+            )
+        finally:
+            self.stats["llm_tokens_sent"] += usage.tokens_sent
+            logger.info(
+                f"{self.name}: {usage.model_calls} model calls, "
+                f"~{usage.tokens_sent} tokens sent, ~{usage.tokens_saved} saved "
+                "by compaction"
+            )
+
+        logger.info(
+            f"MonitoringAgent: LLM analysis completed - Health: {analysis.system_health}"
+        )
+
+        model_metrics = analysis.model_metrics
+        system_health: str = analysis.system_health
+        if summary is not None:
+            # Fall back to the deterministic results when the LLM omits them
+            model_metrics = model_metrics or summary.latest_metrics
+            if system_health == "UNKNOWN":
+                system_health = summary.system_health
+
+        # Only the state keys produced by the analysis
+        return {
+            "model_metrics": model_metrics,
+            "system_health": system_health,
+            "actions_taken": analysis.actions_taken,
+            **drift_updates,
+        }
+
+    async def health_check(self, state: Mapping[str, Any]) -> Dict[str, Any]:
+        """
+        Cheap health check: fetch runs and evaluate the thresholds only.
+
+        No LLM call, drift detection or alerting is done, and the metrics
+        history is left untouched so the next full cycle still sees changes.
+
+        Args:
+            state: Current pipeline state (read-only)
+
+        Returns:
+            State updates with the model metrics and system health
+        """
+        tools = await self.get_tools()
+        runs = await self._fetch_runs(state, tools)
+        if runs is None:
+            return {"system_health": UNKNOWN}
+
+        summary = self._summarize_runs(str(state["experiment_id"]), runs)
+        return {
+            "model_metrics": summary.latest_metrics,
+            "system_health": summary.system_health,
+        }
+
+    def _is_unchanged(self, summary: MetricsSummary) -> bool:
+        """
+        Check whether the experiment's metrics moved since the last cycle.
+
+        Args:
+            summary: Metrics summary of the current cycle
+
+        Returns:
+            True if the fast path is enabled and the latest run and its metrics
+            match the previous cycle within the configured tolerance
+        """
+        fast_path = self.monitoring_config.get("fast_path", {})
+        if not fast_path.get("enabled", True):
+            return False
+
+        previous = self.metrics_history.latest(summary.experiment_id)
+        if previous is None:
+            return False
+        if (
+            previous["run_id"] != summary.latest_run_id
+            or previous["total_runs"] != summary.total_runs
+            or previous["metrics"].keys() != summary.latest_metrics.keys()
+        ):
+            return False
+
+        tolerance = fast_path.get("change_tolerance", 0.0)
+        return all(
+            abs(value - previous["metrics"][name]) <= tolerance
+            for name, value in summary.latest_metrics.items()
+        )
+
+    def _raise_alerts(
+        self, summary: MetricsSummary, drift: Optional[DriftReport]
+    ) -> List[Alert]:
+        """
+        Submit the failed checks and drift alerts of this cycle to the alert store.
+
+        Args:
+            summary: Metrics summary of the current cycle
+            drift: Drift report of the current cycle, if any
+
+        Returns:
+            Alerts to emit (new incidents or past their cooldown)
+        """
+        alert_settings = self.monitoring_config.get("alert_settings", {})
+        severity = "critical" if summary.system_health == UNHEALTHY else "warning"
+        candidates: List[Dict[str, Any]] = []
+
+        if alert_settings.get("enable_performance_alerts", True):
+            candidates.extend(
+                {
+                    "metric": check.metric,
+                    "alert_type": check.name,
+                    "message": check.message,
+                    "severity": severity,
+                    "value": check.value,
+                    "threshold": check.threshold,
+                }
+                for check in summary.failed_checks
+            )
+        if drift is not None:
+            candidates.extend(
+                {
+                    "metric": alert["metric"],
+                    "alert_type": alert["type"],
+                    "message": f"{alert['type']} drift on {alert['metric']}",
+                    "value": alert["value"],
+                    "threshold": alert["threshold"],
+                }
+                for alert in drift.alerts
+            )
+
+        emitted = []
+        for candidate in candidates:
+            alert = self.alerts.submit(summary.experiment_id, **candidate)
+            if alert is not None:
+                emitted.append(alert)
+        self.alerts.resolve(
+            summary.experiment_id,
+            [(summary.experiment_id, c["metric"], c["alert_type"]) for c in candidates],
+        )
+        return emitted
+
+    async def _record_metrics(self, summary: MetricsSummary) -> None:
+        """Record the metrics of the current cycle and persist the history"""
+        self.metrics_history.record(
+            summary.experiment_id,
+            summary.latest_metrics,
+            run_id=summary.latest_run_id,
+            total_runs=summary.total_runs,
+        )
+        self.metrics_history.prune()
+        try:
+            await asyncio.to_thread(self.metrics_history.flush)
+        except Exception as e:
+            logger.warning(f"{self.name}: Failed to persist metrics history: {str(e)}")
+
+    def get_agent_info(self) -> Dict[str, Any]:
+        """Get information about this agent, including fast path counters"""
+        return {
+            **super().get_agent_info(),
+            "stats": {
+                **self.stats,
+                "alerts_emitted": self.alerts.emitted,
+                "alerts_suppressed": self.alerts.suppressed,
+            },
+            "llm_cache": self.llm_cache.stats() if self.llm_cache else None,
+            "models": self.model_router.get_stats() if self.model_router else None,
+        }
+
+    async def _fetch_runs(
+        self, state: Mapping[str, Any], tools: List[Any]
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the experiment runs through the MCP tool, without the LLM.
+
+        Args:
+            state: Current pipeline state (read-only)
+            tools: MCP tools of the agent
+
+        Returns:
+            Runs (newest first), or None if they cannot be fetched
+        """
+        experiment_id = state.get("experiment_id")
+        if not experiment_id:
+            return None
+
+        runs_tool = next(
+            (
+                tool
+                for tool in tools
+                if tool.name == RUNS_TOOL_NAME
+                or tool.name.endswith(f"_{RUNS_TOOL_NAME}")
+            ),
+            None,
         )
+        if runs_tool is None:
+            logger.debug(f"{self.name}: No '{RUNS_TOOL_NAME}' tool available")
+            return None
 
+        try:
+            payload = await runs_tool.ainvoke(
+                {
+                    "experiment_id": str(experiment_id),
+                    "max_results": self.monitoring_config.get(
+                        "max_runs", DEFAULT_MAX_RUNS
+                    ),
+                }
+            )
+        except Exception as e:
+            logger.warning(f"{self.name}: Failed to fetch runs: {str(e)}")
+            return None
+
+        return parse_runs(payload)
+
+    def _summarize_runs(
+        self, experiment_id: str, runs: List[Dict[str, Any]]
+    ) -> MetricsSummary:
+        """Evaluate the configured thresholds on the experiment runs"""
+        summary = summarize_runs(
+            experiment_id, runs, self.monitoring_config.get("thresholds", {})
+        )
         logger.info(
-            f"MonitoringAgent: LLM analysis completed - Health: {analysis_results.get('system_health')}"
+            f"{self.name}: Pre-aggregated {summary.total_runs} runs - "
+            f"{len(summary.failed_checks)} threshold checks failed"
+        )
+        return summary
+
+    def _detect_drift(self, runs: List[Dict[str, Any]]) -> Optional[DriftReport]:
+        """
+        Run the drift detectors over the finished runs of the experiment.
+
+        Args:
+            runs: Runs (newest first)
+
+        Returns:
+            DriftReport, or None if disabled or there are too few runs
+        """
+        alert_settings = self.monitoring_config.get("alert_settings", {})
+        if not alert_settings.get("enable_drift_alerts", True):
+            return None
+
+        drift_config = self.monitoring_config.get("drift", {})
+        metrics, matrix = runs_to_matrix(
+            [run for run in runs if run.get("status") == "FINISHED"]
+        )
+        return detect_drift(
+            metrics,
+            matrix,
+            window=drift_config.get("window", DEFAULT_WINDOW),
+            thresholds=drift_config.get("thresholds"),
+            bins=drift_config.get("bins", DEFAULT_BINS),
+            alpha=drift_config.get("ewma_alpha", DEFAULT_EWMA_ALPHA),
+        )
+
+    def _on_tools_changed(self) -> None:
+        """Drop the ReAct agents bound to the previous tool list"""
+        self._react_agents.clear()
+
+    @staticmethod
+    def _create_submit_tool() -> StructuredTool:
+        """
+        Create the tool the LLM calls with its final analysis.
+
+        The arguments are validated against ``MonitoringAnalysis`` by the
+        tool call itself and the ReAct loop ends right after it
+        (``return_direct``), so no free-form JSON has to be parsed.
+        """
+
+        def submit_analysis(**analysis: Any) -> str:
+            return "Analysis submitted"
+
+        return StructuredTool.from_function(
+            func=submit_analysis,
+            name=SUBMIT_TOOL_NAME,
+            description="Submit the final monitoring analysis. Call exactly once, last.",
+            args_schema=MonitoringAnalysis,
+            return_direct=True,
+        )
+
+    def _get_react_agent(
+        self, model: str | BaseChatModel, tools: List[Any]
+    ) -> CompiledGraph:
+        """
+        Get the ReAct agent for a model and tool set, building it once.
+
+        Args:
+            model: Chat model identifier
+            tools: Tools to bind to the agent
+
+        Returns:
+            Compiled ReAct agent graph
+        """
+        key = (
+            model if isinstance(model, str) else id(model),
+            tuple((getattr(tool, "name", ""), id(tool)) for tool in tools),
         )
-        return state
+        agent = self._react_agents.get(key)
+        if agent is None:
+            logger.debug(f"{self.name}: Building ReAct agent for {model}")
+            chat_model: str | Runnable = model
+            if self.model_router is not None and isinstance(model, str):
+                chat_model = self.model_router.chat_model(
+                    model, **({"cache": self.llm_cache} if self.llm_cache else {})
+                )
+            elif self.llm_cache is not None:
+                chat_model = self._with_cache(model, self.llm_cache)
+            agent = create_react_agent(
+                model=chat_model,
+                tools=tools,
+                pre_model_hook=(
+                    self.compactor.pre_model_hook if self.compactor else None
+                ),
+                debug=self.debug,
+                version="v2",
+                name="monitoring_agent",
+            )
+            self._react_agents[key] = agent
+        return agent
+
+    @staticmethod
+    def _with_cache(
+        model: str | BaseChatModel, cache: LLMResponseCache
+    ) -> BaseChatModel:
+        """
+        Get a chat model that answers repeated prompts from the cache.
+
+        Args:
+            model: Chat model identifier or instance (left unmodified)
+            cache: LLM response cache
 
-    def _prepare_monitoring_context(self, state: Dict[str, Any]) -> str:
+        Returns:
+            Chat model using the cache
+        """
+        if isinstance(model, str):
+            chat_model = init_chat_model(model)
+            chat_model.cache = cache
+            return chat_model
+        return model.model_copy(update={"cache": cache})
+
+    def _prepare_monitoring_context(
+        self,
+        state: Mapping[str, Any],
+        summary: Optional[MetricsSummary] = None,
+        drift: Optional[DriftReport] = None,
+        new_alerts: Optional[List[Alert]] = None,
+    ) -> str:
         """Prepare context information for LLM analysis"""
         context_parts = []
 
@@ -166,7 +679,21 @@ class MonitoringAgent(MCPAwareAgent):
                 f"Previous Metrics: {json.dumps(state['model_metrics'], indent=2)}"
             )
 
-        if hasattr(self, "monitoring_config"):
+        if summary is not None:
+            # Thresholds are already applied, so the summary replaces the config
+            context_parts.append(f"Metrics Summary: {summary.to_prompt()}")
+        if drift is not None:
+            context_parts.append(f"Drift Score (max PSI): {drift.drift_score}")
+        if summary is not None or drift is not None:
+            alerts = [
+                {"metric": a.metric, "type": a.alert_type, "detail": a.message}
+                for a in new_alerts or []
+            ]
+            context_parts.append(
+                f"New Alerts: {json.dumps(alerts, separators=(',', ':'))} "
+                f"({len(self.alerts) - len(alerts)} ongoing alerts already reported)"
+            )
+        elif hasattr(self, "monitoring_config"):
             context_parts.append(
                 f"Monitoring Configuration: {json.dumps(self.monitoring_config, indent=2)}"
             )
@@ -183,133 +710,80 @@ class MonitoringAgent(MCPAwareAgent):
             else "No context information available"
         )
 
-    def _format_response(self, response: Dict[str, Any]) -> str:
+    def _format_response(
+        self, response: Dict[str, Any], analysis: MonitoringAnalysis
+    ) -> str:
         """
-        Format the LLM response messages into a beautiful, human-readable format.
+        Format the ReAct steps and the parsed analysis into a human-readable form.
 
         Args:
-            response: The raw response dictionary from the LLM
+            response: The raw response dictionary from the ReAct agent
+            analysis: The analysis parsed from the response
 
         Returns:
             A formatted string containing the conversation flow
         """
-        if not response or not response.get("messages"):
-            return "No messages found in response"
-
         formatted_parts = []
         formatted_parts.append("🤖 Monitoring Agent Analysis")
         formatted_parts.append("=" * 50)
 
         for idx, msg in enumerate(response.get("messages", []), 1):
             # Add message separator
-            formatted_parts.append(f"\n📝 Step {idx}")
+            formatted_parts.append(f"\n📝 Step {idx} ({msg.type})")
             formatted_parts.append("-" * 50)
 
-            # Format based on message type
-            if hasattr(msg, "tool_calls") and not idx == len(
-                response.get("messages", [])
-            ):
+            tool_calls = getattr(msg, "tool_calls", None)
+            if tool_calls:
                 # Tool execution message
                 formatted_parts.append("🔧 Tool Execution:")
-                for tool_call in msg.tool_calls:
-                    tool_name = getattr(tool_call, "name", "Unknown Tool")
-                    formatted_parts.append(f"  Tool: {tool_name}")
-                    if hasattr(tool_call, "arguments"):
-                        args = json.dumps(tool_call.arguments, indent=2)
+                for tool_call in tool_calls:
+                    formatted_parts.append(f"  Tool: {tool_call['name']}")
+                    if tool_call["name"] != SUBMIT_TOOL_NAME:
+                        args = json.dumps(tool_call["args"], indent=2)
                         formatted_parts.append("  Arguments:")
                         formatted_parts.extend(
                             f"    {line}" for line in args.splitlines()
                         )
-
-            elif hasattr(msg, "tool_responses"):
-                # Tool response message
-                formatted_parts.append("📊 Tool Response:")
-                for resp in msg.tool_responses:
-                    formatted_parts.append(f"  {resp[:200]}...")
-
-            elif hasattr(msg, "content") and msg.content:
-                # Regular message content
-                if "```json" in msg.content:
-                    # Handle JSON blocks specially
-                    parts = msg.content.split("```")
-                    for part in parts:
-                        if part.startswith("json"):
-                            try:
-                                json_obj = json.loads(part[4:].strip())
-                                formatted_parts.append(json.dumps(json_obj, indent=2))
-                            except Exception as e:
-                                logger.error(f"Error parsing JSON: {e}")
-                                formatted_parts.append(part)
-                        elif part.strip():
-                            formatted_parts.append(part.strip())
+            elif msg.content:
+                content = str(msg.content).strip()
+                if msg.type == "tool":
+                    # Tool response message
+                    formatted_parts.append(f"📊 Tool Response: {content[:200]}...")
                 else:
-                    formatted_parts.append(msg.content.strip())
-
-            else:
-                # Unknown message type
-                formatted_parts.append("📄 Message:")
-                formatted_parts.append(str(msg))
+                    formatted_parts.append(content)
 
-        # Add final separator
+        formatted_parts.append("=" * 50)
+        formatted_parts.append(analysis.format())
         formatted_parts.append("=" * 50)
 
         return "\n".join(formatted_parts)
 
-    def _extract_last_message(self, llm_response) -> str:
-        """Extract the last message from the LLM response"""
-        for msg in reversed(llm_response.get("messages", [])):
-            if hasattr(msg, "content") and msg.content:
-                return msg.content
-        return ""
-
-    def _extract_analysis_results(self, llm_response) -> Dict[str, Any]:
-        """Extract and parse analysis results from LLM response"""
-        try:
-            # Get the final message from the response
-            final_message = None
-            for msg in reversed(llm_response.get("messages", [])):
-                if (
-                    hasattr(msg, "content")
-                    and msg.content
-                    and not hasattr(msg, "tool_calls")
-                ):
-                    final_message = msg
-                    break
-
-            if not final_message:
-                logger.warning("No final message found in LLM response")
-                return {}
-
-            content = final_message.content
-
-            # Try to extract JSON from the response
-            try:
-                # Look for JSON block in the response
-                import re
-
-                json_match = re.search(r"```json\s*(\{.*?\})\s*```", content, re.DOTALL)
-                if json_match:
-                    analysis = json.loads(json_match.group(1))
-                else:
-                    # Try to parse the entire content as JSON
-                    analysis = json.loads(content)
-
-                # Validate required fields
-                required_fields = ["system_health", "model_metrics"]
-                for field in required_fields:
-                    if field not in analysis:
-                        logger.warning(
-                            f"Missing required field '{field}' in LLM response"
-                        )
-                        analysis[field] = {} if field == "model_metrics" else "UNKNOWN"
+    def _extract_analysis(self, llm_response: Dict[str, Any]) -> MonitoringAnalysis:
+        """
+        Parse the final analysis of the ReAct run.
 
-                return analysis
+        The analysis is read from the arguments of the ``submit_analysis`` tool
+        call; a final plain message is accepted only if it is a valid JSON
+        document of the same schema.
 
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON from LLM response: {e}")
-                logger.debug(f"LLM response content: {content}")
-                return {}
+        Args:
+            llm_response: The raw response dictionary from the ReAct agent
 
-        except Exception as e:
-            logger.error(f"Error extracting analysis results: {e}")
-            return {}
+        Returns:
+            Parsed analysis (UNKNOWN health if none could be parsed)
+        """
+        for msg in reversed(llm_response.get("messages", [])):
+            if not isinstance(msg, AIMessage):
+                continue
+            try:
+                for tool_call in msg.tool_calls:
+                    if tool_call["name"] == SUBMIT_TOOL_NAME:
+                        return MonitoringAnalysis.model_validate(tool_call["args"])
+                if msg.content and not msg.tool_calls:
+                    return MonitoringAnalysis.model_validate_json(str(msg.content))
+            except ValidationError as e:
+                logger.error(f"Invalid analysis in LLM response: {e}")
+                break
+
+        logger.warning("No structured analysis found in LLM response")
+        return MonitoringAnalysis(system_health="UNKNOWN")
@@ -0,0 +1,223 @@
+"""
+Continuous monitoring loop for ``MonitoringAgent``.
+
+Runs cheap health checks and full monitoring cycles at their own intervals in
+a single long-lived process, instead of spawning a fresh process per cycle.
+"""
+
+import asyncio
+import inspect
+import logging
+import random
+import signal
+import time
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Dict, Mapping, Optional
+
+from cartai.agents.observability.monitoring_agent import MonitoringAgent
+
+logger = logging.getLogger(__name__)
+
+HEALTH_CHECK = "health_check"
+METRICS_COLLECTION = "metrics_collection"
+
+ResultCallback = Callable[[str, Dict[str, Any]], Any]
+
+
+@dataclass
+class JobStats:
+    """Execution counters of a scheduled job"""
+
+    runs: int = 0
+    failures: int = 0
+    overruns: int = 0
+    skipped: int = 0
+    last_duration_s: float = 0.0
+    backoff_factor: float = 1.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the stats to a plain dictionary"""
+        return asdict(self)
+
+
+class MonitoringScheduler:
+    """
+    Asyncio scheduler running monitoring jobs at fixed intervals.
+
+    - Jitter: every delay is randomized by ``±jitter`` to avoid synchronized
+      bursts across monitored experiments and processes.
+    - Overlap prevention: a job never overlaps itself, and a health check due
+      while a full cycle runs is skipped (the cycle refreshes the same data).
+    - Backpressure: missed ticks are dropped rather than replayed, and a job
+      that overruns its interval has it doubled (up to ``max_backoff_factor``)
+      until cycles fit again.
+    """
+
+    def __init__(
+        self,
+        agent: MonitoringAgent,
+        state: Mapping[str, Any],
+        health_check_seconds: Optional[float] = None,
+        collection_seconds: Optional[float] = None,
+        jitter: float = 0.1,
+        max_backoff_factor: float = 8.0,
+        cycle_timeout_seconds: Optional[float] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            agent: Monitoring agent to run
+            state: Pipeline state passed to every cycle (e.g. experiment_id)
+            health_check_seconds: Health check interval; defaults to
+                ``monitoring_intervals.health_check_minutes`` of the agent
+            collection_seconds: Full monitoring cycle interval; defaults to
+                ``monitoring_intervals.metrics_collection_minutes``
+            jitter: Relative random spread applied to every delay
+            max_backoff_factor: Largest multiplier applied to an overrunning interval
+            cycle_timeout_seconds: Upper bound on a single job execution
+            on_result: Callback (sync or async) receiving (job name, result)
+        """
+        intervals = agent.monitoring_config.get("monitoring_intervals", {})
+        self.agent = agent
+        self.state = MappingProxyType(dict(state))
+        self.intervals = {
+            HEALTH_CHECK: health_check_seconds
+            or intervals.get("health_check_minutes", 1) * 60,
+            METRICS_COLLECTION: collection_seconds
+            or intervals.get("metrics_collection_minutes", 5) * 60,
+        }
+        self.jitter = jitter
+        self.max_backoff_factor = max_backoff_factor
+        self.cycle_timeout_seconds = cycle_timeout_seconds
+        self.on_result = on_result
+
+        self.stats: Dict[str, JobStats] = {name: JobStats() for name in self.intervals}
+        self._busy = asyncio.Lock()
+        self._stopping = asyncio.Event()
+
+    def stop(self) -> None:
+        """Ask the scheduler to stop after the jobs currently running"""
+        self._stopping.set()
+
+    async def run(self, duration_seconds: Optional[float] = None) -> None:
+        """
+        Run both jobs until stopped (or for a fixed duration).
+
+        SIGINT and SIGTERM stop the scheduler gracefully when supported.
+
+        Args:
+            duration_seconds: Stop after this many seconds; None runs forever
+        """
+        self._stopping.clear()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.stop)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass
+
+        timer = (
+            loop.call_later(duration_seconds, self.stop) if duration_seconds else None
+        )
+        logger.info(
+            f"Monitoring scheduler started: health check every "
+            f"{self.intervals[HEALTH_CHECK]}s, collection every "
+            f"{self.intervals[METRICS_COLLECTION]}s"
+        )
+        try:
+            await asyncio.gather(
+                self._job_loop(HEALTH_CHECK, self.agent.health_check),
+                self._job_loop(METRICS_COLLECTION, self.agent.run),
+            )
+        finally:
+            if timer is not None:
+                timer.cancel()
+            for sig in (signal.SIGINT, signal.SIGTERM):
+                try:
+                    loop.remove_signal_handler(sig)
+                except (NotImplementedError, RuntimeError, ValueError):
+                    pass
+            logger.info(f"Monitoring scheduler stopped: {self.get_stats()}")
+
+    async def _job_loop(
+        self,
+        name: str,
+        operation: Callable[[Mapping[str, Any]], Awaitable[Dict[str, Any]]],
+    ) -> None:
+        """Run one job repeatedly until the scheduler stops"""
+        stats = self.stats[name]
+        interval = self.intervals[name]
+        next_start = time.monotonic()
+
+        while not self._stopping.is_set():
+            delay = next_start - time.monotonic()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=delay)
+                    break
+                except asyncio.TimeoutError:
+                    pass
+
+            started = time.monotonic()
+            if name == HEALTH_CHECK and self._busy.locked():
+                stats.skipped += 1
+                logger.debug("Skipping health check during a monitoring cycle")
+            else:
+                async with self._busy:
+                    await self._execute(name, operation, stats)
+
+                duration = time.monotonic() - started
+                stats.last_duration_s = duration
+                if duration > interval * stats.backoff_factor:
+                    stats.overruns += 1
+                    stats.backoff_factor = min(
+                        stats.backoff_factor * 2, self.max_backoff_factor
+                    )
+                    logger.warning(
+                        f"{name} took {duration:.1f}s, longer than its interval - "
+                        f"backing off to {interval * stats.backoff_factor:.0f}s"
+                    )
+                elif stats.backoff_factor > 1.0:
+                    stats.backoff_factor = max(1.0, stats.backoff_factor / 2)
+
+            spread = 1 + random.uniform(-self.jitter, self.jitter)
+            # Never schedule in the past: missed ticks are dropped, not replayed
+            next_start = max(
+                started + interval * stats.backoff_factor * spread, time.monotonic()
+            )
+
+    async def _execute(
+        self,
+        name: str,
+        operation: Callable[[Mapping[str, Any]], Awaitable[Dict[str, Any]]],
+        stats: JobStats,
+    ) -> None:
+        """Execute a job once, recording failures instead of raising them"""
+        stats.runs += 1
+        try:
+            result = await asyncio.wait_for(
+                operation(self.state), timeout=self.cycle_timeout_seconds
+            )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            stats.failures += 1
+            stats.last_error = str(e) or type(e).__name__
+            logger.error(f"{name} failed: {stats.last_error}")
+            return
+
+        if self.on_result is not None:
+            try:
+                callback_result = self.on_result(name, result)
+                if inspect.isawaitable(callback_result):
+                    await callback_result
+            except Exception as e:
+                logger.error(f"{name} result callback failed: {str(e)}")
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the execution counters of every job"""
+        return {name: stats.to_dict() for name, stats in self.stats.items()}
@@ -0,0 +1,76 @@
+"""Structured output schemas of the observability agents"""
+
+from typing import Any, Dict, List, Literal
+
+from pydantic import BaseModel, Field, field_validator
+
+HealthStatus = Literal["HEALTHY", "DEGRADED", "UNHEALTHY", "UNKNOWN"]
+
+
+class AnalysisAlert(BaseModel):
+    """An alert reported by the LLM analysis"""
+
+    metric: str = Field(default="", description="Metric the alert is about")
+    severity: str = Field(default="warning", description="info, warning or critical")
+    message: str = Field(description="What is wrong and why it matters")
+
+
+class MonitoringAnalysis(BaseModel):
+    """Final analysis of a monitoring cycle"""
+
+    system_health: HealthStatus = Field(
+        description="Overall health: HEALTHY, DEGRADED or UNHEALTHY"
+    )
+    model_metrics: Dict[str, float] = Field(
+        default_factory=dict,
+        description="Key metrics of the best or latest run, e.g. accuracy",
+    )
+    alerts: List[AnalysisAlert] = Field(default_factory=list)
+    analysis_summary: str = Field(default="", description="Short text summary")
+    recommendations: List[str] = Field(default_factory=list)
+    actions_taken: List[str] = Field(
+        default_factory=list, description="Actions performed with tools, if any"
+    )
+
+    @field_validator("system_health", mode="before")
+    @classmethod
+    def _normalize_health(cls, value: Any) -> Any:
+        """Accept any casing of the health status"""
+        return value.strip().upper() if isinstance(value, str) else value
+
+    @field_validator("model_metrics", mode="before")
+    @classmethod
+    def _drop_non_numeric(cls, value: Any) -> Any:
+        """Keep only numeric metrics instead of failing the whole analysis"""
+        if not isinstance(value, dict):
+            return value
+        return {
+            name: metric
+            for name, metric in value.items()
+            if isinstance(metric, (int, float)) and not isinstance(metric, bool)
+        }
+
+    def format(self) -> str:
+        """Render the analysis for humans"""
+        lines = [f"System health: {self.system_health}"]
+        if self.analysis_summary:
+            lines.append(f"Summary: {self.analysis_summary}")
+        if self.model_metrics:
+            lines.append("Metrics:")
+            lines.extend(
+                f"  {name}: {value:g}" for name, value in self.model_metrics.items()
+            )
+        if self.alerts:
+            lines.append("Alerts:")
+            lines.extend(
+                f"  [{alert.severity}] {alert.metric}: {alert.message}"
+                for alert in self.alerts
+            )
+        for title, items in (
+            ("Recommendations", self.recommendations),
+            ("Actions taken", self.actions_taken),
+        ):
+            if items:
+                lines.append(f"{title}:")
+                lines.extend(f"  - {item}" for item in items)
+        return "\n".join(lines)
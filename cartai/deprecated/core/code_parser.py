@@ -11,6 +11,7 @@ import re
 from pydantic import BaseModel, Field, ConfigDict
 
 from cartai.deprecated.llm_agents.graph_states import CartaiDynamicState
+from cartai.utils.blob_store import default_blob_store
 
 
 class ParsedBase(BaseModel):
@@ -108,6 +109,11 @@ class ProjectParser(BaseModel):
         default=False,
         description="Whether to include complete file content in the output",
     )
+    offload_structure: bool = Field(
+        default=False,
+        description="Whether to store large project structures in the blob store "
+        "and keep a reference in the state",
+    )
     # summarize_large_files: bool = Field(
     #    default=True,
     #    description="Whether to include summaries for large files"
@@ -308,6 +314,9 @@ class ProjectParser(BaseModel):
 
         try:
             structure = await self.parse(self.project_path)
+            if self.offload_structure:
+                # Large structures are stored once, the state carries a reference
+                structure = default_blob_store().offload(structure)
             return {
                 "messages": [1],
                 "outputs": [("ProjectStructure", structure)],
@@ -3,10 +3,14 @@ AIDocumenter class for generating documentation using LLM models.
 """
 
 import os
+from functools import partial
 from pathlib import Path
 from typing import Any
 from cartai.deprecated.llm_agents.graph_states import CartaiDynamicState
+from cartai.utils.blob_store import default_blob_store
+from cartai.utils.llm_cache import LLMResponseCache
 from cartai.utils.model_client_utils import LowCostOpenAIModels
+from cartai.utils.model_router import ModelRouter
 from litellm import acompletion
 from jinja2 import Template
 from pydantic import BaseModel, Field, SecretStr, ConfigDict
@@ -48,6 +52,12 @@ class AIDocumenter(BaseModel):
     output: dict[str, Any] | None = Field(
         default=None, description="The output to use for the template"
     )
+    llm_cache: LLMResponseCache | None = Field(
+        default=None, description="Optional on-disk cache of LLM responses"
+    )
+    model_router: ModelRouter | None = Field(
+        default=None, description="Optional per-template model selection"
+    )
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -102,7 +112,11 @@ class AIDocumenter(BaseModel):
         template_content = await self._load_template(template_name)
 
         logger.info(f"Project context: {project_context}")
-        prompt = template_content.render(project_context)
+        # Values offloaded by previous nodes (e.g. the project structure)
+        store = default_blob_store()
+        prompt = template_content.render(
+            {key: store.resolve(value) for key, value in project_context.items()}
+        )
 
         # Check for API key availability
         api_key = (
@@ -117,13 +131,22 @@ class AIDocumenter(BaseModel):
             )
 
         # Generate the documentation using litellm
-        response = await acompletion(
-            model=self.model,
-            api_key=api_key,
-            messages=[{"role": "user", "content": prompt}],
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        messages = [{"role": "user", "content": prompt}]
+        params: dict[str, Any] = {
+            "api_key": api_key,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        completion = acompletion
+        if self.llm_cache:
+            completion = partial(self.llm_cache.acompletion, acompletion)
+        if self.model_router:
+            # The template name is the task type routing rules match on
+            response = await self.model_router.acompletion(
+                completion, messages, task=template_name, **params
+            )
+        else:
+            response = await completion(model=self.model, messages=messages, **params)
 
         if self.output:
             with open(self.output["output_name"], "w", encoding="utf-8") as f:
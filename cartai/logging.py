@@ -1,13 +1,35 @@
+import atexit
+import copy
 import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, Type
-
-from cartai.utils.yaml_utils import YAMLUtils
+from typing import Dict, List, Optional, Tuple, Type
 
 DEFAULT_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 DEFAULT_LOG_LEVEL = "INFO"
 
+# Overrides the ``queue`` setting of every root handler ("1"/"true" or "0"/"false")
+QUEUE_ENV_VAR = "CARTAI_LOG_QUEUE"
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    Queue handler for a listener in the same process.
+
+    The standard ``prepare`` also formats every record on the calling thread
+    so it can be pickled; records handled in process only need a copy with
+    their message frozen, formatting is left to the listener thread.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Copied: other handlers of the caller still see the original record
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
 
 class LoggerFactory:
     """
@@ -17,24 +39,55 @@ class LoggerFactory:
     - Loading logging configuration from YAML
     - Setting up logging providers (console, file, logfire, etc.)
     - Providing a unified way to get logger instances
+
+    Root handlers marked ``queue: true`` in the config are not called by the
+    root logger, which only enqueues records for them; a background
+    ``QueueListener`` thread formats the records and runs those handlers.
+    Meant for slow or remote handlers (log shippers, network services) that
+    must not block the caller or the event loop; enqueueing costs more than
+    a local file or console write, so other handlers stay synchronous.
     """
 
     _instance = None
     _initialized = False
 
-    def __new__(cls):
+    def __new__(cls, config: Optional[Dict] = None):
         if cls._instance is None:
             cls._instance = super(LoggerFactory, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self):
+    def __init__(self, config: Optional[Dict] = None):
+        """
+        Initialize the factory, once per process.
+
+        Args:
+            config: Logging configuration; loaded from YAML when omitted
+        """
         if not self._initialized:
-            self._config = self._load_config()
+            self._listener: Optional[QueueListener] = None
+            self._config = config if config is not None else self._load_config()
             self._setup_root_logger()
             self._initialized = True
 
+    @classmethod
+    def reset(cls) -> None:
+        """Stop the queue listener and forget the configured instance"""
+        if cls._instance is not None and cls._instance._initialized:
+            cls._instance.shutdown()
+        cls._instance = None
+
+    def shutdown(self) -> None:
+        """Flush queued records and stop the listener thread, if any"""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
+            atexit.unregister(self.shutdown)
+
     def _load_config(self) -> Dict:
         """Load logging configuration from YAML file."""
+        # Imported here: importing this module must stay cheap
+        from cartai.utils.yaml_utils import YAMLUtils
+
         config_locations = [
             os.environ.get("CARTAI_LOGGING_CONFIG"),  # 1. Environment variable
             "logging_config.yaml",  # 2. Current directory
@@ -81,13 +134,15 @@ class LoggerFactory:
         Raises:
             ImportError: If the class cannot be imported
         """
+        from cartai.utils.yaml_utils import YAMLUtils
+
         try:
             return YAMLUtils.import_class(class_path)
         except ImportError as e:
             print(f"Warning: Failed to import handler class {class_path}: {e}")
             return logging.StreamHandler
 
-    def _setup_root_logger(self):
+    def _setup_root_logger(self) -> None:
         """Configure the root logger based on loaded configuration."""
         config = self._config
 
@@ -121,16 +176,9 @@ class LoggerFactory:
                 handler_class_path = handler_config.get("class", "StreamHandler")
                 handler_class = self._import_handler_class(handler_class_path)
 
-                handler = handler_class()
-
-                handler.setLevel(handler_config.get("level", DEFAULT_LOG_LEVEL))
-
-                formatter_name = handler_config.get("formatter")
-                if formatter_name and formatter_name in formatters:
-                    handler.setFormatter(formatters[formatter_name])
-
+                options = {}
                 for key, value in handler_config.items():
-                    if key not in ["class", "formatter", "level"]:
+                    if key not in ["class", "formatter", "level", "queue"]:
                         if (
                             isinstance(value, str)
                             and value.startswith("${")
@@ -143,9 +191,26 @@ class LoggerFactory:
                                     f"Warning: Environment variable {env_var} not set for handler {handler_name}"
                                 )
                                 continue
+                        options[key] = value
+
+                if "filename" in options:
+                    Path(options["filename"]).parent.mkdir(parents=True, exist_ok=True)
 
-                        if hasattr(handler, key):
-                            setattr(handler, key, value)
+                # Options are constructor arguments (e.g. a file handler's
+                # filename), or attributes set once the handler is built
+                arguments, attributes = self._split_handler_options(
+                    handler_class, options
+                )
+                handler = handler_class(**arguments)
+                for key, value in attributes.items():
+                    if hasattr(handler, key):
+                        setattr(handler, key, value)
+
+                handler.setLevel(handler_config.get("level", DEFAULT_LOG_LEVEL))
+
+                formatter_name = handler_config.get("formatter")
+                if formatter_name and formatter_name in formatters:
+                    handler.setFormatter(formatters[formatter_name])
 
                 handlers[handler_name] = handler
             except Exception as e:
@@ -161,11 +226,59 @@ class LoggerFactory:
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
 
-        # add configured handlers
+        # add configured handlers, queued ones run on the listener thread
+        self.shutdown()
+        queued: List[logging.Handler] = []
         for handler_name in root_config.get("handlers", []):
-            if handler_name in handlers:
+            if handler_name not in handlers:
+                continue
+            if self._use_queue(env_config["handlers"][handler_name]):
+                queued.append(handlers[handler_name])
+            else:
                 root_logger.addHandler(handlers[handler_name])
 
+        if queued:
+            log_queue: queue.SimpleQueue = queue.SimpleQueue()
+            root_logger.addHandler(InProcessQueueHandler(log_queue))
+            self._listener = QueueListener(
+                log_queue, *queued, respect_handler_level=True
+            )
+            self._listener.start()
+            atexit.register(self.shutdown)
+
+    @staticmethod
+    def _split_handler_options(handler_class: Type, options: Dict) -> Tuple[Dict, Dict]:
+        """
+        Split handler options into constructor arguments and attributes.
+
+        Args:
+            handler_class: Handler class
+            options: Handler options of the config
+
+        Returns:
+            Tuple of (constructor arguments, attributes)
+        """
+        # Imported here: importing this module must stay cheap
+        import inspect
+
+        try:
+            parameters = inspect.signature(handler_class).parameters
+        except (TypeError, ValueError):
+            return {}, options
+        if any(p.kind is p.VAR_KEYWORD for p in parameters.values()):
+            return options, {}
+        arguments = {k: v for k, v in options.items() if k in parameters}
+        attributes = {k: v for k, v in options.items() if k not in parameters}
+        return arguments, attributes
+
+    @staticmethod
+    def _use_queue(handler_config: Dict) -> bool:
+        """Whether a handler runs on the background listener thread"""
+        override = os.environ.get(QUEUE_ENV_VAR)
+        if override is not None:
+            return override.strip().lower() in ("1", "true", "yes")
+        return bool(handler_config.get("queue", False))
+
     def get_logger(self, name: str) -> logging.Logger:
         """
         Get a logger instance with the specified name.
@@ -179,7 +292,15 @@ class LoggerFactory:
         return logging.getLogger(name)
 
 
-_factory = LoggerFactory()
+_factory: Optional[LoggerFactory] = None
+
+
+def get_factory() -> LoggerFactory:
+    """Get the logger factory, configuring logging on first use"""
+    global _factory
+    if _factory is None or LoggerFactory._instance is not _factory:
+        _factory = LoggerFactory()
+    return _factory
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -187,6 +308,8 @@ def get_logger(name: str) -> logging.Logger:
     Get a logger instance with the specified name.
 
     This is the main function that should be used by other modules to get a logger.
+    Logging is configured on the first call rather than when this module is
+    imported.
 
     Args:
         name: Name for the logger, typically __name__ of the module
@@ -194,4 +317,4 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         logging.Logger: Configured logger instance
     """
-    return _factory.get_logger(name)
+    return get_factory().get_logger(name)
@@ -1,5 +1,6 @@
 import os
 import logging
+from datetime import timedelta
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -98,6 +99,13 @@ class MCPRegistry:
         if "description" in mcp_data:
             client_config["description"] = mcp_data["description"]
 
+        # Bound MCP HTTP calls by the configured timeout (seconds)
+        if "timeout" in mcp_data:
+            if mcp_data.get("transport") == "streamable_http":
+                client_config["timeout"] = timedelta(seconds=mcp_data["timeout"])
+            elif mcp_data.get("transport") == "sse":
+                client_config["timeout"] = float(mcp_data["timeout"])
+
         return client_config
 
     def get_mcp_description(self, mcp_name: str) -> str | None:
@@ -153,6 +161,27 @@ class MCPRegistry:
         )
         return filtered_config
 
+    def get_tool_cache_config(self, mcp_names: list[str]) -> dict:
+        """
+        Get the tool result caching settings of specific MCPs.
+
+        Args:
+            mcp_names: List of MCP names to include
+
+        Returns:
+            dict: ``tool_cache`` block of each enabled MCP that defines one
+        """
+        config = self._load_config()
+        env_config = config.get("environments", {}).get(self.environment, {})
+        mcps_config = env_config.get("mcps", {})
+        return {
+            name: mcps_config[name]["tool_cache"]
+            for name in mcp_names
+            if name in mcps_config
+            and mcps_config[name].get("enabled", True)
+            and mcps_config[name].get("tool_cache")
+        }
+
     def get_available_mcps(self) -> list[str]:
         """Get list of available MCP names from configuration"""
         config = self.get_client_config()
@@ -0,0 +1,27 @@
+"""
+Orchestration-specific exceptions
+"""
+
+
+class OrchestrationError(Exception):
+    """Base exception for orchestration-related errors"""
+
+    pass
+
+
+class OperationTimeoutError(OrchestrationError, TimeoutError):
+    """Raised when an operation exceeds the timeout it was awaited with"""
+
+    pass
+
+
+class AgentTimeoutError(OrchestrationError, TimeoutError):
+    """Raised when an agent execution exceeds its configured timeout"""
+
+    pass
+
+
+class WorkflowDeadlineExceeded(OrchestrationError, TimeoutError):
+    """Raised when the overall workflow deadline has passed"""
+
+    pass
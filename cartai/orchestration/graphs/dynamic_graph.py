@@ -1,21 +1,110 @@
+import asyncio
 import os
 import re
 import logging
+from collections import ChainMap
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Dict, Any, Callable, Optional, List, cast
-from pydantic import BaseModel, ConfigDict
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Set,
+    Optional,
+    Tuple,
+    cast,
+)
+from pydantic import BaseModel, ConfigDict, PrivateAttr
 from datetime import datetime
 
 from langgraph.graph import StateGraph, START, END
 from langgraph.graph.state import CompiledStateGraph
+from langgraph.types import StreamMode
 
-from langchain_mcp_adapters.client import MultiServerMCPClient  # type: ignore
 from cartai.mcps.registry.mcp_registry import MCPRegistry
+from cartai.orchestration.runtime.agent_pool import AgentPool, AgentProvider
+from cartai.orchestration.runtime.execution import (
+    RetryPolicy,
+    deadline_scope,
+    run_with_policy,
+)
+from cartai.orchestration.runtime.node_cache import NodeMemoCache
+from cartai.orchestration.runtime.streaming import split_event, stream_node
+from cartai.orchestration.runtime.telemetry import (
+    NodeSpan,
+    RunReport,
+    current_report,
+    estimate_size,
+    report_scope,
+    span_scope,
+)
+from cartai.orchestration.states.compact_state import CompactMLPipelineState
 from cartai.orchestration.states.ml_pipeline_state import MLPipelineState
+from cartai.orchestration.states.reducers import MessageWindow, message_window_scope
+from cartai.utils.blob_store import BlobStore, ResolvingView
 from cartai.utils.yaml_utils import YAMLUtils
 
 logger = logging.getLogger(__name__)
 
+# Keys agents are allowed to update
+STATE_FIELDS = frozenset(MLPipelineState.__annotations__)
+
+# Fields merged by appending, whose values are never offloaded
+APPEND_FIELDS = frozenset({"messages", "error_messages"})
+
+# State schemas selectable with ``execution.state``
+STATE_SCHEMAS: Dict[str, type] = {
+    "typed": MLPipelineState,
+    "compact": CompactMLPipelineState,
+}
+
+# Events buffered by astream before the workflow waits for the consumer
+STREAM_QUEUE_SIZE = 64
+
+
+class _StreamRun:
+    """Node tasks of one astream run, cancelled when the stream is closed"""
+
+    def __init__(self) -> None:
+        self.closed = False
+        self.tasks: Set[asyncio.Task] = set()
+
+    def close(self) -> None:
+        self.closed = True
+        for task in self.tasks:
+            task.cancel()
+
+
+# Run of astream executing the current node, if any
+_stream_run: ContextVar[Optional[_StreamRun]] = ContextVar(
+    "cartai_stream_run", default=None
+)
+
+
+@contextmanager
+def _stream_task_scope() -> Iterator[None]:
+    """Register the running node task with its astream run"""
+    run = _stream_run.get()
+    task = asyncio.current_task()
+    if run is None or task is None:
+        yield
+        return
+
+    # Nodes starting after the stream was closed stop right away
+    if run.closed:
+        task.cancel()
+    run.tasks.add(task)
+    try:
+        yield
+    finally:
+        run.tasks.discard(task)
+
 
 class CartaiGraph(BaseModel):
     """
@@ -31,9 +120,15 @@ class CartaiGraph(BaseModel):
     config_file: Path
     mcp_registry: Optional[MCPRegistry] = None
     environment: str = "development"
+    agent_pool: Optional[AgentPool] = None
 
     _workflow: Optional[StateGraph] = None
     _config: Optional[Dict[str, Any]] = None
+    _compiled: Optional[CompiledStateGraph] = None
+    _message_window: Optional[MessageWindow] = None
+    _blob_store: Optional[BlobStore] = None
+    _providers: Dict[str, AgentProvider] = PrivateAttr(default_factory=dict)
+    _own_pool: Optional[AgentPool] = None
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
@@ -44,9 +139,32 @@ class CartaiGraph(BaseModel):
 
         self._load_and_build_workflow()
 
+    @property
+    def _agent_pool(self) -> AgentPool:
+        """
+        Agent pool of this graph.
+
+        Agents keep state between runs (histories, alerts, stats), so they
+        are only shared with other graphs through an explicit ``agent_pool``
+        (e.g. ``default_agent_pool()``); otherwise the graph has its own.
+        """
+        if self.agent_pool is not None:
+            return self.agent_pool
+        if self._own_pool is None:
+            self._own_pool = AgentPool()
+        return self._own_pool
+
     def _load_and_build_workflow(self):
         """Load configuration and build the workflow"""
         self._config = self._load_config()
+        # Bounds the messages accumulated over a run
+        self._message_window = MessageWindow.from_config(
+            self._get_execution_config().get("messages")
+        )
+        # Opt-in offloading of large state values to a blob store
+        self._blob_store = BlobStore.from_config(
+            self._get_execution_config().get("offload")
+        )
         self._workflow = self._build_workflow()
 
     def _load_config(self) -> Dict:
@@ -65,8 +183,8 @@ class CartaiGraph(BaseModel):
         """Build the LangGraph workflow from configuration"""
         logger.info(f"Building workflow for environment: {self.environment}")
 
-        # Use MLPipelineState for cross-domain workflows
-        workflow = StateGraph(MLPipelineState)
+        # MLPipelineState for cross-domain workflows, or its compact variant
+        workflow = StateGraph(self._state_schema)
 
         # Add agents as nodes
         if self._config is not None:
@@ -86,92 +204,215 @@ class CartaiGraph(BaseModel):
         """Add an agent node to the workflow"""
         agent_name = agent_config["name"]
 
-        # Get the agent class
-        agent_logic = agent_config["logic"]
-        if isinstance(agent_logic, str):
-            agent_class = YAMLUtils.import_class(agent_logic)
-        else:
-            agent_class = agent_logic
+        # Agents (and their MCP clients) are only built on first execution,
+        # and shared with other graphs using the same agent config
+        agent_provider = self._agent_pool.get_provider(agent_config, self.mcp_registry)
+        self._providers[agent_name] = agent_provider
 
-        # Create agent instance with agent-specific MCP client
-        agent_params = agent_config.get("params", {})
-        agent_mcp_names = agent_config.get("mcps", [])
+        # Opt-in memoization of the agent results
+        node_cache = NodeMemoCache.from_config(agent_name, agent_config)
 
-        if self.mcp_registry and agent_mcp_names:
-            # Create filtered MCP client for this agent
-            filtered_config = self.mcp_registry.get_filtered_client_config(
-                agent_mcp_names
-            )
-            if filtered_config:
-                agent_mcp_client = MultiServerMCPClient(filtered_config)
-                agent_instance = agent_class(
-                    mcp_client=agent_mcp_client, **agent_params
-                )
-                logger.info(
-                    f"Agent '{agent_name}' created with MCPs: {agent_mcp_names}"
-                )
-            else:
-                # No valid MCPs found for this agent
-                agent_instance = agent_class(mcp_client=None, **agent_params)
-                logger.warning(
-                    f"Agent '{agent_name}' has no valid MCPs - running without MCP client"
-                )
-        else:
-            # Create agent without MCP client
-            agent_instance = agent_class(mcp_client=None, **agent_params)
-            logger.info(f"Agent '{agent_name}' created without MCP client")
+        # Per-agent timeout and retry policy, with workflow-wide defaults
+        execution_config = self._get_execution_config()
+        timeout_seconds = agent_config.get(
+            "timeout_seconds", execution_config.get("default_timeout_seconds")
+        )
+        retry = RetryPolicy.from_config(
+            agent_config.get("retry", execution_config.get("default_retry"))
+        )
 
         # Wrap the agent run method with error handling and state management
-        wrapped_agent = self._wrap_agent(agent_instance, agent_name)
+        wrapped_agent = self._wrap_agent(
+            agent_provider, agent_name, node_cache, timeout_seconds, retry
+        )
 
         workflow.add_node(agent_name, wrapped_agent)
         logger.info(f"Added agent node: {agent_name}")
 
-    def _wrap_agent(self, agent_instance, agent_name: str) -> Callable:
-        """Wrap agent with error handling and state management"""
+    def _wrap_agent(
+        self,
+        agent_provider: AgentProvider,
+        agent_name: str,
+        node_cache: Optional[NodeMemoCache] = None,
+        timeout_seconds: Optional[float] = None,
+        retry: Optional[RetryPolicy] = None,
+    ) -> Callable:
+        """Wrap agent with error handling, timeouts, retries and memoization"""
 
-        async def wrapped_run(state: MLPipelineState) -> MLPipelineState:
-            logger.info(f"Executing agent: {agent_name}")
+        async def execute(agent_state: Mapping[str, Any]) -> Dict[str, Any]:
+            # Initialized once by the provider, not on every execution
+            agent_instance = await agent_provider.get()
 
-            # Update state metadata
-            state["current_agent"] = agent_name
-            state["timestamp"] = datetime.utcnow().isoformat()
+            # Run the agent
+            return await agent_instance.run(agent_state)
 
-            try:
-                # Initialize agent if needed
-                await agent_instance.initialize()
+        async def wrapped_run(state: MLPipelineState) -> Dict[str, Any]:
+            logger.info(f"Executing agent: {agent_name}")
 
-                # Run the agent
-                updated_state = await agent_instance.run(dict(state))
+            # Record timing and LLM/tool usage of this node
+            report = current_report()
+            span = (
+                report.start_span(agent_name)
+                if report
+                else NodeSpan(name=agent_name, trace_id="")
+            )
+            error: Optional[Exception] = None
 
-                # Merge the updated state
-                state.update(updated_state)
+            # Nodes only return the keys they change; LangGraph merges them
+            delta: Dict[str, Any] = {
+                "current_agent": agent_name,
+                "timestamp": datetime.utcnow().isoformat(),
+            }
+
+            try:
+                with span_scope(span), _stream_task_scope():
+                    # Skip the execution entirely when the inputs are unchanged
+                    cache_key = None
+                    if node_cache:
+                        cache_key = node_cache.key_for(
+                            state, agent_provider.agent_class
+                        )
+                        cached_changes = await node_cache.aget(cache_key)
+                        if cached_changes is not None:
+                            delta.update(cached_changes)
+                            span.cached = True
+                            span.state_delta_bytes = estimate_size(cached_changes)
+                            logger.info(f"Agent {agent_name} served from node cache")
+                            return delta
+
+                    # Agents get a read-only view of the state instead of a copy
+                    agent_state = MappingProxyType(
+                        self._resolving(ChainMap(delta, state))  # type: ignore[arg-type]
+                    )
+
+                    # Bounded by the agent timeout and the workflow deadline
+                    agent_delta = await run_with_policy(
+                        lambda: execute(agent_state),
+                        name=f"Agent {agent_name}",
+                        timeout_seconds=timeout_seconds,
+                        retry=retry,
+                    )
+                    changes = self._validate_delta(agent_name, agent_state, agent_delta)
+                    changes = self._offload(changes)
+                    span.state_delta_bytes = estimate_size(changes)
+
+                    if node_cache and cache_key:
+                        await node_cache.aset(cache_key, changes)
+
+                    delta.update(changes)
 
                 logger.info(f"Agent {agent_name} completed successfully")
 
             except Exception as e:
-                breakpoint()
+                error = e
                 error_msg = f"Agent {agent_name} failed: {str(e)}"
                 logger.error(error_msg, exc_info=True)
 
-                # Add error to state
-                if "error_messages" not in state:
-                    state["error_messages"] = []
-                state["error_messages"].append(error_msg)
+                # Appended to the state by the error_messages reducer
+                delta["error_messages"] = [error_msg]
 
                 # Decide whether to continue or halt
                 if self._should_halt_on_error(agent_name, e):
                     raise
 
-            return state
+            finally:
+                span.end(error)
+                logger.info(
+                    f"Agent {agent_name} span: {span.wall_time_s:.3f}s wall, "
+                    f"{span.llm_calls} LLM calls ({span.llm_latency_s:.3f}s), "
+                    f"{span.tool_calls} tool calls, "
+                    f"{span.tokens_in}/{span.tokens_out} tokens in/out, "
+                    f"{span.state_delta_bytes} state delta bytes"
+                )
+
+            return delta
 
         return wrapped_run
 
+    def _offload(self, changes: Dict[str, Any]) -> Dict[str, Any]:
+        """Replace large values of a node delta by blob references"""
+        if self._blob_store is None:
+            return changes
+        return {
+            key: value if key in APPEND_FIELDS else self._blob_store.offload(value)
+            for key, value in changes.items()
+        }
+
+    def _resolving(self, state: Mapping[str, Any]) -> Mapping[str, Any]:
+        """View of a state loading the blob references it holds on access"""
+        if self._blob_store is None:
+            return state
+        return ResolvingView(state, self._blob_store)
+
+    @staticmethod
+    def _validate_delta(
+        agent_name: str, state: Mapping[str, Any], agent_delta: Any
+    ) -> Dict[str, Any]:
+        """
+        Validate the state updates returned by an agent.
+
+        Unknown keys are dropped, and so are values that are the very objects
+        already in the state (agents returning the whole state), so only real
+        changes are forwarded to LangGraph's reducers.
+
+        Args:
+            agent_name: Name of the agent node
+            state: State the agent was run with
+            agent_delta: Value returned by the agent
+
+        Returns:
+            Validated state updates
+
+        Raises:
+            TypeError: If the agent did not return a mapping
+        """
+        if agent_delta is None:
+            return {}
+        if not isinstance(agent_delta, Mapping):
+            raise TypeError(
+                f"Agent {agent_name} must return a dict of state updates, "
+                f"got {type(agent_delta).__name__}"
+            )
+
+        changes = {}
+        for key, value in agent_delta.items():
+            if key not in STATE_FIELDS:
+                logger.warning(f"Agent {agent_name} returned unknown state key '{key}'")
+            elif key not in state or state[key] is not value:
+                changes[key] = value
+        return changes
+
     def _should_halt_on_error(self, agent_name: str, error: Exception) -> bool:
         """Determine if workflow should halt on this error"""
-        # For now, continue on errors but log them
-        # This could be made configurable per agent
-        return False
+        # Continue on errors unless the agent (or the workflow) opts into halting
+        default = self._get_execution_config().get("halt_on_error", False)
+        return bool(self._get_agent_config(agent_name).get("halt_on_error", default))
+
+    def _get_execution_config(self) -> Dict[str, Any]:
+        """Get the workflow-level execution settings (deadline, defaults)"""
+        if self._config is None:
+            return {}
+        return self._config.get("execution") or {}
+
+    @property
+    def _state_schema(self) -> type:
+        """State schema of the workflow, selected with ``execution.state``"""
+        name = self._get_execution_config().get("state", "typed")
+        if name not in STATE_SCHEMAS:
+            raise ValueError(
+                f"Unknown state representation '{name}', "
+                f"expected one of {sorted(STATE_SCHEMAS)}"
+            )
+        return STATE_SCHEMAS[name]
+
+    def _get_agent_config(self, agent_name: str) -> Dict[str, Any]:
+        """Get the configuration of an agent by name"""
+        if self._config is None:
+            return {}
+        for agent_config in self._config.get("agents", []):
+            if agent_config["name"] == agent_name:
+                return agent_config
+        return {}
 
     def _add_simple_edges(self, workflow: StateGraph):
         """Add simple linear edges between agents"""
@@ -212,7 +453,7 @@ class CartaiGraph(BaseModel):
                     # In a real implementation, this would be more sophisticated
                     try:
                         # Use eval with limited scope for safety
-                        result = eval(route_logic, {"state": state})
+                        result = eval(route_logic, {"state": self._resolving(state)})
                         return route_conditions.get(result, "default")
                     except Exception as e:
                         logger.warning(f"Routing logic failed: {e}")
@@ -224,15 +465,68 @@ class CartaiGraph(BaseModel):
                 from_agent, create_router(logic, conditions), conditions
             )
 
+    async def warmup(self) -> None:
+        """
+        Construct the agents every run executes and fetch their tool lists
+        concurrently.
+
+        Only agents reached from the start through unconditional edges are
+        warmed up: agents behind a conditional route stay lazy, so branches
+        that are not taken never open their MCP connections. Runs once per
+        agent: providers are shared and agents initialize only once, so later
+        calls return immediately. Called at the start of every execution when
+        ``execution.warmup`` is true.
+        """
+        pending = [
+            self._providers[name].warmup()
+            for name in self._unconditional_nodes()
+            if self._providers[name].instance is None
+        ]
+        if pending:
+            logger.info(f"Warming up {len(pending)} agents")
+            await asyncio.gather(*pending)
+
+    def _unconditional_nodes(self) -> List[str]:
+        """Get the agents reached from START through unconditional edges only"""
+        if self._workflow is None:
+            return []
+        successors: Dict[str, List[str]] = {}
+        for source, target in self._workflow.edges:
+            successors.setdefault(source, []).append(target)
+
+        reached: List[str] = []
+        pending = list(successors.get(START, []))
+        while pending:
+            node = pending.pop()
+            if node in reached or node not in self._providers:
+                continue
+            reached.append(node)
+            pending.extend(successors.get(node, []))
+        return reached
+
     def compile(self) -> CompiledStateGraph:
-        """Compile the workflow"""
+        """Compile the workflow, once"""
         if not self._workflow:
             raise RuntimeError("Workflow not built. Call _build_workflow first.")
 
-        return cast(CompiledStateGraph, self._workflow.compile())
+        if self._compiled is None:
+            self._compiled = cast(CompiledStateGraph, self._workflow.compile())
+        return self._compiled
 
-    async def ainvoke(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute the workflow asynchronously"""
+    def _create_initial_state(self, initial_state: Dict[str, Any]) -> Mapping[str, Any]:
+        """
+        Create the initial state of a workflow run.
+
+        Defaults and initial values are merged in a single dict; with the
+        compact representation they are validated once, here.
+
+        Args:
+            initial_state: Initial values for the workflow state
+
+        Returns:
+            MLPipelineState, or CompactMLPipelineState with ``execution.state:
+            compact``
+        """
         # Log MCP registry status
         if self.mcp_registry:
             available_mcps = self.mcp_registry.get_available_mcps()
@@ -242,43 +536,169 @@ class CartaiGraph(BaseModel):
         else:
             logger.info("Executing workflow without MCP registry (mock mode)")
 
-        # Create initial MLPipelineState
-        ml_state = MLPipelineState(
-            messages=[],
-            timestamp=datetime.utcnow().isoformat(),
-            workflow_id=f"workflow_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-            environment=self.environment,
-            experiment_id=initial_state.get("experiment_id", "unknown"),
-            model_name=initial_state.get("model_name", "unknown"),
-            run_id=initial_state.get("run_id", "unknown"),
-            data_quality_status="UNKNOWN",
-            data_quality_score=0.0,
-            model_metrics={},
-            system_health="UNKNOWN",
-            drift_detected=False,
-            drift_alerts=[],
-            drift_score=0.0,
-            policy_violations=[],
-            compliance_status="UNKNOWN",
-            governance_decision="PENDING",
-            cross_domain_decision="PENDING",
-            decision_reason="",
-            actions_taken=[],
-            current_agent="",
-            workflow_stage="STARTING",
-            error_messages=[],
-        )
+        now = datetime.utcnow()
+        values: Dict[str, Any] = {
+            "messages": [],
+            "timestamp": now.isoformat(),
+            "workflow_id": f"workflow_{now.strftime('%Y%m%d_%H%M%S')}",
+            "environment": self.environment,
+            "experiment_id": "unknown",
+            "model_name": "unknown",
+            "run_id": "unknown",
+            "data_quality_status": "UNKNOWN",
+            "data_quality_score": 0.0,
+            "model_metrics": {},
+            "system_health": "UNKNOWN",
+            "drift_detected": False,
+            "drift_alerts": [],
+            "drift_score": 0.0,
+            "policy_violations": [],
+            "compliance_status": "UNKNOWN",
+            "governance_decision": "PENDING",
+            "cross_domain_decision": "PENDING",
+            "decision_reason": "",
+            "actions_taken": [],
+            "current_agent": "",
+            "workflow_stage": "STARTING",
+            "error_messages": [],
+            **initial_state,
+        }
+
+        if self._state_schema is CompactMLPipelineState:
+            return CompactMLPipelineState.from_initial(values)
+        return cast(MLPipelineState, values)
+
+    async def ainvoke(self, initial_state: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute the workflow asynchronously"""
+        result, _ = await self.ainvoke_with_report(initial_state)
+        return result
+
+    async def ainvoke_with_report(
+        self, initial_state: Dict[str, Any]
+    ) -> Tuple[Dict[str, Any], RunReport]:
+        """
+        Execute the workflow and collect per-node spans.
 
-        # Update with initial state values
-        ml_state_dict = dict(ml_state)
-        ml_state_dict.update(initial_state)
-        ml_state = MLPipelineState(**ml_state_dict)  # type: ignore
+        Args:
+            initial_state: Initial values for the workflow state
+
+        Returns:
+            Tuple of the final state and the run report (exportable with
+            ``RunReport.to_otel_json``)
+        """
+        ml_state = self._create_initial_state(initial_state)
 
         # Execute workflow
         compiled_workflow = self.compile()
-        result = await compiled_workflow.ainvoke(ml_state)
+        deadline_seconds = self._get_execution_config().get("deadline_seconds")
+        with (
+            report_scope(RunReport(workflow_id=ml_state["workflow_id"])) as report,
+            deadline_scope(deadline_seconds),
+            message_window_scope(self._message_window),
+        ):
+            if self._get_execution_config().get("warmup", False):
+                await self.warmup()
+            result = await compiled_workflow.ainvoke(ml_state)
+
+        slowest = report.slowest()
+        logger.info(
+            f"Workflow {report.workflow_id} finished in {report.wall_time_s:.3f}s"
+            + (f" - slowest node: {slowest.name}" if slowest else "")
+        )
 
-        return dict(result)
+        # Offloaded values are loaded back in the final state
+        return dict(self._resolving(result)), report
+
+    async def astream(
+        self, initial_state: Dict[str, Any], stream_tokens: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute the workflow and yield intermediate results as they happen.
+
+        Events are dictionaries with a ``type`` key:
+        - ``update``: ``node`` finished; ``delta`` holds the state keys it wrote
+          (large values are ``BlobRef``s when ``execution.offload`` is enabled)
+        - ``token``: LLM token streamed by ``node``; ``content`` holds the text
+        - ``custom``: ``data`` written by ``node`` with
+          :func:`~cartai.orchestration.runtime.streaming.emit_event`
+          (``node`` is empty for data written with LangGraph's stream writer)
+        - ``end``: final event with the complete ``state`` and the run ``report``
+
+        Args:
+            initial_state: Initial values for the workflow state
+            stream_tokens: Whether to stream LLM tokens from agents
+
+        Yields:
+            Workflow events
+        """
+        ml_state = self._create_initial_state(initial_state)
+
+        stream_modes: List[StreamMode] = ["updates", "values", "custom"]
+        if stream_tokens:
+            stream_modes.append("messages")
+
+        compiled_workflow = self.compile()
+        deadline_seconds = self._get_execution_config().get("deadline_seconds")
+        report = RunReport(workflow_id=ml_state["workflow_id"])
+        events: asyncio.Queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        done, run = object(), _StreamRun()
+
+        # The workflow runs in its own task, so its scopes never leak into
+        # the consumer between events; closing the stream cancels its nodes
+        async def produce() -> None:
+            _stream_run.set(run)
+            try:
+                with (
+                    report_scope(report),
+                    deadline_scope(deadline_seconds),
+                    message_window_scope(self._message_window),
+                ):
+                    if self._get_execution_config().get("warmup", False):
+                        await self.warmup()
+                    async for event in compiled_workflow.astream(
+                        ml_state, stream_mode=stream_modes
+                    ):
+                        await events.put(event)
+            finally:
+                await events.put(done)
+
+        producer = asyncio.create_task(produce())
+        final_state: Dict[str, Any] = dict(ml_state)
+        try:
+            while (event := await events.get()) is not done:
+                mode, chunk = cast(Tuple[str, Any], event)
+                if mode == "values":
+                    final_state = dict(chunk)
+                elif mode == "updates":
+                    for node, delta in chunk.items():
+                        yield {"type": "update", "node": node, "delta": delta}
+                elif mode == "messages":
+                    message, metadata = chunk
+                    if message.content:
+                        yield {
+                            "type": "token",
+                            "node": stream_node(metadata),
+                            "content": message.content,
+                        }
+                elif mode == "custom":
+                    node, data = split_event(chunk)
+                    yield {"type": "custom", "node": node, "data": data}
+            # Re-raises the workflow error, if any
+            await producer
+        finally:
+            if not producer.done():
+                # Cancelling the nodes, not the producer, lets LangGraph
+                # finish the run and clean up its own tasks
+                run.close()
+                while await events.get() is not done:
+                    pass
+                await asyncio.gather(producer, return_exceptions=True)
+
+        yield {
+            "type": "end",
+            "state": dict(self._resolving(final_state)),
+            "report": report,
+        }
 
     def get_workflow_info(self) -> Dict[str, Any]:
         """Get information about the configured workflow"""
@@ -0,0 +1,19 @@
+"""Runtime support for orchestration workflows (caching, telemetry, execution control)"""
+
+from .agent_pool import AgentPool, AgentProvider
+from .execution import Deadline, RetryPolicy, current_deadline
+from .node_cache import NodeMemoCache
+from .streaming import emit_event
+from .telemetry import NodeSpan, RunReport
+
+__all__ = [
+    "AgentPool",
+    "AgentProvider",
+    "Deadline",
+    "NodeMemoCache",
+    "NodeSpan",
+    "RetryPolicy",
+    "RunReport",
+    "current_deadline",
+    "emit_event",
+]
@@ -0,0 +1,289 @@
+"""Lazy construction and sharing of agent instances across workflows"""
+
+import asyncio
+import inspect
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Mapping, Optional
+
+from langchain_mcp_adapters.client import MultiServerMCPClient  # type: ignore
+
+from cartai.mcps.registry.mcp_registry import MCPRegistry
+from cartai.utils.disk_cache import stable_hash
+from cartai.utils.yaml_utils import YAMLUtils
+
+logger = logging.getLogger(__name__)
+
+MCPClientFactory = Callable[[Dict[str, Any]], Any]
+
+DEFAULT_MAX_PROVIDERS = 64
+
+
+class AgentProvider:
+    """
+    Builds an agent (and its MCP client) on first use.
+
+    Importing the agent class, resolving its MCP configuration and creating
+    the client are deferred until the node first executes, so agents behind
+    conditional routes that are never taken cost nothing.
+    """
+
+    def __init__(
+        self,
+        agent_config: Mapping[str, Any],
+        mcp_registry: Optional[MCPRegistry] = None,
+        mcp_client_factory: Optional[MCPClientFactory] = None,
+        param_overrides: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        """
+        Initialize the provider.
+
+        Args:
+            agent_config: Agent configuration from the workflow YAML
+            mcp_registry: Registry used to resolve the agent's MCPs
+            mcp_client_factory: Builds the MCP client from the filtered client
+                config; defaults to ``MultiServerMCPClient``
+            param_overrides: Agent params replacing those of the YAML, e.g.
+                objects that cannot be written in YAML such as a chat model
+        """
+        self.agent_config = agent_config
+        self.mcp_registry = mcp_registry
+        self.mcp_client_factory = mcp_client_factory or MultiServerMCPClient
+        self.param_overrides = dict(param_overrides or {})
+        self._agent_class: Optional[type] = None
+        self._instance: Optional[Any] = None
+        self._lock = asyncio.Lock()
+
+    @property
+    def agent_name(self) -> str:
+        """Name of the agent in the workflow config"""
+        return self.agent_config["name"]
+
+    @property
+    def agent_class(self) -> type:
+        """Agent class, imported on first access"""
+        if self._agent_class is None:
+            agent_logic = self.agent_config["logic"]
+            if isinstance(agent_logic, str):
+                self._agent_class = YAMLUtils.import_class(agent_logic)
+            else:
+                self._agent_class = agent_logic
+        return self._agent_class
+
+    @property
+    def instance(self) -> Optional[Any]:
+        """Agent instance if it has been constructed, None otherwise"""
+        return self._instance
+
+    async def get(self) -> Any:
+        """Get the agent instance, constructing and initializing it on the first call"""
+        if self._instance is None:
+            async with self._lock:
+                if self._instance is None:
+                    instance = self._create()
+                    initialize = getattr(instance, "initialize", None)
+                    if initialize is not None:
+                        await initialize()
+                    self._instance = instance
+        return self._instance
+
+    async def warmup(self) -> None:
+        """
+        Construct and initialize the agent ahead of its first execution.
+
+        Failures are logged rather than raised; they surface again when the
+        node executes, under its own error handling.
+        """
+        try:
+            await self.get()
+        except Exception as e:
+            logger.warning(f"Warmup of agent '{self.agent_name}' failed: {str(e)}")
+
+    @staticmethod
+    def _accepts_node_name(agent_class: type) -> bool:
+        """Whether the agent constructor takes the workflow node name"""
+        try:
+            parameters = inspect.signature(agent_class).parameters
+        except (TypeError, ValueError):
+            return False
+        return "node_name" in parameters or any(
+            p.kind is p.VAR_KEYWORD for p in parameters.values()
+        )
+
+    def _create(self) -> Any:
+        """Create the agent instance with its agent-specific MCP client"""
+        agent_name = self.agent_name
+        agent_class = self.agent_class
+        agent_params = {**self.agent_config.get("params", {}), **self.param_overrides}
+        if self._accepts_node_name(agent_class):
+            agent_params.setdefault("node_name", agent_name)
+        agent_mcp_names = self.agent_config.get("mcps", [])
+
+        # Only the tools the agent needs are bound to its LLM
+        if self.agent_config.get("tools"):
+            agent_params["tool_filter"] = self.agent_config["tools"]
+
+        if self.mcp_registry and agent_mcp_names:
+            # Create filtered MCP client for this agent
+            filtered_config = self.mcp_registry.get_filtered_client_config(
+                agent_mcp_names
+            )
+            if filtered_config:
+                agent_mcp_client = self.mcp_client_factory(filtered_config)
+                # Results of read-only tools are shared with the other agents
+                tool_cache_config = self.mcp_registry.get_tool_cache_config(
+                    list(filtered_config)
+                )
+                if tool_cache_config:
+                    agent_params["tool_cache_policies"] = tool_cache_config
+                agent_instance = agent_class(
+                    mcp_client=agent_mcp_client, **agent_params
+                )
+                logger.info(
+                    f"Agent '{agent_name}' created with MCPs: {agent_mcp_names}"
+                )
+            else:
+                # No valid MCPs found for this agent
+                agent_instance = agent_class(mcp_client=None, **agent_params)
+                logger.warning(
+                    f"Agent '{agent_name}' has no valid MCPs - running without MCP client"
+                )
+        else:
+            # Create agent without MCP client
+            agent_instance = agent_class(mcp_client=None, **agent_params)
+            logger.info(f"Agent '{agent_name}' created without MCP client")
+
+        return agent_instance
+
+
+class AgentPool:
+    """
+    Registry of agent providers keyed on their configuration.
+
+    Graphs referencing the same agent config (logic, params, MCPs and MCP
+    registry) share a single provider, hence a single agent instance and MCP
+    client. Agents with param overrides are only shared under the same name.
+
+    Shared agents share their state too (metrics history, alerts, stats):
+    only pass the same pool to graphs meant to share it. Beyond
+    ``max_providers``, the least recently used providers are evicted.
+    """
+
+    def __init__(
+        self,
+        mcp_client_factory: Optional[MCPClientFactory] = None,
+        param_overrides: Optional[Mapping[str, Mapping[str, Any]]] = None,
+        max_providers: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            mcp_client_factory: Builds the MCP clients of the agents; defaults
+                to ``MultiServerMCPClient`` (e.g. in-process servers for tests)
+            param_overrides: Agent params replacing those of the YAML, keyed
+                by agent name
+            max_providers: Maximum number of providers kept; None is unbounded
+        """
+        self.mcp_client_factory = mcp_client_factory
+        self.param_overrides = dict(param_overrides or {})
+        self.max_providers = max_providers
+        self._providers: OrderedDict[str, AgentProvider] = OrderedDict()
+
+    @staticmethod
+    def key_for(
+        agent_config: Mapping[str, Any], mcp_registry: Optional[MCPRegistry] = None
+    ) -> str:
+        """Compute the sharing key of an agent config"""
+        return stable_hash(
+            {
+                "logic": str(agent_config["logic"]),
+                "params": agent_config.get("params", {}),
+                "mcps": agent_config.get("mcps", []),
+                "tools": agent_config.get("tools"),
+                "registry": (
+                    [str(mcp_registry.mcp_config_path), mcp_registry.environment]
+                    if mcp_registry
+                    else None
+                ),
+            }
+        )
+
+    def get_provider(
+        self,
+        agent_config: Mapping[str, Any],
+        mcp_registry: Optional[MCPRegistry] = None,
+    ) -> AgentProvider:
+        """
+        Get the provider for an agent config, creating it if needed.
+
+        Args:
+            agent_config: Agent configuration from the workflow YAML
+            mcp_registry: Registry used to resolve the agent's MCPs
+
+        Returns:
+            Shared AgentProvider
+        """
+        key = self._pool_key(agent_config, mcp_registry)
+        if key not in self._providers:
+            self._providers[key] = AgentProvider(
+                agent_config,
+                mcp_registry,
+                mcp_client_factory=self.mcp_client_factory,
+                param_overrides=self.param_overrides.get(agent_config["name"]),
+            )
+            self._evict()
+        else:
+            logger.debug(f"Reusing agent provider for '{agent_config['name']}'")
+            self._providers.move_to_end(key)
+        return self._providers[key]
+
+    def evict(
+        self,
+        agent_config: Mapping[str, Any],
+        mcp_registry: Optional[MCPRegistry] = None,
+    ) -> bool:
+        """
+        Forget the provider of an agent config (and its agent instance).
+
+        Graphs already holding the provider keep using it.
+
+        Returns:
+            Whether a provider was removed
+        """
+        key = self._pool_key(agent_config, mcp_registry)
+        return self._providers.pop(key, None) is not None
+
+    def clear(self) -> None:
+        """Forget all providers (and their agent instances)"""
+        self._providers.clear()
+
+    def _pool_key(
+        self, agent_config: Mapping[str, Any], mcp_registry: Optional[MCPRegistry]
+    ) -> str:
+        """Key of an agent's provider in this pool"""
+        key = self.key_for(agent_config, mcp_registry)
+        if agent_config["name"] in self.param_overrides:
+            # Overrides hold objects (e.g. models) that cannot be hashed:
+            # agents with their own overrides get their own provider
+            key = f"{key}:{agent_config['name']}"
+        return key
+
+    def _evict(self) -> None:
+        """Drop the least recently used providers beyond max_providers"""
+        if self.max_providers is None:
+            return
+        while len(self._providers) > self.max_providers:
+            key, provider = self._providers.popitem(last=False)
+            logger.debug(f"Evicted agent provider for '{provider.agent_name}'")
+
+    def __len__(self) -> int:
+        return len(self._providers)
+
+
+_default_pool = AgentPool(max_providers=DEFAULT_MAX_PROVIDERS)
+
+
+def default_agent_pool() -> AgentPool:
+    """Get the process-wide agent pool, for graphs meant to share agents"""
+    return _default_pool
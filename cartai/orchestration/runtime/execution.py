@@ -0,0 +1,219 @@
+"""Timeouts, retries and deadline propagation for agent executions"""
+
+import asyncio
+import logging
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from cartai.orchestration.exceptions import (
+    AgentTimeoutError,
+    OperationTimeoutError,
+    WorkflowDeadlineExceeded,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class Deadline:
+    """Absolute point in time by which a workflow must finish"""
+
+    def __init__(self, timeout_seconds: float) -> None:
+        """
+        Initialize the deadline.
+
+        Args:
+            timeout_seconds: Seconds from now until the deadline expires
+        """
+        self.timeout_seconds = timeout_seconds
+        self.expires_at = time.monotonic() + timeout_seconds
+
+    def remaining(self) -> float:
+        """Seconds left until the deadline (never negative)"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return self.remaining() <= 0.0
+
+
+_current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "cartai_deadline", default=None
+)
+
+
+def current_deadline() -> Optional[Deadline]:
+    """Get the deadline of the workflow executing in this context"""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(timeout_seconds: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """
+    Apply a workflow deadline to everything awaited within the scope.
+
+    Args:
+        timeout_seconds: Seconds until the deadline; None disables it
+    """
+    deadline = Deadline(timeout_seconds) if timeout_seconds else None
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
+
+
+def bounded_timeout(timeout_seconds: Optional[float] = None) -> Optional[float]:
+    """
+    Clamp a timeout to the time left before the current workflow deadline.
+
+    Args:
+        timeout_seconds: Requested timeout; None means unbounded
+
+    Returns:
+        Effective timeout, or None if neither a timeout nor a deadline applies
+
+    Raises:
+        WorkflowDeadlineExceeded: If the deadline has already passed
+    """
+    deadline = current_deadline()
+    if deadline is None:
+        return timeout_seconds
+    if deadline.expired():
+        raise WorkflowDeadlineExceeded("Workflow deadline exceeded")
+    remaining = deadline.remaining()
+    return remaining if timeout_seconds is None else min(timeout_seconds, remaining)
+
+
+async def with_deadline(
+    awaitable: Awaitable[T], timeout_seconds: Optional[float] = None
+) -> T:
+    """
+    Await an operation bounded by a timeout and the current workflow deadline.
+
+    Args:
+        awaitable: Operation to await
+        timeout_seconds: Optional timeout specific to this operation
+
+    Returns:
+        Result of the operation
+
+    Raises:
+        WorkflowDeadlineExceeded: If the workflow deadline is hit first
+        OperationTimeoutError: If the operation timeout is hit first
+    """
+    try:
+        timeout = bounded_timeout(timeout_seconds)
+    except WorkflowDeadlineExceeded:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise
+
+    scope = asyncio.timeout(timeout)
+    try:
+        async with scope:
+            return await awaitable
+    except TimeoutError as e:
+        # Timeouts raised by the operation itself propagate unchanged
+        if not scope.expired():
+            raise
+        deadline = current_deadline()
+        if deadline is not None and deadline.expired():
+            raise WorkflowDeadlineExceeded("Workflow deadline exceeded") from e
+        raise OperationTimeoutError(f"Timed out after {timeout_seconds}s") from e
+
+
+@dataclass
+class RetryPolicy:
+    """Retry with exponential backoff and jitter"""
+
+    max_attempts: int = 1
+    backoff_seconds: float = 1.0
+    backoff_multiplier: float = 2.0
+    max_backoff_seconds: float = 30.0
+    jitter: float = 0.1
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "RetryPolicy":
+        """
+        Build a retry policy from the ``retry`` block of an agent config.
+
+        Args:
+            config: Retry settings, or an integer number of attempts
+
+        Returns:
+            RetryPolicy instance
+        """
+        if not config:
+            return cls()
+        if isinstance(config, int):
+            return cls(max_attempts=config)
+        return cls(**{k: v for k, v in config.items() if k in cls.__annotations__})
+
+    def delay(self, attempt: int) -> float:
+        """Backoff delay in seconds after the given (1-based) failed attempt"""
+        delay = min(
+            self.backoff_seconds * self.backoff_multiplier ** (attempt - 1),
+            self.max_backoff_seconds,
+        )
+        return delay * (1 + random.uniform(-self.jitter, self.jitter))
+
+
+async def run_with_policy(
+    operation: Callable[[], Awaitable[T]],
+    name: str,
+    timeout_seconds: Optional[float] = None,
+    retry: Optional[RetryPolicy] = None,
+) -> T:
+    """
+    Run an operation with a per-attempt timeout, retries and the workflow deadline.
+
+    Args:
+        operation: Factory creating a fresh awaitable for each attempt
+        name: Name used in logs and errors
+        timeout_seconds: Timeout of each attempt
+        retry: Retry policy; a single attempt when omitted
+
+    Returns:
+        Result of the first successful attempt
+
+    Raises:
+        AgentTimeoutError: If the last attempt timed out
+        WorkflowDeadlineExceeded: If the workflow deadline passed
+        Exception: The error of the last failed attempt
+    """
+    retry = retry or RetryPolicy()
+
+    for attempt in range(1, retry.max_attempts + 1):
+        try:
+            return await with_deadline(operation(), timeout_seconds)
+        except WorkflowDeadlineExceeded:
+            raise
+        except OperationTimeoutError as e:
+            error: Exception = AgentTimeoutError(
+                f"{name} timed out after {timeout_seconds}s"
+            )
+            error.__cause__ = e
+        except Exception as e:
+            error = e
+
+        if attempt >= retry.max_attempts:
+            raise error
+
+        delay = retry.delay(attempt)
+        deadline = current_deadline()
+        if deadline is not None and deadline.remaining() <= delay:
+            raise error
+
+        logger.warning(
+            f"{name} attempt {attempt}/{retry.max_attempts} failed: {str(error)} "
+            f"- retrying in {delay:.2f}s"
+        )
+        await asyncio.sleep(delay)
+
+    raise RuntimeError(f"{name}: retry policy allows no attempts")
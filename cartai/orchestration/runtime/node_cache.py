@@ -0,0 +1,133 @@
+"""Opt-in memoization of agent node results keyed on their input state"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Mapping, Optional
+
+from cartai.utils.disk_cache import DEFAULT_CACHE_DIR, DiskCache, stable_hash
+
+logger = logging.getLogger(__name__)
+
+# State fields that change on every execution and never describe agent inputs
+VOLATILE_STATE_FIELDS = frozenset(
+    {"messages", "timestamp", "workflow_id", "current_agent", "error_messages"}
+)
+
+
+class NodeMemoCache:
+    """
+    Memo cache for a single agent node.
+
+    The cache key is a stable hash of the agent's declared input fields taken
+    from the state, plus the agent configuration (logic, params and MCPs), so
+    a config change invalidates previous results. Cached values are the state
+    keys the agent changed, which are merged back into the state on a hit.
+
+    Enabled per agent in the workflow YAML:
+
+        cache:
+          enabled: true
+          inputs: ["experiment_id", "run_id"]  # defaults to agent.input_fields
+          ttl_seconds: 3600
+          max_entries: 256
+          max_size_mb: 64
+          path: ".cartai/cache/nodes.sqlite"
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        agent_config: Mapping[str, Any],
+        store: DiskCache,
+        input_fields: Optional[Iterable[str]] = None,
+    ) -> None:
+        """
+        Initialize the node cache.
+
+        Args:
+            agent_name: Name of the agent node
+            agent_config: Agent configuration from the workflow YAML
+            store: Backing on-disk store
+            input_fields: State fields the agent reads; overrides agent defaults
+        """
+        self.agent_name = agent_name
+        self.store = store
+        self.input_fields = tuple(input_fields) if input_fields else None
+        self._config_hash = stable_hash(
+            {
+                "logic": str(agent_config.get("logic")),
+                "params": agent_config.get("params", {}),
+                "mcps": agent_config.get("mcps", []),
+                "tools": agent_config.get("tools"),
+            }
+        )
+
+    @classmethod
+    def from_config(
+        cls, agent_name: str, agent_config: Mapping[str, Any]
+    ) -> Optional["NodeMemoCache"]:
+        """
+        Build a node cache from an agent config, if caching is enabled.
+
+        Args:
+            agent_name: Name of the agent node
+            agent_config: Agent configuration from the workflow YAML
+
+        Returns:
+            NodeMemoCache instance, or None when caching is disabled
+        """
+        cache_config = agent_config.get("cache")
+        if not cache_config:
+            return None
+        if cache_config is True:
+            cache_config = {}
+        if not cache_config.get("enabled", True):
+            return None
+
+        max_size_mb = cache_config.get("max_size_mb")
+        store = DiskCache(
+            path=Path(cache_config.get("path", DEFAULT_CACHE_DIR / "nodes.sqlite")),
+            namespace=f"node:{agent_name}",
+            ttl_seconds=cache_config.get("ttl_seconds", 3600),
+            max_entries=cache_config.get("max_entries", 256),
+            max_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+        )
+        logger.info(f"Node cache enabled for agent '{agent_name}'")
+        return cls(agent_name, agent_config, store, cache_config.get("inputs"))
+
+    def key_for(self, state: Mapping[str, Any], agent: Any = None) -> str:
+        """
+        Compute the cache key for an agent execution.
+
+        Args:
+            state: Current workflow state
+            agent: Agent class or instance whose ``input_fields`` are the fallback
+
+        Returns:
+            Cache key
+        """
+        fields = self.input_fields or getattr(agent, "input_fields", None)
+        if fields:
+            inputs = {field: state.get(field) for field in fields}
+        else:
+            inputs = {k: v for k, v in state.items() if k not in VOLATILE_STATE_FIELDS}
+        return stable_hash({"config": self._config_hash, "inputs": inputs})
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the cached state changes for a key, if present"""
+        result = await self.store.aget(key)
+        if result is not None:
+            logger.info(f"Node cache hit for agent '{self.agent_name}'")
+        return result
+
+    async def aset(self, key: str, changes: Mapping[str, Any]) -> None:
+        """
+        Store the state changes produced by an agent execution.
+
+        Args:
+            key: Cache key computed before the execution
+            changes: State keys the agent changed
+        """
+        await self.store.aset(
+            key, {k: v for k, v in changes.items() if k not in VOLATILE_STATE_FIELDS}
+        )
@@ -0,0 +1,40 @@
+"""Custom stream events written by workflow nodes"""
+
+from typing import Any, Mapping, Tuple
+
+from langgraph.config import get_config, get_stream_writer
+
+
+def emit_event(data: Any) -> None:
+    """
+    Write data to the workflow stream, tagged with the running node.
+
+    LangGraph's custom stream events carry no metadata, so the payload is a
+    ``{"node": ..., "data": ...}`` dictionary that ``CartaiGraph.astream``
+    unwraps. Does nothing outside a workflow run or when custom events are
+    not streamed.
+
+    Args:
+        data: Event data, e.g. ``{"progress": 0.5}``
+    """
+    try:
+        metadata = get_config().get("metadata", {})
+    except RuntimeError:
+        return
+    get_stream_writer()({"node": stream_node(metadata), "data": data})
+
+
+def stream_node(metadata: Mapping[str, Any]) -> str:
+    """Resolve the workflow node from run metadata (also from subgraphs)"""
+    namespace = metadata.get("langgraph_checkpoint_ns", "")
+    if namespace:
+        return namespace.split("|")[0].split(":")[0]
+    return metadata.get("langgraph_node", "")
+
+
+def split_event(chunk: Any) -> Tuple[str, Any]:
+    """Split a custom stream chunk into its node and data"""
+    if isinstance(chunk, dict) and chunk.keys() == {"node", "data"}:
+        return chunk["node"], chunk["data"]
+    # Written with LangGraph's stream writer directly
+    return "", chunk
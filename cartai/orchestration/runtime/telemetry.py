@@ -0,0 +1,314 @@
+"""Per-node spans and run reports for orchestration workflows"""
+
+import json
+import logging
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+from uuid import UUID
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.tracers.context import register_configure_hook
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENTATION_SCOPE = "cartai.orchestration"
+
+
+def estimate_size(obj: Any) -> int:
+    """Estimate the serialized size of a state value in bytes"""
+    try:
+        return len(json.dumps(obj, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(obj).encode("utf-8"))
+
+
+@dataclass
+class NodeSpan:
+    """Timing and usage record of a single agent node execution"""
+
+    name: str
+    trace_id: str
+    span_id: str = field(default_factory=lambda: os.urandom(8).hex())
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    llm_calls: int = 0
+    llm_latency_s: float = 0.0
+    tool_calls: int = 0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    state_delta_bytes: int = 0
+    cached: bool = False
+    status: str = "OK"
+    error: Optional[str] = None
+
+    @property
+    def wall_time_s(self) -> float:
+        """Wall time of the node in seconds (up to now if still running)"""
+        end = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end - self.start_time_ns) / 1e9
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        """Close the span, optionally recording an error"""
+        self.end_time_ns = time.time_ns()
+        if error is not None:
+            self.status = "ERROR"
+            self.error = str(error)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the span to a plain dictionary"""
+        data = asdict(self)
+        data["wall_time_s"] = round(self.wall_time_s, 6)
+        return data
+
+
+@dataclass
+class RunReport:
+    """Collection of node spans for one workflow run"""
+
+    workflow_id: str
+    trace_id: str = field(default_factory=lambda: os.urandom(16).hex())
+    start_time_ns: int = field(default_factory=time.time_ns)
+    end_time_ns: Optional[int] = None
+    spans: List[NodeSpan] = field(default_factory=list)
+
+    def start_span(self, name: str) -> NodeSpan:
+        """Open a new node span attached to this run"""
+        span = NodeSpan(name=name, trace_id=self.trace_id)
+        self.spans.append(span)
+        return span
+
+    def end(self) -> None:
+        """Mark the run as finished"""
+        self.end_time_ns = time.time_ns()
+
+    @property
+    def wall_time_s(self) -> float:
+        """Total wall time of the run in seconds"""
+        end = self.end_time_ns if self.end_time_ns is not None else time.time_ns()
+        return (end - self.start_time_ns) / 1e9
+
+    def slowest(self) -> Optional[NodeSpan]:
+        """Get the node span with the highest wall time"""
+        if not self.spans:
+            return None
+        return max(self.spans, key=lambda span: span.wall_time_s)
+
+    def totals(self) -> Dict[str, Any]:
+        """Aggregate usage across all nodes"""
+        return {
+            "wall_time_s": round(self.wall_time_s, 6),
+            "llm_calls": sum(span.llm_calls for span in self.spans),
+            "llm_latency_s": round(sum(span.llm_latency_s for span in self.spans), 6),
+            "tool_calls": sum(span.tool_calls for span in self.spans),
+            "tokens_in": sum(span.tokens_in for span in self.spans),
+            "tokens_out": sum(span.tokens_out for span in self.spans),
+            "state_delta_bytes": sum(span.state_delta_bytes for span in self.spans),
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the report to a plain dictionary"""
+        slowest = self.slowest()
+        return {
+            "workflow_id": self.workflow_id,
+            "trace_id": self.trace_id,
+            "totals": self.totals(),
+            "slowest_node": slowest.name if slowest else None,
+            "spans": [span.to_dict() for span in self.spans],
+        }
+
+    def to_otel(self, service_name: str = "cartai") -> Dict[str, Any]:
+        """
+        Export the report in the OTLP/JSON trace format.
+
+        The workflow run is the root span and each node execution a child span,
+        so the output can be posted to any OTLP/HTTP collector (``/v1/traces``).
+
+        Args:
+            service_name: Value of the ``service.name`` resource attribute
+
+        Returns:
+            OTLP ``ExportTraceServiceRequest`` as a dictionary
+        """
+        root_span_id = os.urandom(8).hex()
+        end_time_ns = self.end_time_ns or time.time_ns()
+
+        otel_spans = [
+            {
+                "traceId": self.trace_id,
+                "spanId": root_span_id,
+                "name": f"workflow {self.workflow_id}",
+                "kind": 1,
+                "startTimeUnixNano": str(self.start_time_ns),
+                "endTimeUnixNano": str(end_time_ns),
+                "attributes": _otel_attributes(
+                    {"cartai.workflow_id": self.workflow_id, **self.totals()}
+                ),
+                "status": {"code": 1},
+            }
+        ]
+        for span in self.spans:
+            otel_spans.append(
+                {
+                    "traceId": self.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": root_span_id,
+                    "name": f"agent {span.name}",
+                    "kind": 1,
+                    "startTimeUnixNano": str(span.start_time_ns),
+                    "endTimeUnixNano": str(span.end_time_ns or end_time_ns),
+                    "attributes": _otel_attributes(
+                        {
+                            "cartai.agent": span.name,
+                            "cartai.cached": span.cached,
+                            "cartai.llm.calls": span.llm_calls,
+                            "cartai.llm.latency_s": span.llm_latency_s,
+                            "cartai.tool.calls": span.tool_calls,
+                            "gen_ai.usage.input_tokens": span.tokens_in,
+                            "gen_ai.usage.output_tokens": span.tokens_out,
+                            "cartai.state.delta_bytes": span.state_delta_bytes,
+                        }
+                    ),
+                    "status": (
+                        {"code": 2, "message": span.error or ""}
+                        if span.status == "ERROR"
+                        else {"code": 1}
+                    ),
+                }
+            )
+
+        return {
+            "resourceSpans": [
+                {
+                    "resource": {
+                        "attributes": _otel_attributes({"service.name": service_name})
+                    },
+                    "scopeSpans": [
+                        {"scope": {"name": INSTRUMENTATION_SCOPE}, "spans": otel_spans}
+                    ],
+                }
+            ]
+        }
+
+    def to_otel_json(self, service_name: str = "cartai", **kwargs: Any) -> str:
+        """Serialize :meth:`to_otel` to a JSON string"""
+        return json.dumps(self.to_otel(service_name), **kwargs)
+
+
+def _otel_attributes(values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a flat dictionary to OTLP typed key/value attributes"""
+    attributes = []
+    for key, value in values.items():
+        typed: Dict[str, Any]
+        if isinstance(value, bool):
+            typed = {"boolValue": value}
+        elif isinstance(value, int):
+            typed = {"intValue": str(value)}
+        elif isinstance(value, float):
+            typed = {"doubleValue": value}
+        else:
+            typed = {"stringValue": str(value)}
+        attributes.append({"key": key, "value": typed})
+    return attributes
+
+
+class SpanCallbackHandler(BaseCallbackHandler):
+    """LangChain callback handler recording LLM and tool usage into a span"""
+
+    run_inline = True
+
+    def __init__(self, span: NodeSpan) -> None:
+        self.span = span
+        self._llm_starts: Dict[UUID, float] = {}
+
+    def on_llm_start(
+        self, serialized: Dict[str, Any], prompts: List[str], *, run_id: UUID, **kwargs
+    ) -> None:
+        self._llm_starts[run_id] = time.perf_counter()
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: List, *, run_id: UUID, **kwargs
+    ) -> None:
+        self._llm_starts[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        started = self._llm_starts.pop(run_id, None)
+        if started is not None:
+            self.span.llm_latency_s += time.perf_counter() - started
+        self.span.llm_calls += 1
+
+        tokens_in, tokens_out = _token_usage(response)
+        self.span.tokens_in += tokens_in
+        self.span.tokens_out += tokens_out
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        started = self._llm_starts.pop(run_id, None)
+        if started is not None:
+            self.span.llm_latency_s += time.perf_counter() - started
+
+    def on_tool_start(
+        self, serialized: Dict[str, Any], input_str: str, *, run_id: UUID, **kwargs
+    ) -> None:
+        self.span.tool_calls += 1
+
+
+def _token_usage(response: LLMResult) -> tuple[int, int]:
+    """Extract input/output token counts from an LLM result"""
+    tokens_in = tokens_out = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(
+                getattr(generation, "message", None), "usage_metadata", None
+            )
+            if usage:
+                tokens_in += usage.get("input_tokens", 0)
+                tokens_out += usage.get("output_tokens", 0)
+
+    if not tokens_in and not tokens_out and response.llm_output:
+        usage = response.llm_output.get("token_usage") or {}
+        tokens_in = usage.get("prompt_tokens", 0)
+        tokens_out = usage.get("completion_tokens", 0)
+
+    return tokens_in, tokens_out
+
+
+_current_report: ContextVar[Optional[RunReport]] = ContextVar(
+    "cartai_run_report", default=None
+)
+_span_handler: ContextVar[Optional[SpanCallbackHandler]] = ContextVar(
+    "cartai_span_handler", default=None
+)
+
+# Every LangChain runnable started while a span is active reports into it,
+# including LLM and tool calls nested inside agents.
+register_configure_hook(_span_handler, inheritable=True)
+
+
+def current_report() -> Optional[RunReport]:
+    """Get the run report of the workflow executing in this context"""
+    return _current_report.get()
+
+
+@contextmanager
+def report_scope(report: RunReport) -> Iterator[RunReport]:
+    """Make a run report current for the duration of a workflow run"""
+    token = _current_report.set(report)
+    try:
+        yield report
+    finally:
+        report.end()
+        _current_report.reset(token)
+
+
+@contextmanager
+def span_scope(span: NodeSpan) -> Iterator[NodeSpan]:
+    """Route LLM and tool callbacks to a span for the duration of a node"""
+    token = _span_handler.set(SpanCallbackHandler(span))
+    try:
+        yield span
+    finally:
+        _span_handler.reset(token)
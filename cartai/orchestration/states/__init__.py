@@ -2,5 +2,14 @@
 
 from .ml_pipeline_state import MLPipelineState
 from .base_state import BaseState
+from .compact_state import CompactMLPipelineState
+from .reducers import MessageWindow, OmittedMessages, bounded_messages
 
-__all__ = ["MLPipelineState", "BaseState"]
+__all__ = [
+    "MLPipelineState",
+    "BaseState",
+    "CompactMLPipelineState",
+    "MessageWindow",
+    "OmittedMessages",
+    "bounded_messages",
+]
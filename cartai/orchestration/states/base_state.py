@@ -1,13 +1,15 @@
 """Base state for orchestration workflows"""
 
-import operator
 from typing import Annotated, TypedDict, List
 
+from .reducers import bounded_messages
+
 
 class BaseState(TypedDict):
     """Base state for all orchestration workflows"""
 
-    messages: Annotated[List, operator.add]
+    # Only the last messages are kept, see MessageWindow
+    messages: Annotated[List, bounded_messages]
     timestamp: str
     workflow_id: str
     environment: str
@@ -0,0 +1,175 @@
+"""Compact, slotted representation of the ML pipeline state"""
+
+import operator
+from collections.abc import Mapping
+from dataclasses import dataclass, field, fields
+from typing import Annotated, Any, Dict, Iterator, List
+
+import ormsgpack
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from .reducers import OmittedMessages, bounded_messages
+
+# MessagePack extension types of the values ormsgpack cannot pack natively
+_OMITTED_MESSAGES_EXT = 1
+_SERIALIZED_EXT = 2
+_SERDE = JsonPlusSerializer()
+
+
+def _encode(value: Any) -> ormsgpack.Ext:
+    """Pack trimmed-messages markers and any other value (e.g. LangChain messages)"""
+    if isinstance(value, OmittedMessages):
+        payload = ormsgpack.packb([value.count, list(value.refs)])
+        return ormsgpack.Ext(_OMITTED_MESSAGES_EXT, payload)
+    return ormsgpack.Ext(_SERIALIZED_EXT, ormsgpack.packb(_SERDE.dumps_typed(value)))
+
+
+def _decode(code: int, payload: bytes) -> Any:
+    """Restore a value packed by :func:`_encode`"""
+    if code == _OMITTED_MESSAGES_EXT:
+        count, refs = ormsgpack.unpackb(payload)
+        return OmittedMessages(count=count, refs=tuple(refs))
+    if code == _SERIALIZED_EXT:
+        type_name, data = ormsgpack.unpackb(payload)
+        return _SERDE.loads_typed((type_name, data))
+    raise ValueError(f"Unknown snapshot extension type {code}")
+
+
+@dataclass(slots=True)
+class CompactMLPipelineState(Mapping):
+    """
+    Slotted dataclass with the fields and reducers of ``MLPipelineState``.
+
+    Used as the LangGraph state schema with ``execution.state: compact``.
+    Values are validated once, when the workflow starts, and are stored in
+    slots rather than a per-instance dict. The mapping interface keeps
+    ``state["key"]`` and ``state.get("key")`` working in agents and routers.
+    """
+
+    # Base state
+    messages: Annotated[List, bounded_messages] = field(default_factory=list)
+    timestamp: str = ""
+    workflow_id: str = ""
+    environment: str = "development"
+
+    # Core identifiers
+    experiment_id: str = "unknown"
+    model_name: str = "unknown"
+    run_id: str = "unknown"
+
+    # Data quality (Governance)
+    data_quality_status: str = "UNKNOWN"
+    data_quality_score: float = 0.0
+
+    # Model monitoring (Observability)
+    model_metrics: Dict[str, Any] = field(default_factory=dict)
+    system_health: str = "UNKNOWN"
+
+    # Drift detection (Cross-domain)
+    drift_detected: bool = False
+    drift_alerts: List[Dict[str, Any]] = field(default_factory=list)
+    drift_score: float = 0.0
+
+    # Governance decisions
+    policy_violations: List[Dict[str, Any]] = field(default_factory=list)
+    compliance_status: str = "UNKNOWN"
+    governance_decision: str = "PENDING"
+
+    # Cross-domain coordination
+    cross_domain_decision: str = "PENDING"
+    decision_reason: str = ""
+    actions_taken: List[str] = field(default_factory=list)
+
+    # Workflow metadata
+    current_agent: str = ""
+    workflow_stage: str = "STARTING"
+    error_messages: Annotated[List[str], operator.add] = field(default_factory=list)
+
+    @classmethod
+    def from_initial(cls, values: Mapping[str, Any]) -> "CompactMLPipelineState":
+        """
+        Build and validate the state a workflow starts from.
+
+        Args:
+            values: Initial state values; missing fields get their default
+
+        Returns:
+            CompactMLPipelineState instance
+
+        Raises:
+            ValueError: If a key is not a state field
+            TypeError: If a value does not have the type of its field
+        """
+        unknown = set(values) - set(FIELD_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown state fields: {sorted(unknown)}")
+        for name, value in values.items():
+            expected = FIELD_TYPES[name]
+            # Integers are accepted for float fields, as in JSON; booleans,
+            # although ints in Python, only for boolean fields
+            is_number = expected is float and isinstance(value, int)
+            is_bool = isinstance(value, bool)
+            if (is_bool and expected is not bool) or not (
+                isinstance(value, expected) or is_number
+            ):
+                raise TypeError(
+                    f"State field '{name}' must be {expected.__name__}, "
+                    f"got {type(value).__name__}"
+                )
+        return cls(**values)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state to a plain dictionary"""
+        return {name: getattr(self, name) for name in FIELD_NAMES}
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the state to a snapshot, e.g. to store a finished run.
+
+        Values are packed with MessagePack in field order, without the field
+        names. Values MessagePack has no type for, such as LangChain
+        messages, go through LangGraph's serializer. LangGraph checkpointers
+        store each state channel on its own and do not use this format.
+
+        Returns:
+            Serialized state
+        """
+        return ormsgpack.packb(
+            [getattr(self, name) for name in FIELD_NAMES],
+            default=_encode,
+            option=ormsgpack.OPT_PASSTHROUGH_DATACLASS
+            | ormsgpack.OPT_PASSTHROUGH_DATETIME,
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CompactMLPipelineState":
+        """
+        Restore a state serialized with :meth:`to_bytes`.
+
+        Args:
+            data: Serialized state
+
+        Returns:
+            CompactMLPipelineState instance
+        """
+        return cls(*ormsgpack.unpackb(data, ext_hook=_decode))
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in FIELD_TYPES:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(FIELD_NAMES)
+
+    def __len__(self) -> int:
+        return len(FIELD_NAMES)
+
+
+FIELD_NAMES = tuple(f.name for f in fields(CompactMLPipelineState))
+
+# Runtime type of every field, checked once by from_initial
+FIELD_TYPES: Dict[str, type] = {
+    f.name: type(f.default_factory() if callable(f.default_factory) else f.default)
+    for f in fields(CompactMLPipelineState)
+}
@@ -1,6 +1,7 @@
 """ML Pipeline state for cross-domain workflows"""
 
-from typing import Any, List, Dict
+import operator
+from typing import Annotated, Any, List, Dict
 from .base_state import BaseState
 
 
@@ -38,4 +39,4 @@ class MLPipelineState(BaseState):
     # Workflow metadata
     current_agent: str
     workflow_stage: str
-    error_messages: List[str]
+    error_messages: Annotated[List[str], operator.add]
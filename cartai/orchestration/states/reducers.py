@@ -0,0 +1,195 @@
+"""Size-bounded reducer for the ``messages`` state field"""
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, List, Optional, Sequence, Tuple
+
+from cartai.utils.blob_store import BlobStore, default_blob_store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MESSAGES = 200
+OVERFLOW_POLICIES = ("drop", "summarize", "spill")
+
+
+@dataclass(frozen=True)
+class OmittedMessages:
+    """
+    Placeholder heading a message list whose oldest entries were trimmed.
+
+    Attributes:
+        count: Number of messages trimmed so far
+        refs: Blob digests of the spilled batches, oldest first (``spill``
+            policy)
+    """
+
+    count: int
+    refs: Tuple[str, ...] = ()
+
+    def __str__(self) -> str:
+        return f"[{self.count} earlier messages omitted]"
+
+
+class MessageWindow:
+    """
+    Keeps the last ``max_messages`` messages of a workflow.
+
+    Opt-in, with ``execution.messages`` in the workflow YAML (without it,
+    every message is kept):
+
+        execution:
+          messages:
+            max_messages: 200
+            overflow: spill   # drop | summarize | spill
+
+    Older messages are dropped, replaced by an :class:`OmittedMessages`
+    placeholder counting them (``summarize``), or written to the blob store
+    and referenced by the placeholder (``spill``) so they can be loaded back
+    with :meth:`load`. The list, its copies and checkpoints stay bounded.
+    """
+
+    def __init__(
+        self,
+        max_messages: int = DEFAULT_MAX_MESSAGES,
+        overflow: str = "summarize",
+        store: Optional[BlobStore] = None,
+    ) -> None:
+        """
+        Initialize the window.
+
+        Args:
+            max_messages: Number of most recent messages kept in the state
+            overflow: What happens to older messages (drop, summarize, spill)
+            store: Blob store of spilled messages; defaults to the
+                process-wide store
+
+        Raises:
+            ValueError: If the overflow policy is unknown
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(
+                f"Unknown overflow policy '{overflow}', "
+                f"expected one of {OVERFLOW_POLICIES}"
+            )
+        self.max_messages = max_messages
+        self.overflow = overflow
+        self._store = store
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["MessageWindow"]:
+        """
+        Build a window from its configuration.
+
+        Args:
+            config: ``execution.messages`` dict, or a falsy value
+
+        Returns:
+            MessageWindow instance, or None when messages are unbounded
+        """
+        if not config or not config.get("enabled", True):
+            return None
+        return cls(
+            max_messages=config.get("max_messages", DEFAULT_MAX_MESSAGES),
+            overflow=config.get("overflow", "summarize"),
+            store=BlobStore(root=config["path"]) if config.get("path") else None,
+        )
+
+    def merge(self, current: Sequence[Any], update: Sequence[Any]) -> List[Any]:
+        """
+        Append messages and trim the oldest ones beyond the window.
+
+        Args:
+            current: Messages in the state
+            update: Messages written by a node
+
+        Returns:
+            New message list, headed by a placeholder once trimmed
+        """
+        merged = [*current, *update]
+        head = merged[0] if merged else None
+        if isinstance(head, OmittedMessages):
+            merged = merged[1:]
+        else:
+            head = None
+
+        excess = len(merged) - self.max_messages
+        if excess <= 0:
+            return [head, *merged] if head else merged
+
+        trimmed, kept = merged[:excess], merged[excess:]
+        if self.overflow == "drop":
+            return kept
+
+        count = excess + (head.count if head else 0)
+        refs = head.refs if head else ()
+        if self.overflow == "spill":
+            refs = (*refs, self._spill(trimmed))
+        return [OmittedMessages(count=count, refs=refs), *kept]
+
+    def load(self, omitted: OmittedMessages) -> List[Any]:
+        """
+        Load the spilled messages referenced by a placeholder.
+
+        Args:
+            omitted: Placeholder heading a trimmed message list
+
+        Returns:
+            Spilled messages, oldest first (missing batches are skipped)
+        """
+        messages: List[Any] = []
+        for ref in omitted.refs:
+            try:
+                messages.extend(self.store.get(ref))
+            except KeyError:
+                logger.warning(f"Spilled messages {ref[:12]} are no longer stored")
+        return messages
+
+    @property
+    def store(self) -> BlobStore:
+        """Blob store of the spilled messages"""
+        return self._store or default_blob_store()
+
+    def _spill(self, messages: List[Any]) -> str:
+        """Store a batch of trimmed messages and return its digest"""
+        ref = self.store.put(messages)
+        logger.debug(f"Spilled {len(messages)} messages to {ref.digest[:12]}")
+        return ref.digest
+
+
+_current_window: ContextVar[Optional[MessageWindow]] = ContextVar(
+    "cartai_message_window", default=None
+)
+
+
+@contextmanager
+def message_window_scope(window: Optional[MessageWindow]) -> Iterator[None]:
+    """
+    Apply a message window to the workflows executed within the scope.
+
+    Args:
+        window: Window of the workflow; None keeps every message
+    """
+    token = _current_window.set(window)
+    try:
+        yield
+    finally:
+        _current_window.reset(token)
+
+
+def bounded_messages(current: Sequence[Any], update: Sequence[Any]) -> List[Any]:
+    """
+    Reducer of the ``messages`` field bounded by the current message window.
+
+    Args:
+        current: Messages in the state
+        update: Messages written by a node
+
+    Returns:
+        New message list
+    """
+    window = _current_window.get()
+    if window is None:
+        return [*current, *update]
+    return window.merge(current, update)
@@ -0,0 +1,11 @@
+"""Offline stand-ins for LLMs and MCP servers, for tests and benchmarks"""
+
+from .fake_llm import ScriptedChatModel, monitoring_script
+from .fake_mcp import InProcessMCPClient, create_fake_mlflow_server
+
+__all__ = [
+    "InProcessMCPClient",
+    "ScriptedChatModel",
+    "create_fake_mlflow_server",
+    "monitoring_script",
+]
@@ -0,0 +1,125 @@
+"""Deterministic chat model replaying scripted ReAct steps"""
+
+import asyncio
+import time
+from typing import Any, Dict, List, Optional, Sequence
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+
+class ScriptedChatModel(BaseChatModel):
+    """
+    Chat model answering every ReAct loop with the same scripted messages.
+
+    The step of the script is the number of model answers since the last
+    human message, so the script replays identically on every run and the
+    model can be shared by concurrent agents. Tool call ids are made unique
+    per step, and token usage is estimated from the message sizes.
+    """
+
+    script: List[AIMessage]
+    latency_s: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+
+    def bind_tools(self, tools: Sequence[Any], **kwargs: Any) -> "ScriptedChatModel":
+        """Tools are accepted and ignored: the script decides the calls"""
+        return self
+
+    def _next_message(self, messages: List[BaseMessage]) -> AIMessage:
+        """Scripted answer to a conversation"""
+        step = 0
+        for message in reversed(messages):
+            if isinstance(message, HumanMessage):
+                break
+            step += isinstance(message, AIMessage)
+        scripted = self.script[min(step, len(self.script) - 1)]
+
+        tokens_in = sum(len(str(message.content)) for message in messages) // 4
+        tokens_out = len(str(scripted.content)) // 4 + 10 * len(scripted.tool_calls)
+        return scripted.model_copy(
+            update={
+                "tool_calls": [
+                    {**call, "id": f"call_{step}_{i}"}
+                    for i, call in enumerate(scripted.tool_calls)
+                ],
+                "usage_metadata": {
+                    "input_tokens": tokens_in,
+                    "output_tokens": tokens_out,
+                    "total_tokens": tokens_in + tokens_out,
+                },
+            }
+        )
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_s:
+            time.sleep(self.latency_s)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._next_message(messages))]
+        )
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        return ChatResult(
+            generations=[ChatGeneration(message=self._next_message(messages))]
+        )
+
+
+def monitoring_script(
+    system_health: str = "HEALTHY",
+    model_metrics: Optional[Dict[str, float]] = None,
+) -> List[AIMessage]:
+    """
+    Script of a MonitoringAgent investigation.
+
+    The model checks the MLflow server once, then submits its analysis.
+
+    Args:
+        system_health: Health reported in the analysis
+        model_metrics: Metrics reported in the analysis
+
+    Returns:
+        Scripted model answers
+    """
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "mlflow_get_system_info", "args": {}, "id": ""}],
+        ),
+        AIMessage(
+            content="",
+            tool_calls=[
+                {
+                    "name": "submit_analysis",
+                    "args": {
+                        "system_health": system_health,
+                        "model_metrics": model_metrics or {"accuracy": 0.95},
+                        "analysis_summary": "Scripted analysis",
+                        "actions_taken": ["checked MLflow server"],
+                    },
+                    "id": "",
+                }
+            ],
+        ),
+    ]
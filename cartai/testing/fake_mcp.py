@@ -0,0 +1,155 @@
+"""In-process MCP servers and a client serving them without any transport"""
+
+import json
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Optional
+
+import fastmcp
+from fastmcp import FastMCP
+from langchain_core.tools import StructuredTool
+
+
+def create_fake_mlflow_server(metrics: Optional[Dict[str, float]] = None) -> FastMCP:
+    """
+    Create an MLflow MCP server answering with deterministic runs.
+
+    Every ``list_runs`` call logs one more run, so monitoring cycles always
+    see new metrics and never take the no-change fast path.
+
+    Args:
+        metrics: Metrics of every run
+
+    Returns:
+        FastMCP server exposing ``mlflow_list_runs`` and ``mlflow_get_system_info``
+    """
+    server: FastMCP = FastMCP(name="mlflow")
+    run_metrics = metrics or {"accuracy": 0.95, "latency_ms": 120.0}
+    runs: List[Dict[str, Any]] = []
+
+    @server.tool(name="mlflow_list_runs")
+    def list_runs(experiment_id: str, max_results: int = 100) -> str:
+        """List the runs of an experiment with their metrics"""
+        runs.insert(
+            0,
+            {
+                "run_id": f"run-{len(runs)}",
+                "status": "FINISHED",
+                "start_time": "2025-01-01 00:00:00",
+                "metrics": run_metrics,
+                "parameters": {},
+                "tags": {},
+            },
+        )
+        selected = runs[:max_results]
+        return json.dumps(
+            {
+                "experiment_id": experiment_id,
+                "total_runs": len(selected),
+                "runs": selected,
+            }
+        )
+
+    @server.tool(name="mlflow_get_system_info")
+    def get_system_info() -> str:
+        """Get information about the MLflow tracking server"""
+        return json.dumps({"mlflow_version": "fake", "experiment_count": 1})
+
+    return server
+
+
+def create_fake_notion_server() -> FastMCP:
+    """
+    Create a Notion MCP server accepting searches and page creations.
+
+    Returns:
+        FastMCP server exposing ``API-post-search`` and ``API-post-page``
+    """
+    server: FastMCP = FastMCP(name="notion")
+
+    @server.tool(name="API-post-search")
+    def search(query: str = "") -> str:
+        """Search pages by title"""
+        return json.dumps({"results": [{"id": "page-1", "title": query}]})
+
+    @server.tool(name="API-post-page")
+    def create_page(parent_id: str, title: str, content: str = "") -> str:
+        """Create a page under a parent page"""
+        return json.dumps({"id": f"page-{title}", "parent_id": parent_id})
+
+    return server
+
+
+class InProcessMCPClient:
+    """
+    Drop-in for ``MultiServerMCPClient`` backed by in-process FastMCP servers.
+
+    Exposes the same ``connections`` and ``get_tools(server_name=...)`` as the
+    real client, and opens an in-memory session per call like it does, so
+    agents run their MCP code path offline. Connection and tool listing
+    times are accumulated in ``timings``.
+    """
+
+    def __init__(
+        self,
+        connections: Mapping[str, Any],
+        servers: Optional[Mapping[str, FastMCP]] = None,
+    ) -> None:
+        """
+        Initialize the client.
+
+        Args:
+            connections: Client config of the agent's MCPs (as given to
+                ``MultiServerMCPClient``)
+            servers: Server of each MCP name; defaults to the fake MLflow
+                and Notion servers
+        """
+        self.connections = dict(connections)
+        if servers is None:
+            servers = {
+                "mlflow": create_fake_mlflow_server(),
+                "notion": create_fake_notion_server(),
+            }
+        self.servers = servers
+        self.timings: Dict[str, float] = defaultdict(float)
+
+    async def get_tools(self, *, server_name: Optional[str] = None) -> List[Any]:
+        """
+        List the tools of one or every connected server.
+
+        Args:
+            server_name: MCP name, or None for every connection
+
+        Returns:
+            LangChain tools calling the in-process servers
+        """
+        names = [server_name] if server_name else list(self.connections)
+        tools: List[Any] = []
+        for name in names:
+            server = self.servers.get(name)
+            if server is None:
+                continue
+            started = time.perf_counter()
+            async with fastmcp.Client(server) as client:
+                connected = time.perf_counter()
+                mcp_tools = await client.list_tools()
+            self.timings["mcp_connect"] += connected - started
+            self.timings["tool_listing"] += time.perf_counter() - connected
+            tools.extend(self._to_langchain_tool(server, tool) for tool in mcp_tools)
+        return tools
+
+    @staticmethod
+    def _to_langchain_tool(server: FastMCP, tool: Any) -> StructuredTool:
+        """Wrap an MCP tool in a LangChain tool calling it in a new session"""
+
+        async def call_tool(**arguments: Any) -> str:
+            async with fastmcp.Client(server) as client:
+                content = await client.call_tool(tool.name, arguments)
+            return "\n".join(getattr(block, "text", str(block)) for block in content)
+
+        return StructuredTool(
+            name=tool.name,
+            description=tool.description or "",
+            args_schema=tool.inputSchema,
+            coroutine=call_tool,
+        )
@@ -0,0 +1,247 @@
+"""
+Local content-addressed store of large values.
+
+Values are pickled and written once under the SHA-256 digest of their
+bytes; writing the same value again is a no-op. Workflow state then carries
+a small :class:`BlobRef` instead of the value, so state copies, merges and
+checkpoints no longer scale with payload sizes. References are resolved
+lazily, when the value is read.
+"""
+
+import hashlib
+import logging
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BLOB_DIR = Path(".cartai/blobs")
+DEFAULT_MIN_SIZE_BYTES = 16 * 1024
+DEFAULT_MEMORY_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class BlobRef:
+    """
+    Reference to a value in a blob store.
+
+    Attributes:
+        digest: SHA-256 of the pickled value
+        size: Size of the pickled value in bytes
+        type_name: Type of the value, for logs and debugging
+    """
+
+    digest: str
+    size: int
+    type_name: str = ""
+
+    def __str__(self) -> str:
+        return f"<{self.type_name or 'blob'} {self.digest[:12]} ({self.size} bytes)>"
+
+
+class BlobStore:
+    """
+    Content-addressed store of pickled values on the local disk.
+
+    Blobs live in ``root/<first 2 hex chars>/<digest>`` and are written
+    atomically. Values read are kept in memory so repeated reads of a
+    reference neither hit the disk nor unpickle again.
+
+    Values returned by :meth:`get` are shared between readers and must be
+    treated as read-only: to change one, copy it and store the new value.
+    """
+
+    def __init__(
+        self,
+        root: Path | str = DEFAULT_BLOB_DIR,
+        min_size_bytes: int = DEFAULT_MIN_SIZE_BYTES,
+        memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+    ) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory of the blobs (created on first write)
+            min_size_bytes: Smallest pickled size offloaded by :meth:`offload`
+            memory_entries: Number of recently read values kept in memory
+        """
+        self.root = Path(root)
+        self.min_size_bytes = min_size_bytes
+        self.memory_entries = memory_entries
+        self._memory: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.reads = 0
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["BlobStore"]:
+        """
+        Build a store from its configuration, if enabled.
+
+        Args:
+            config: ``offload`` configuration dict, or a falsy value
+
+        Returns:
+            BlobStore instance, or None when offloading is disabled
+        """
+        if not config or not config.get("enabled", True):
+            return None
+        return cls(
+            root=config.get("path", DEFAULT_BLOB_DIR),
+            min_size_bytes=config.get("min_size_bytes", DEFAULT_MIN_SIZE_BYTES),
+        )
+
+    def put(self, value: Any) -> BlobRef:
+        """
+        Store a value, unless a blob with the same content exists.
+
+        Args:
+            value: Picklable value
+
+        Returns:
+            Reference to the value
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        return self._put_bytes(payload, type(value).__name__)
+
+    def get(self, ref: BlobRef | str) -> Any:
+        """
+        Load a stored value.
+
+        Args:
+            ref: Reference or digest of the value
+
+        Returns:
+            The stored value
+
+        Raises:
+            KeyError: If no blob has this digest
+        """
+        digest = ref.digest if isinstance(ref, BlobRef) else ref
+        with self._lock:
+            if digest in self._memory:
+                self._memory.move_to_end(digest)
+                return self._memory[digest]
+
+        try:
+            payload = self._path(digest).read_bytes()
+        except FileNotFoundError:
+            raise KeyError(f"Blob {digest} not found in {self.root}") from None
+        value = pickle.loads(payload)
+        self.reads += 1
+        self._remember(digest, value)
+        return value
+
+    def offload(self, value: Any) -> Any:
+        """
+        Replace a large value by a reference to it.
+
+        Args:
+            value: Any value
+
+        Returns:
+            A BlobRef if the pickled value reaches ``min_size_bytes``,
+            otherwise the value itself
+        """
+        if value is None or isinstance(value, (BlobRef, bool, int, float)):
+            return value
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.debug(f"BlobStore: Keeping unpicklable value inline: {str(e)}")
+            return value
+        if len(payload) < self.min_size_bytes:
+            return value
+        return self._put_bytes(payload, type(value).__name__)
+
+    def resolve(self, value: Any) -> Any:
+        """Load a value if it is a reference, return it unchanged otherwise"""
+        return self.get(value) if isinstance(value, BlobRef) else value
+
+    def __contains__(self, ref: BlobRef | str) -> bool:
+        digest = ref.digest if isinstance(ref, BlobRef) else ref
+        return self._path(digest).exists()
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics of the store"""
+        return {
+            "root": str(self.root),
+            "writes": self.writes,
+            "reads": self.reads,
+            "in_memory": len(self._memory),
+        }
+
+    def _put_bytes(self, payload: bytes, type_name: str) -> BlobRef:
+        """Write a pickled value under its digest"""
+        digest = hashlib.sha256(payload).hexdigest()
+        path = self._path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Atomic: concurrent writers of the same blob write the same bytes
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as file:
+                file.write(payload)
+            os.replace(tmp, path)
+            self.writes += 1
+            logger.debug(f"BlobStore: Wrote {len(payload)} bytes to {digest[:12]}")
+        # The LRU is filled by reads: it never holds the caller's object,
+        # whose later changes must not alter what the digest resolves to
+        return BlobRef(digest=digest, size=len(payload), type_name=type_name)
+
+    def _remember(self, digest: str, value: Any) -> None:
+        """Keep a value in the in-memory LRU"""
+        with self._lock:
+            self._memory[digest] = value
+            self._memory.move_to_end(digest)
+            while len(self._memory) > self.memory_entries:
+                self._memory.popitem(last=False)
+
+    def _path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+
+class ResolvingView(Mapping):
+    """
+    Read-only mapping resolving blob references on access.
+
+    Only the values actually read are loaded, so agents pay for the large
+    payloads they use and nothing else.
+    """
+
+    def __init__(self, data: Mapping[str, Any], store: BlobStore) -> None:
+        """
+        Initialize the view.
+
+        Args:
+            data: Mapping whose values may be blob references
+            store: Store holding the referenced values
+        """
+        self._data = data
+        self._store = store
+
+    def __getitem__(self, key: str) -> Any:
+        return self._store.resolve(self._data[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+_default_store: Optional[BlobStore] = None
+
+
+def default_blob_store() -> BlobStore:
+    """Get the process-wide blob store, created on first use"""
+    global _default_store
+    if _default_store is None:
+        _default_store = BlobStore()
+    return _default_store
@@ -0,0 +1,269 @@
+"""
+On-disk key/value cache backed by SQLite.
+
+Entries are pickled and grouped by namespace. Each namespace enforces its own
+TTL and size limits; when a limit is exceeded the least recently used entries
+are evicted first.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import pickle
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path(".cartai/cache")
+
+
+def stable_hash(obj: Any) -> str:
+    """
+    Compute a stable SHA-256 hash of a JSON-like object.
+
+    Dict keys are sorted so logically equal inputs hash identically; values
+    that are not JSON serializable are hashed through their ``str`` form.
+
+    Args:
+        obj: Object to hash
+
+    Returns:
+        Hex digest of the object
+    """
+    payload = json.dumps(obj, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class DiskCache:
+    """
+    SQLite-backed cache with TTL and LRU size-based eviction.
+
+    Multiple caches may share a database file; limits are applied per namespace.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS cache_entries (
+            namespace TEXT NOT NULL,
+            key TEXT NOT NULL,
+            value BLOB NOT NULL,
+            size INTEGER NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL,
+            accessed_at REAL NOT NULL,
+            PRIMARY KEY (namespace, key)
+        )
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_CACHE_DIR / "cache.sqlite",
+        namespace: str = "default",
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file (parent directories are created)
+            namespace: Logical partition of the database used by this cache
+            ttl_seconds: Default time-to-live of entries; None never expires
+            max_entries: Maximum number of entries kept in the namespace
+            max_bytes: Maximum total pickled size kept in the namespace
+        """
+        self.path = Path(path)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(self._SCHEMA)
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or expired entry
+
+        Returns:
+            The cached value or ``default``
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return default
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                self.misses += 1
+                return default
+
+            self._conn.execute(
+                "UPDATE cache_entries SET accessed_at = ? "
+                "WHERE namespace = ? AND key = ?",
+                (now, self.namespace, key),
+            )
+
+        try:
+            result = pickle.loads(value)
+        except Exception as e:
+            logger.warning(f"DiskCache: Dropping unreadable entry {key}: {str(e)}")
+            self.delete(key)
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        return result
+
+    def set(self, key: str, value: Any, ttl_seconds: Optional[float] = None) -> bool:
+        """
+        Store a value in the cache.
+
+        Args:
+            key: Cache key
+            value: Picklable value to store
+            ttl_seconds: Overrides the cache default TTL for this entry
+
+        Returns:
+            True if the value was stored, False if it could not be serialized
+        """
+        try:
+            payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            logger.warning(f"DiskCache: Value for {key} is not cacheable: {str(e)}")
+            return False
+
+        if self.max_bytes is not None and len(payload) > self.max_bytes:
+            logger.debug(f"DiskCache: Value for {key} exceeds max_bytes, skipping")
+            return False
+
+        now = time.time()
+        ttl = ttl_seconds if ttl_seconds is not None else self.ttl_seconds
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, size, created_at, expires_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self.namespace, key, payload, len(payload), now, expires_at, now),
+            )
+            self._evict(now)
+        return True
+
+    def delete(self, key: str) -> None:
+        """Remove a single entry"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            )
+
+    def clear(self) -> None:
+        """Remove all entries of this namespace"""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM cache_entries WHERE namespace = ?", (self.namespace,)
+            )
+
+    async def aget(self, key: str, default: Any = None) -> Any:
+        """Async variant of :meth:`get` that runs off the event loop"""
+        return await asyncio.to_thread(self.get, key, default)
+
+    async def aset(
+        self, key: str, value: Any, ttl_seconds: Optional[float] = None
+    ) -> bool:
+        """Async variant of :meth:`set` that runs off the event loop"""
+        return await asyncio.to_thread(self.set, key, value, ttl_seconds)
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones beyond limits"""
+        self._conn.execute(
+            "DELETE FROM cache_entries "
+            "WHERE namespace = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+            (self.namespace, now),
+        )
+
+        if self.max_entries is None and self.max_bytes is None:
+            return
+
+        count, total = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries "
+            "WHERE namespace = ?",
+            (self.namespace,),
+        ).fetchone()
+
+        if (self.max_entries is None or count <= self.max_entries) and (
+            self.max_bytes is None or total <= self.max_bytes
+        ):
+            return
+
+        rows = self._conn.execute(
+            "SELECT key, size FROM cache_entries WHERE namespace = ? "
+            "ORDER BY accessed_at ASC",
+            (self.namespace,),
+        ).fetchall()
+
+        evicted = []
+        for key, size in rows:
+            if (self.max_entries is None or count <= self.max_entries) and (
+                self.max_bytes is None or total <= self.max_bytes
+            ):
+                break
+            evicted.append((self.namespace, key))
+            count -= 1
+            total -= size
+
+        self._conn.executemany(
+            "DELETE FROM cache_entries WHERE namespace = ? AND key = ?", evicted
+        )
+        logger.debug(f"DiskCache[{self.namespace}]: Evicted {len(evicted)} entries")
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics for this namespace"""
+        with self._lock:
+            count, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache_entries "
+                "WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        return {
+            "namespace": self.namespace,
+            "entries": count,
+            "bytes": total,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def close(self) -> None:
+        """Close the underlying database connection"""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,216 @@
+"""
+On-disk cache of LLM responses.
+
+Works both as a LangChain cache (chat models, hence ``create_react_agent``)
+and as a wrapper around ``litellm.acompletion``. Keys are derived from the
+model, its parameters (including temperature) and the normalized messages,
+so a rerun with the same prompt and the same tool results costs no tokens.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Mapping, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+
+from cartai.utils.disk_cache import DEFAULT_CACHE_DIR, DiskCache, stable_hash
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LLM_CACHE_PATH = DEFAULT_CACHE_DIR / "llm.sqlite"
+
+# Completion arguments that do not change the response
+_TRANSPORT_PARAMS = frozenset(
+    {"api_key", "api_base", "base_url", "timeout", "metadata", "stream_options"}
+)
+
+
+def normalize_messages(messages: Sequence[Mapping[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Normalize chat messages for hashing.
+
+    Whitespace around text content is stripped and empty fields are dropped,
+    so formatting-only differences map to the same key.
+
+    Args:
+        messages: OpenAI-style messages
+
+    Returns:
+        Normalized messages
+    """
+    normalized = []
+    for message in messages:
+        item = {}
+        for field, value in message.items():
+            if isinstance(value, str):
+                value = value.strip()
+            if value not in (None, "", [], {}):
+                item[field] = value
+        normalized.append(item)
+    return normalized
+
+
+class LLMResponseCache(BaseCache):
+    """
+    LLM response cache with TTL and LRU size-based eviction.
+
+    Enable it for a chat model with ``model.cache = cache`` (or globally with
+    ``langchain_core.globals.set_llm_cache``), and for litellm by routing
+    calls through :meth:`acompletion`.
+
+    Configured with a dict, as in the agent YAML:
+
+        llm_cache:
+          enabled: true
+          ttl_seconds: 86400
+          max_entries: 1000
+          max_size_mb: 64
+          path: ".cartai/cache/llm.sqlite"
+    """
+
+    def __init__(
+        self,
+        path: Path | str = DEFAULT_LLM_CACHE_PATH,
+        ttl_seconds: Optional[float] = 86400,
+        max_entries: Optional[int] = 1000,
+        max_bytes: Optional[int] = None,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            path: SQLite database file
+            ttl_seconds: Time-to-live of responses; None never expires
+            max_entries: Maximum number of cached responses
+            max_bytes: Maximum total size of cached responses
+        """
+        self.store = DiskCache(
+            path=path,
+            namespace="llm",
+            ttl_seconds=ttl_seconds,
+            max_entries=max_entries,
+            max_bytes=max_bytes,
+        )
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["LLMResponseCache"]:
+        """
+        Build a cache from its configuration, if enabled.
+
+        Args:
+            config: ``True``, a configuration dict, or a falsy value
+
+        Returns:
+            LLMResponseCache instance, or None when caching is disabled
+        """
+        if not config:
+            return None
+        if config is True:
+            config = {}
+        if not config.get("enabled", True):
+            return None
+
+        max_size_mb = config.get("max_size_mb")
+        return cls(
+            path=config.get("path", DEFAULT_LLM_CACHE_PATH),
+            ttl_seconds=config.get("ttl_seconds", 86400),
+            max_entries=config.get("max_entries", 1000),
+            max_bytes=int(max_size_mb * 1024 * 1024) if max_size_mb else None,
+        )
+
+    # LangChain cache interface
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        """Cache key of a LangChain generation"""
+        return stable_hash(["langchain", llm_string, prompt])
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Look up the generations of a serialized prompt and model"""
+        return self.store.get(self._key(prompt, llm_string))
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        """Store the generations of a serialized prompt and model"""
+        self.store.set(self._key(prompt, llm_string), list(return_val))
+
+    def clear(self, **kwargs: Any) -> None:
+        """Remove every cached response"""
+        self.store.clear()
+
+    async def alookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        """Async variant of :meth:`lookup`"""
+        return await self.store.aget(self._key(prompt, llm_string))
+
+    async def aupdate(
+        self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE
+    ) -> None:
+        """Async variant of :meth:`update`"""
+        await self.store.aset(self._key(prompt, llm_string), list(return_val))
+
+    async def aclear(self, **kwargs: Any) -> None:
+        """Async variant of :meth:`clear`"""
+        self.clear()
+
+    # litellm
+
+    @staticmethod
+    def completion_key(
+        model: Any, messages: Sequence[Mapping[str, Any]], **params: Any
+    ) -> str:
+        """
+        Cache key of a chat completion request.
+
+        Args:
+            model: Model identifier
+            messages: Chat messages
+            **params: Sampling parameters such as temperature and max_tokens
+
+        Returns:
+            Cache key
+        """
+        return stable_hash(
+            [
+                "completion",
+                str(model),
+                normalize_messages(messages),
+                {k: v for k, v in params.items() if k not in _TRANSPORT_PARAMS},
+            ]
+        )
+
+    async def acompletion(
+        self,
+        completion: Callable[..., Awaitable[Any]],
+        model: Any,
+        messages: Sequence[Mapping[str, Any]],
+        **params: Any,
+    ) -> Any:
+        """
+        Call a completion function, returning the cached response when present.
+
+        Streaming calls are passed through uncached.
+
+        Args:
+            completion: Completion function, e.g. ``litellm.acompletion``
+            model: Model identifier
+            messages: Chat messages
+            **params: Remaining completion arguments
+
+        Returns:
+            The completion response
+        """
+        if params.get("stream"):
+            return await completion(model=model, messages=messages, **params)
+
+        key = self.completion_key(model, messages, **params)
+        response = await self.store.aget(key)
+        if response is not None:
+            logger.debug(f"LLM cache hit for {model}")
+            return response
+
+        response = await completion(model=model, messages=messages, **params)
+        await self.store.aset(key, response)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Get usage statistics of the cache"""
+        return self.store.stats()
@@ -0,0 +1,367 @@
+"""
+Per-call model selection among low-cost models.
+
+Rules map a call (task type, prompt size, number of tools) to a model, so
+simple checks run on the fastest model and only hard tasks escalate. Calls
+failing with a rate-limit error move on to the next fallback model, and
+every call is recorded in per-model latency and cost statistics.
+"""
+
+import json
+import logging
+import time
+from dataclasses import asdict, dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from uuid import UUID
+
+from langchain.chat_models import init_chat_model
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models import BaseChatModel
+from langchain_core.outputs import LLMResult
+from langchain_core.runnables import Runnable
+from openai import RateLimitError
+
+from cartai.utils.model_client_utils import LowCostOpenAIModels
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROVIDER = "openai"
+
+# USD per million (input, output) tokens
+MODEL_PRICES: Dict[str, Tuple[float, float]] = {
+    LowCostOpenAIModels.GPT_4_1_NANO: (0.10, 0.40),
+    LowCostOpenAIModels.GPT_4_1_MINI: (0.40, 1.60),
+    LowCostOpenAIModels.O4_MINI: (1.10, 4.40),
+    LowCostOpenAIModels.O3_MINI: (1.10, 4.40),
+    LowCostOpenAIModels.O1_MINI: (1.10, 4.40),
+    LowCostOpenAIModels.GPT_4O_MINI: (0.15, 0.60),
+}
+
+_CHARS_PER_TOKEN = 4
+
+
+def estimate_prompt_tokens(messages: Any) -> int:
+    """Rough number of tokens of a prompt (text or messages)"""
+    text = messages if isinstance(messages, str) else json.dumps(messages, default=str)
+    return len(text) // _CHARS_PER_TOKEN
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an error is a provider rate limit (HTTP 429)"""
+    return (
+        isinstance(error, RateLimitError) or getattr(error, "status_code", None) == 429
+    )
+
+
+@dataclass
+class RoutingRule:
+    """Model used for the calls matching every condition of the rule"""
+
+    model: str
+    tasks: Optional[List[str]] = None
+    min_prompt_tokens: Optional[int] = None
+    max_prompt_tokens: Optional[int] = None
+    min_tools: Optional[int] = None
+    max_tools: Optional[int] = None
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> "RoutingRule":
+        """Build a rule from YAML (``task`` may be a name or a list of names)"""
+        tasks = config.get("task", config.get("tasks"))
+        return cls(
+            model=config["model"],
+            tasks=[tasks] if isinstance(tasks, str) else tasks,
+            min_prompt_tokens=config.get("min_prompt_tokens"),
+            max_prompt_tokens=config.get("max_prompt_tokens"),
+            min_tools=config.get("min_tools"),
+            max_tools=config.get("max_tools"),
+        )
+
+    def matches(self, task: Optional[str], prompt_tokens: int, num_tools: int) -> bool:
+        """Whether a call satisfies the rule"""
+        return (
+            (self.tasks is None or task in self.tasks)
+            and (
+                self.min_prompt_tokens is None
+                or prompt_tokens >= self.min_prompt_tokens
+            )
+            and (
+                self.max_prompt_tokens is None
+                or prompt_tokens <= self.max_prompt_tokens
+            )
+            and (self.min_tools is None or num_tools >= self.min_tools)
+            and (self.max_tools is None or num_tools <= self.max_tools)
+        )
+
+
+@dataclass
+class ModelStats:
+    """Usage counters of a model"""
+
+    calls: int = 0
+    failures: int = 0
+    rate_limited: int = 0
+    latency_s: float = 0.0
+    tokens_in: int = 0
+    tokens_out: int = 0
+    cost_usd: float = 0.0
+
+    @property
+    def avg_latency_s(self) -> float:
+        """Mean latency of the successful calls"""
+        succeeded = self.calls - self.failures
+        return self.latency_s / succeeded if succeeded else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the stats to a plain dictionary"""
+        return {**asdict(self), "avg_latency_s": self.avg_latency_s}
+
+
+class ModelRouter:
+    """
+    Rule-based model router with rate-limit fallbacks.
+
+    Configured with a dict, as in the agent YAML:
+
+        model_routing:
+          default: gpt-4o-mini
+          rules:
+            - task: health_check
+              model: gpt-4.1-nano
+            - max_prompt_tokens: 3000
+              max_tools: 4
+              model: gpt-4.1-nano
+          fallbacks: [gpt-4.1-mini, gpt-4o-mini]
+
+    Rules are evaluated in order; the first match wins.
+    """
+
+    def __init__(
+        self,
+        default_model: str = LowCostOpenAIModels.GPT_4O_MINI.value,
+        rules: Optional[Sequence[RoutingRule]] = None,
+        fallbacks: Optional[Sequence[str]] = None,
+        provider: str = DEFAULT_PROVIDER,
+    ) -> None:
+        """
+        Initialize the router.
+
+        Args:
+            default_model: Model used when no rule matches
+            rules: Routing rules, evaluated in order
+            fallbacks: Models tried in order when the selected one is rate limited
+            provider: Provider of model names without a "provider:" prefix
+        """
+        self.default_model = default_model
+        self.rules = list(rules or [])
+        self.fallbacks = list(fallbacks or [])
+        self.provider = provider
+        self.stats: Dict[str, ModelStats] = {}
+
+    @classmethod
+    def from_config(cls, config: Any) -> Optional["ModelRouter"]:
+        """
+        Build a router from its configuration, if enabled.
+
+        Args:
+            config: Routing configuration dict, or a falsy value
+
+        Returns:
+            ModelRouter instance, or None when routing is disabled
+        """
+        if not config or not config.get("enabled", True):
+            return None
+        return cls(
+            default_model=config.get("default", LowCostOpenAIModels.GPT_4O_MINI.value),
+            rules=[RoutingRule.from_config(rule) for rule in config.get("rules", [])],
+            fallbacks=list(config.get("fallbacks", [])),
+            provider=config.get("provider", DEFAULT_PROVIDER),
+        )
+
+    def select(
+        self, task: Optional[str] = None, prompt_tokens: int = 0, num_tools: int = 0
+    ) -> str:
+        """
+        Pick the model of a call.
+
+        Args:
+            task: Task type of the call (e.g. "health_check", "investigation")
+            prompt_tokens: Estimated prompt size
+            num_tools: Number of tools bound to the call
+
+        Returns:
+            Model name
+        """
+        for rule in self.rules:
+            if rule.matches(task, prompt_tokens, num_tools):
+                model = rule.model
+                break
+        else:
+            model = self.default_model
+        logger.debug(
+            f"Routed {task or 'call'} ({prompt_tokens} tokens, {num_tools} tools) "
+            f"to {model}"
+        )
+        return model
+
+    def candidates(self, model: str) -> List[str]:
+        """A model followed by its fallbacks, without duplicates"""
+        return [model, *(m for m in self.fallbacks if m != model)]
+
+    def record(
+        self,
+        model: str,
+        latency_s: float,
+        tokens_in: int = 0,
+        tokens_out: int = 0,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        """
+        Record a model call.
+
+        Args:
+            model: Model name
+            latency_s: Duration of the call
+            tokens_in: Prompt tokens
+            tokens_out: Completion tokens
+            error: Error raised by the call, if any
+        """
+        stats = self.stats.setdefault(model, ModelStats())
+        stats.calls += 1
+        if error is not None:
+            stats.failures += 1
+            stats.rate_limited += is_rate_limit_error(error)
+            return
+        stats.latency_s += latency_s
+        stats.tokens_in += tokens_in
+        stats.tokens_out += tokens_out
+        price_in, price_out = MODEL_PRICES.get(model.split(":")[-1], (0.0, 0.0))
+        stats.cost_usd += (tokens_in * price_in + tokens_out * price_out) / 1e6
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get the usage statistics of every model"""
+        return {model: stats.to_dict() for model, stats in self.stats.items()}
+
+    async def acompletion(
+        self,
+        completion: Callable[..., Awaitable[Any]],
+        messages: Sequence[Mapping[str, Any]],
+        task: Optional[str] = None,
+        num_tools: int = 0,
+        **params: Any,
+    ) -> Any:
+        """
+        Call a litellm-style completion function on the routed model.
+
+        Args:
+            completion: Completion function, e.g. ``litellm.acompletion``
+            messages: Chat messages
+            task: Task type of the call
+            num_tools: Number of tools passed with the call
+            **params: Remaining completion arguments
+
+        Returns:
+            The completion response
+
+        Raises:
+            Exception: The last error when every candidate model failed
+        """
+        model = self.select(task, estimate_prompt_tokens(messages), num_tools)
+        candidates = self.candidates(model)
+        for i, candidate in enumerate(candidates):
+            started = time.perf_counter()
+            try:
+                response = await completion(
+                    model=candidate, messages=messages, **params
+                )
+            except Exception as e:
+                self.record(candidate, time.perf_counter() - started, error=e)
+                if not is_rate_limit_error(e) or i == len(candidates) - 1:
+                    raise
+                logger.warning(f"{candidate} is rate limited, falling back")
+                continue
+            usage = getattr(response, "usage", None)
+            self.record(
+                candidate,
+                time.perf_counter() - started,
+                tokens_in=getattr(usage, "prompt_tokens", 0) or 0,
+                tokens_out=getattr(usage, "completion_tokens", 0) or 0,
+            )
+            return response
+        raise RuntimeError("No candidate model")  # pragma: no cover
+
+    def chat_model(self, model: str, **kwargs: Any) -> Runnable:
+        """
+        Build a LangChain chat model with rate-limit fallbacks and usage stats.
+
+        Args:
+            model: Model name selected by :meth:`select`
+            **kwargs: Attributes set on every underlying chat model (e.g. cache)
+
+        Returns:
+            Chat model, wrapped with its fallbacks when there are any
+        """
+        models = [
+            self._init_chat_model(name, **kwargs) for name in self.candidates(model)
+        ]
+        if len(models) == 1:
+            return models[0]
+        return models[0].with_fallbacks(
+            models[1:], exceptions_to_handle=(RateLimitError,)
+        )
+
+    def _init_chat_model(self, model: str, **kwargs: Any) -> BaseChatModel:
+        """Instantiate a chat model reporting its calls to this router"""
+        if ":" in model:
+            chat_model = init_chat_model(model)
+        else:
+            chat_model = init_chat_model(model, model_provider=self.provider)
+        chat_model.callbacks = [_RouterStatsCallback(self, model)]
+        for name, value in kwargs.items():
+            setattr(chat_model, name, value)
+        return chat_model
+
+
+class _RouterStatsCallback(BaseCallbackHandler):
+    """Records the latency and token usage of a chat model in its router"""
+
+    run_inline = True
+
+    def __init__(self, router: ModelRouter, model: str) -> None:
+        self.router = router
+        self.model = model
+        self._started: Dict[UUID, float] = {}
+
+    def on_chat_model_start(
+        self, serialized: Dict[str, Any], messages: Any, *, run_id: UUID, **kwargs
+    ) -> None:
+        self._started[run_id] = time.perf_counter()
+
+    def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs) -> None:
+        tokens_in = tokens_out = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(
+                    getattr(generation, "message", None), "usage_metadata", None
+                )
+                if usage:
+                    tokens_in += usage.get("input_tokens", 0)
+                    tokens_out += usage.get("output_tokens", 0)
+        self.router.record(self.model, self._elapsed(run_id), tokens_in, tokens_out)
+
+    def on_llm_error(self, error: BaseException, *, run_id: UUID, **kwargs) -> None:
+        self.router.record(self.model, self._elapsed(run_id), error=error)
+
+    def _elapsed(self, run_id: UUID) -> float:
+        started = self._started.pop(run_id, None)
+        return time.perf_counter() - started if started is not None else 0.0
@@ -0,0 +1,53 @@
+"""
+Run MonitoringAgent continuously as a daemon.
+
+Health checks and full monitoring cycles run at the intervals configured in
+``monitoring_intervals`` (or given on the command line) until interrupted with
+Ctrl+C / SIGTERM.
+
+Usage:
+    uv run python examples/continuous_monitoring.py --experiment_id 1
+"""
+
+import argparse
+import asyncio
+import logging
+
+from langchain_mcp_adapters.client import MultiServerMCPClient  # type: ignore
+
+from cartai.agents.observability import MonitoringAgent, MonitoringScheduler
+from cartai.mcps.registry.mcp_registry import MCPRegistry
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger("continuous_monitoring")
+
+
+def log_result(job: str, result: dict) -> None:
+    logger.info(f"{job}: {result.get('system_health', 'UNKNOWN')}")
+
+
+async def main(args: argparse.Namespace) -> None:
+    mcp_registry = MCPRegistry(environment="development")
+    mcp_client = MultiServerMCPClient(
+        mcp_registry.get_filtered_client_config(["mlflow"])
+    )
+    agent = MonitoringAgent(mcp_client=mcp_client)
+
+    scheduler = MonitoringScheduler(
+        agent,
+        {"experiment_id": args.experiment_id},
+        health_check_seconds=args.health_check_seconds,
+        collection_seconds=args.collection_seconds,
+        on_result=log_result,
+    )
+    await scheduler.run()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--experiment_id", required=True)
+    parser.add_argument("--health_check_seconds", type=float)
+    parser.add_argument("--collection_seconds", type=float)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+
+from cartai.agents.base.compaction import (
+    TOKEN_USAGE_KEY,
+    MessageCompactor,
+    TokenUsage,
+    estimate_tokens,
+)
+from cartai.agents.exceptions import TokenBudgetExceeded
+
+
+def tool_round(call_id: str, output: str) -> list:
+    """A model tool call followed by its result"""
+    return [
+        AIMessage(
+            content="",
+            tool_calls=[{"name": "list_runs", "args": {}, "id": call_id}],
+        ),
+        ToolMessage(content=output, tool_call_id=call_id, name="list_runs"),
+    ]
+
+
+def test_large_tool_outputs_are_truncated():
+    """Test that a tool message above the per-message limit is cut"""
+    compactor = MessageCompactor(max_tool_message_tokens=10)
+    messages = [HumanMessage(content="check"), *tool_round("1", "x" * 400)]
+
+    compacted, saved = compactor.compact(messages)
+
+    assert compacted[2].content.startswith("x" * 40 + "\n... [truncated")
+    assert compacted[2].tool_call_id == "1"
+    assert saved > 0
+    assert messages[2].content == "x" * 400
+
+
+def test_old_tool_outputs_are_dropped_to_fit_the_budget():
+    """Test that the oldest outputs go first and the latest one is kept"""
+    compactor = MessageCompactor(
+        max_tool_message_tokens=1000, context_budget_tokens=150
+    )
+    messages = [
+        HumanMessage(content="check"),
+        *tool_round("1", "a" * 400),
+        *tool_round("2", "b" * 400),
+    ]
+
+    compacted, _ = compactor.compact(messages)
+
+    assert "omitted" in compacted[2].content
+    assert compacted[4].content == "b" * 400
+    assert sum(estimate_tokens(m) for m in compacted) <= 150
+
+
+def test_hard_cap_aborts_before_the_model_call():
+    """Test that cumulative usage is tracked and capped per run"""
+    compactor = MessageCompactor(hard_cap_tokens=50)
+    usage = TokenUsage()
+    config = {"configurable": {TOKEN_USAGE_KEY: usage}}
+    state = {"messages": [HumanMessage(content="x" * 120)]}
+
+    result = compactor.pre_model_hook(state, config)
+    assert result["llm_input_messages"] == state["messages"]
+    assert usage.model_calls == 1
+
+    with pytest.raises(TokenBudgetExceeded):
+        compactor.pre_model_hook(state, config)
@@ -0,0 +1,100 @@
+import pytest
+from langchain_core.tools import StructuredTool
+
+from cartai.agents.base.mcp_aware_agent import MCPAwareAgent
+
+
+def make_tool(name: str) -> StructuredTool:
+    """Create a dummy tool"""
+
+    async def tool(experiment_id: str) -> str:
+        """Dummy tool"""
+        return experiment_id
+
+    return StructuredTool.from_function(coroutine=tool, name=name)
+
+
+class FakeMCPClient:
+    """MCP client returning a configurable tool list"""
+
+    def __init__(self, *names: str):
+        self.names = list(names)
+        self.calls = 0
+        self.fail = False
+
+    async def get_tools(self):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("server down")
+        return [make_tool(name) for name in self.names]
+
+
+class ToolAgent(MCPAwareAgent):
+    """Test agent recording tool list changes"""
+
+    changes = 0
+
+    def _on_tools_changed(self):
+        self.changes += 1
+
+    async def run(self, state):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_initialize_fetches_tools_once():
+    """Test that initialization is idempotent"""
+    client = FakeMCPClient("list_runs")
+    agent = ToolAgent(mcp_client=client)
+
+    await agent.initialize()
+    await agent.initialize()
+    await agent.get_tools()
+
+    assert client.calls == 1
+    assert agent.tools_version is not None
+
+
+@pytest.mark.asyncio
+async def test_expired_tools_are_refreshed_when_the_server_changes():
+    """Test that the TTL refresh only rebinds tools when their list changed"""
+    client = FakeMCPClient("list_runs")
+    agent = ToolAgent(mcp_client=client, tools_ttl_seconds=0)
+
+    first = await agent.get_tools()
+    assert await agent.get_tools() is first
+    version = agent.tools_version
+
+    client.names.append("get_run")
+    tools = await agent.get_tools()
+
+    assert [tool.name for tool in tools] == ["list_runs", "get_run"]
+    assert agent.tools_version != version
+    assert agent.changes == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_previous_tools():
+    """Test that an unreachable server does not wipe the known tools"""
+    client = FakeMCPClient("list_runs")
+    agent = ToolAgent(mcp_client=client, tools_ttl_seconds=0)
+    tools = await agent.get_tools()
+
+    client.fail = True
+
+    assert await agent.get_tools() is tools
+
+
+@pytest.mark.asyncio
+async def test_tool_filter_is_applied_in_get_tools():
+    """Test that only allowed tools are bound, with a savings report"""
+    client = FakeMCPClient("mlflow_list_runs", "API-get-users", "API-post-page")
+    agent = ToolAgent(mcp_client=client, tool_filter={"allow": ["mlflow_*"]})
+
+    tools = await agent.get_tools()
+
+    assert [tool.name for tool in tools] == ["mlflow_list_runs"]
+    assert agent.get_agent_info()["tool_filter"]["dropped"] == [
+        "API-get-users",
+        "API-post-page",
+    ]
@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+from langchain_core.tools import StructuredTool
+
+from cartai.agents.base.mcp_aware_agent import MCPAwareAgent
+from cartai.agents.base.tool_cache import ToolCachePolicy, ToolResultCache
+
+
+class CountingServer:
+    """Fake MCP server counting the tool calls it receives"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def list_runs(self, experiment_id: str) -> str:
+        """List the runs of an experiment"""
+        self.calls += 1
+        await asyncio.sleep(0.01)
+        return f"runs of {experiment_id}"
+
+    async def delete_run(self, run_id: str) -> str:
+        """Delete a run"""
+        self.calls += 1
+        return "deleted"
+
+
+class FakeMCPClient:
+    """Multi-server client exposing the tools of a single fake server"""
+
+    def __init__(self, server: CountingServer):
+        self.server = server
+        self.connections = {"mlflow": {"url": "http://localhost:9000/mcp/"}}
+
+    async def get_tools(self, server_name=None):
+        return [
+            StructuredTool.from_function(coroutine=self.server.list_runs),
+            StructuredTool.from_function(coroutine=self.server.delete_run),
+        ]
+
+
+class ToolAgent(MCPAwareAgent):
+    async def run(self, state):
+        return {}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_are_coalesced():
+    """Test that identical in-flight calls run once"""
+    cache = ToolResultCache()
+    server = CountingServer()
+
+    results = await asyncio.gather(
+        *(cache.call("key", lambda: server.list_runs("1")) for _ in range(5))
+    )
+
+    assert results == ["runs of 1"] * 5
+    assert server.calls == 1
+    assert cache.stats()["coalesced"] == 4
+
+
+@pytest.mark.asyncio
+async def test_results_expire_and_failures_are_not_cached():
+    """Test TTL expiry and that errors are retried"""
+    cache = ToolResultCache()
+    server = CountingServer()
+
+    await cache.call("key", lambda: server.list_runs("1"), ttl_seconds=0)
+    await cache.call("key", lambda: server.list_runs("1"), ttl_seconds=0)
+    assert server.calls == 2
+
+    async def failing():
+        raise ConnectionError("server down")
+
+    with pytest.raises(ConnectionError):
+        await cache.call("other", failing)
+    assert await cache.call("other", lambda: server.list_runs("2")) == "runs of 2"
+
+
+@pytest.mark.asyncio
+async def test_agents_share_idempotent_tool_results():
+    """Test that agents with separate clients hit the server once"""
+    cache = ToolResultCache()
+    server = CountingServer()
+    policies = {"mlflow": {"idempotent": ["*list_*"], "ttl_seconds": 60}}
+    agents = [
+        ToolAgent(
+            mcp_client=FakeMCPClient(server),
+            tool_cache_policies=policies,
+            tool_cache=cache,
+        )
+        for _ in range(2)
+    ]
+
+    for agent in agents:
+        list_runs, delete_run = await agent.get_tools()
+        assert await list_runs.ainvoke({"experiment_id": "1"}) == "runs of 1"
+        await delete_run.ainvoke({"run_id": "r1"})
+
+    # One list_runs call, and every non-idempotent delete_run call
+    assert server.calls == 3
+
+
+def test_policy_requires_idempotent_tools():
+    """Test that a policy without idempotent tools caches nothing"""
+    assert ToolCachePolicy.from_config({"ttl_seconds": 10}) is None
+    assert ToolCachePolicy.from_config({"idempotent": ["get_*"]}).is_idempotent(
+        "get_model_details"
+    )
@@ -0,0 +1,43 @@
+from langchain_core.tools import StructuredTool
+
+from cartai.agents.base.tool_filter import ToolFilter
+
+
+def make_tool(name: str) -> StructuredTool:
+    """Create a dummy tool"""
+
+    def tool(page_id: str, content: str) -> str:
+        """Dummy tool with a couple of arguments"""
+        return page_id
+
+    return StructuredTool.from_function(tool, name=name)
+
+
+def test_from_config_is_opt_in():
+    """Test that no filter is built without a tools block"""
+    assert ToolFilter.from_config(None) is None
+    assert ToolFilter.from_config(["mlflow_*"]).allow == ("mlflow_*",)
+
+
+def test_allow_and_deny_globs():
+    """Test that deny patterns apply after allow patterns"""
+    tool_filter = ToolFilter(allow=["mlflow_*", "API-post-page"], deny=["*_delete*"])
+
+    assert tool_filter.matches("mlflow_list_runs")
+    assert tool_filter.matches("API-post-page")
+    assert not tool_filter.matches("mlflow_delete_run")
+    assert not tool_filter.matches("API-get-users")
+    assert ToolFilter(deny=["API-*"]).matches("mlflow_list_runs")
+
+
+def test_apply_reports_saved_schema_tokens():
+    """Test that dropped tools are reported with their schema size"""
+    tools = [make_tool("mlflow_list_runs"), make_tool("API-get-users")]
+
+    kept, report = ToolFilter(allow=["mlflow_*"]).apply(tools)
+
+    assert kept == tools[:1]
+    assert report.tools_total == 2
+    assert report.tools_bound == 1
+    assert report.dropped == ["API-get-users"]
+    assert report.schema_tokens_saved > 0
@@ -0,0 +1,48 @@
+from cartai.agents.observability.alerts import AlertStore
+
+
+def submit(store, now, severity="warning", alert_type="latency"):
+    return store.submit(
+        "exp1",
+        "latency_ms",
+        alert_type,
+        "latency_ms above limit",
+        severity=severity,
+        value=1500.0,
+        threshold=1000.0,
+        now=now,
+    )
+
+
+def test_repeats_are_suppressed_within_cooldown():
+    """Test that an identical alert is only emitted once per cooldown"""
+    store = AlertStore(cooldown_seconds=60)
+
+    assert submit(store, now=0) is not None
+    assert submit(store, now=30) is None
+    alert = submit(store, now=61)
+    assert alert is not None
+    assert alert.occurrences == 3
+    assert (store.emitted, store.suppressed) == (2, 1)
+
+
+def test_changed_fingerprint_bypasses_cooldown():
+    """Test that an escalation is emitted even within the cooldown"""
+    store = AlertStore(cooldown_seconds=60)
+    fingerprint = submit(store, now=0).fingerprint
+
+    escalated = submit(store, now=10, severity="critical")
+    assert escalated is not None
+    assert escalated.fingerprint != fingerprint
+    assert submit(store, now=20, alert_type="error_rate") is not None
+    assert len(store) == 2
+
+
+def test_resolved_incidents_are_emitted_again():
+    """Test that an alert recurring after resolution is a new incident"""
+    store = AlertStore(cooldown_seconds=60)
+    submit(store, now=0)
+
+    resolved = store.resolve("exp1", active=[])
+    assert [alert.metric for alert in resolved] == ["latency_ms"]
+    assert submit(store, now=10) is not None
@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from cartai.agents.observability.drift import (
+    detect_drift,
+    ewma,
+    ks_statistic,
+    psi,
+    runs_to_matrix,
+)
+
+
+@pytest.fixture
+def rng():
+    return np.random.default_rng(0)
+
+
+def test_runs_to_matrix_orders_oldest_first():
+    """Test that runs are batched oldest first with NaN for missing metrics"""
+    names, matrix = runs_to_matrix(
+        [
+            {"metrics": {"accuracy": 0.9, "loss": 0.1}},
+            {"metrics": {"accuracy": 0.8}},
+        ]
+    )
+
+    assert names == ["accuracy", "loss"]
+    np.testing.assert_array_equal(matrix[:, 0], [0.8, 0.9])
+    assert np.isnan(matrix[0, 1])
+
+
+def test_statistics_separate_shifted_columns(rng):
+    """Test that PSI and KS are near zero for equal and large for shifted data"""
+    reference = rng.normal(size=(500, 2))
+    current = rng.normal(size=(500, 2))
+    current[:, 1] += 3
+
+    psi_values = psi(reference, current)
+    ks_values = ks_statistic(reference, current)
+    assert psi_values[0] < 0.1 < 1 < psi_values[1]
+    assert ks_values[0] < 0.1 and ks_values[1] > 0.8
+
+
+def test_ks_matches_reference_implementation(rng):
+    """Test the KS statistic against a direct computation"""
+    reference = rng.integers(0, 5, size=(40, 1)).astype(float)
+    current = rng.integers(1, 6, size=(30, 1)).astype(float)
+    points = np.unique(np.concatenate([reference, current]))
+
+    expected = max(abs((reference <= x).mean() - (current <= x).mean()) for x in points)
+    assert ks_statistic(reference, current)[0] == pytest.approx(expected)
+
+
+def test_ewma_skips_missing_values():
+    """Test that NaN values do not reset or poison the average"""
+    matrix = np.array([[1.0], [np.nan], [3.0]])
+    assert ewma(matrix, alpha=0.5)[0] == pytest.approx(2.0)
+
+
+def test_detect_drift_flags_only_drifting_metric(rng):
+    """Test that a step change raises alerts on that metric only"""
+    matrix = rng.normal(0.9, 0.01, size=(40, 2))
+    matrix[-10:, 1] -= 0.2
+
+    report = detect_drift(["accuracy", "f1"], matrix, window=10)
+
+    assert report.drift_detected
+    assert {alert["metric"] for alert in report.alerts} == {"f1"}
+    assert {alert["type"] for alert in report.alerts} == {"psi", "ks", "zscore", "ewma"}
+    assert report.to_state()["drift_score"] == pytest.approx(report.psi[1])
+
+
+def test_detect_drift_needs_reference_runs():
+    """Test that too short histories are not scored"""
+    assert detect_drift(["accuracy"], np.ones((6, 1))) is None
@@ -0,0 +1,61 @@
+import numpy as np
+
+from cartai.agents.observability.metrics_history import MetricSeries, MetricsHistory
+
+
+def test_series_is_a_bounded_ring_buffer():
+    """Test that the oldest points are overwritten once full"""
+    series = MetricSeries(capacity=3)
+    for i in range(5):
+        series.append(float(i), i * 10.0)
+
+    assert len(series) == 3
+    np.testing.assert_array_equal(series.timestamps, [2.0, 3.0, 4.0])
+    np.testing.assert_array_equal(series.values, [20.0, 30.0, 40.0])
+
+    assert series.prune(3.5) == 2
+    np.testing.assert_array_equal(series.values, [40.0])
+
+
+def test_baseline_uses_recent_window():
+    """Test that the rolling baseline only covers the window"""
+    history = MetricsHistory()
+    for i, value in enumerate([1.0, 1.0, 3.0, 5.0]):
+        history.record("exp1", {"loss": value}, timestamp=float(i))
+
+    assert history.baseline("exp1", "loss", window=2) == {
+        "mean": 4.0,
+        "std": 1.0,
+        "count": 2,
+    }
+    assert history.baseline("exp1", "missing") is None
+
+
+def test_history_is_persisted_and_trimmed(tmp_path):
+    """Test that points are reloaded from disk within capacity and retention"""
+    path = tmp_path / "history.sqlite"
+    history = MetricsHistory(capacity=2, path=path)
+    for i, accuracy in enumerate([0.8, 0.81, 0.82]):
+        history.record("exp1", {"accuracy": accuracy}, run_id=f"r{i}")
+    history.close()
+
+    reloaded = MetricsHistory(capacity=2, path=path)
+    np.testing.assert_allclose(reloaded.series("exp1", "accuracy")[1], [0.81, 0.82])
+    assert reloaded.latest("exp1")["run_id"] == "r2"
+    assert reloaded.latest("exp1")["metrics"] == {"accuracy": 0.82}
+
+    reloaded.retention_seconds = 60
+    assert reloaded.prune(now=reloaded.latest("exp1")["timestamp"] + 120) == 2
+    assert len(reloaded) == 0
+
+
+def test_persistence_is_opt_in_and_per_agent(tmp_path):
+    """Test that histories stay in memory unless persisted, one file per node"""
+    assert MetricsHistory.from_config(None).path is None
+
+    config = {"persist": True, "root": str(tmp_path)}
+    first = MetricsHistory.from_config(config, name="monitor_prod")
+    named = MetricsHistory.from_config({**config, "name": "shared"}, name="other")
+
+    assert first.path == tmp_path / "monitor_prod.sqlite"
+    assert named.path == tmp_path / "shared.sqlite"
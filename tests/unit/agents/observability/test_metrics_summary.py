@@ -0,0 +1,72 @@
+import json
+
+from cartai.agents.observability.metrics_summary import (
+    DEGRADED,
+    HEALTHY,
+    UNKNOWN,
+    parse_runs,
+    summarize_runs,
+)
+
+THRESHOLDS = {
+    "accuracy_degradation_threshold": 0.05,
+    "latency_threshold_ms": 1000,
+    "error_rate_threshold": 0.05,
+}
+
+
+def make_runs(*metrics):
+    """Create finished runs, newest first"""
+    return [
+        {"run_id": f"run{i}", "status": "FINISHED", "metrics": m}
+        for i, m in enumerate(metrics)
+    ]
+
+
+def test_parse_runs_accepts_tool_output():
+    """Test that the list_runs JSON output is decoded"""
+    payload = json.dumps({"runs": make_runs({"accuracy": 0.9})})
+    assert parse_runs(payload)[0]["run_id"] == "run0"
+    assert parse_runs([{"type": "text", "text": payload}])[0]["run_id"] == "run0"
+    assert parse_runs('{"error": "boom"}') == []
+    assert parse_runs("not json") == []
+
+
+def test_summary_is_healthy_within_thresholds():
+    """Test that runs within every threshold are healthy"""
+    summary = summarize_runs(
+        "exp1",
+        make_runs(
+            {"accuracy": 0.91, "latency_ms": 200, "error_rate": 0.01},
+            {"accuracy": 0.93, "latency_ms": 180, "error_rate": 0.01},
+        ),
+        THRESHOLDS,
+    )
+
+    assert summary.latest_run_id == "run0"
+    assert summary.best_run_id == "run1"
+    assert [check.name for check in summary.checks] == [
+        "accuracy_degradation",
+        "latency",
+        "error_rate",
+    ]
+    assert summary.system_health == HEALTHY
+    assert summary.metric_stats["accuracy"]["max"] == 0.93
+
+
+def test_summary_flags_degradation():
+    """Test that an accuracy drop beyond the threshold is reported"""
+    summary = summarize_runs(
+        "exp1",
+        make_runs({"accuracy": 0.80}, {"accuracy": 0.92}),
+        THRESHOLDS,
+    )
+
+    assert [check.name for check in summary.failed_checks] == ["accuracy_degradation"]
+    assert summary.system_health == DEGRADED
+    assert json.loads(summary.to_prompt())["computed_health"] == DEGRADED
+
+
+def test_summary_without_runs_is_unknown():
+    """Test that an empty experiment has unknown health"""
+    assert summarize_runs("exp1", [], THRESHOLDS).system_health == UNKNOWN
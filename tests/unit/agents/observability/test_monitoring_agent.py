@@ -0,0 +1,346 @@
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.tools import StructuredTool
+
+from cartai.agents.observability.metrics_summary import summarize_runs
+from cartai.agents.observability.monitoring_agent import MonitoringAgent
+from cartai.orchestration.runtime.agent_pool import AgentProvider
+
+
+def make_tool(name: str) -> StructuredTool:
+    """Create a dummy tool"""
+
+    def tool(experiment_id: str) -> str:
+        """Dummy tool"""
+        return experiment_id
+
+    return StructuredTool.from_function(tool, name=name)
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    """Create a monitoring agent without MCP client"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.chdir(tmp_path)
+    return MonitoringAgent()
+
+
+def test_react_agent_is_reused_per_model_and_tools(agent):
+    """Test that the ReAct agent is only rebuilt when model or tools change"""
+    tools = [make_tool("list_runs")]
+
+    first = agent._get_react_agent("openai:gpt-4o-mini", tools)
+    assert agent._get_react_agent("openai:gpt-4o-mini", tools) is first
+    assert agent._get_react_agent("openai:gpt-4.1-nano", tools) is not first
+    assert agent._get_react_agent("openai:gpt-4o-mini", [make_tool("x")]) is not first
+
+
+def test_debug_is_opt_in(agent):
+    """Test that debug tracing is disabled by default"""
+    assert agent.debug is False
+    assert MonitoringAgent(debug=True).debug is True
+
+
+@pytest.mark.asyncio
+async def test_metrics_summary_is_collected_without_llm(agent):
+    """Test that runs are fetched through the MCP tool and summarized"""
+    calls = []
+
+    def list_runs(experiment_id: str, max_results: int = 100) -> str:
+        """List runs"""
+        calls.append((experiment_id, max_results))
+        return json.dumps(
+            {
+                "runs": [
+                    {
+                        "run_id": "r2",
+                        "status": "FINISHED",
+                        "metrics": {"accuracy": 0.8},
+                    },
+                    {
+                        "run_id": "r1",
+                        "status": "FINISHED",
+                        "metrics": {"accuracy": 0.9},
+                    },
+                ]
+            }
+        )
+
+    tools = [StructuredTool.from_function(list_runs, name="mlflow_list_runs")]
+    runs = await agent._fetch_runs({"experiment_id": "1"}, tools)
+    summary = agent._summarize_runs("1", runs)
+
+    assert calls == [("1", 50)]
+    assert summary.system_health == "DEGRADED"
+    context = agent._prepare_monitoring_context({"experiment_id": "1"}, summary)
+    assert "accuracy_degradation" in context
+    assert await agent._fetch_runs({}, tools) is None
+
+
+@pytest.mark.asyncio
+async def test_fast_path_skips_llm_when_nothing_changed(agent, monkeypatch):
+    """Test that an unchanged healthy experiment is answered without the LLM"""
+    metrics = {"accuracy": 0.9}
+
+    def list_runs(experiment_id: str, max_results: int = 100) -> str:
+        """List runs"""
+        return json.dumps(
+            {"runs": [{"run_id": "r1", "status": "FINISHED", "metrics": metrics}]}
+        )
+
+    async def get_tools():
+        return [StructuredTool.from_function(list_runs, name="list_runs")]
+
+    class FakeReactAgent:
+        async def ainvoke(self, inputs, config=None):
+            return {"messages": []}
+
+    monkeypatch.setattr(agent, "get_tools", get_tools)
+    monkeypatch.setattr(agent, "_get_react_agent", lambda *args: FakeReactAgent())
+
+    await agent.run({"experiment_id": "1"})
+    result = await agent.run({"experiment_id": "1"})
+    assert result["system_health"] == "HEALTHY"
+    assert "drift_detected" not in result
+    assert agent.stats["cycles"] == 2
+    assert agent.stats["fast_path_hits"] == 1
+    assert agent.stats["llm_analyses"] == 1
+
+    metrics["accuracy"] = 0.91
+    await agent.run({"experiment_id": "1"})
+    assert agent.get_agent_info()["stats"]["llm_analyses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_checks_are_analysed_while_alerts_cool_down(agent, monkeypatch):
+    """Test that an unchanged breach skips the fast path even without new alerts"""
+
+    def list_runs(experiment_id: str, max_results: int = 100) -> str:
+        """List runs"""
+        return json.dumps(
+            {
+                "runs": [
+                    {
+                        "run_id": "r1",
+                        "status": "FINISHED",
+                        "metrics": {"latency_ms": 5000},
+                    }
+                ]
+            }
+        )
+
+    async def get_tools():
+        return [StructuredTool.from_function(list_runs, name="list_runs")]
+
+    class FakeReactAgent:
+        async def ainvoke(self, inputs, config=None):
+            return {"messages": []}
+
+    monkeypatch.setattr(agent, "get_tools", get_tools)
+    monkeypatch.setattr(agent, "_get_react_agent", lambda *args: FakeReactAgent())
+
+    await agent.run({"experiment_id": "1"})
+    result = await agent.run({"experiment_id": "1"})
+
+    assert result["system_health"] == "DEGRADED"
+    assert agent.stats["fast_path_hits"] == 0
+    assert agent.stats["llm_analyses"] == 2
+
+
+@pytest.mark.asyncio
+async def test_metrics_history_survives_restart(agent, monkeypatch):
+    """Test that recorded metrics are reloaded by a new agent"""
+    config = agent._get_default_config()
+    config["history"]["persist"] = True
+    agent = MonitoringAgent(monitoring_config=config)
+    summary = summarize_runs(
+        "1",
+        [{"run_id": "r1", "status": "FINISHED", "metrics": {"accuracy": 0.9}}],
+        {},
+    )
+    await agent._record_metrics(summary)
+    agent.metrics_history.close()
+
+    restarted = MonitoringAgent(monitoring_config=config)
+    assert restarted.metrics_history.latest("1")["metrics"] == {"accuracy": 0.9}
+    assert restarted._is_unchanged(summary)
+
+
+def test_drift_fields_are_computed_from_runs(agent):
+    """Test that a step change in the latest runs populates the drift fields"""
+    runs = [
+        {
+            "run_id": f"r{i}",
+            "status": "FINISHED",
+            "metrics": {"accuracy": 0.7 if i < 10 else 0.9 + (i % 3) / 100},
+        }
+        for i in range(30)
+    ]
+
+    drift = agent._detect_drift(runs).to_state()
+
+    assert drift["drift_detected"] is True
+    assert drift["drift_score"] > 0
+    assert {alert["metric"] for alert in drift["drift_alerts"]} == {"accuracy"}
+
+
+def test_alerts_are_deduplicated_across_cycles(agent):
+    """Test that a persistent threshold breach is only reported once"""
+    summary = summarize_runs(
+        "1",
+        [{"run_id": "r1", "status": "FINISHED", "metrics": {"latency_ms": 5000}}],
+        agent.monitoring_config["thresholds"],
+    )
+
+    assert [alert.alert_type for alert in agent._raise_alerts(summary, None)] == [
+        "latency"
+    ]
+    assert agent._raise_alerts(summary, None) == []
+    assert agent.get_agent_info()["stats"]["alerts_suppressed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_health_check_is_deterministic_and_stateless(agent, monkeypatch):
+    """Test that health checks evaluate thresholds without touching the history"""
+
+    def list_runs(experiment_id: str, max_results: int = 100) -> str:
+        """List runs"""
+        return json.dumps(
+            {
+                "runs": [
+                    {
+                        "run_id": "r1",
+                        "status": "FINISHED",
+                        "metrics": {"error_rate": 0.2},
+                    }
+                ]
+            }
+        )
+
+    async def get_tools():
+        return [StructuredTool.from_function(list_runs, name="list_runs")]
+
+    monkeypatch.setattr(agent, "get_tools", get_tools)
+
+    result = await agent.health_check({"experiment_id": "1"})
+    assert result["system_health"] == "DEGRADED"
+    assert agent.metrics_history.latest("1") is None
+    assert agent.stats["llm_analyses"] == 0
+
+
+class ToolCallingFakeModel(GenericFakeChatModel):
+    """Fake chat model that accepts tool binding"""
+
+    def bind_tools(self, tools, **kwargs):
+        return self
+
+
+@pytest.mark.asyncio
+async def test_analysis_is_submitted_through_tool_call(monkeypatch, tmp_path):
+    """Test that the submit tool call ends the ReAct loop and is parsed once"""
+    monkeypatch.chdir(tmp_path)
+    model = ToolCallingFakeModel(
+        messages=iter(
+            [
+                AIMessage(
+                    content="",
+                    tool_calls=[
+                        {
+                            "name": "submit_analysis",
+                            "args": {
+                                "system_health": "degraded",
+                                "model_metrics": {"accuracy": 0.8, "note": "n/a"},
+                                "actions_taken": ["compared runs"],
+                            },
+                            "id": "call_1",
+                        }
+                    ],
+                )
+            ]
+        )
+    )
+    agent = MonitoringAgent(model=model)
+
+    result = await agent.run({"experiment_id": "1"})
+
+    assert result == {
+        "model_metrics": {"accuracy": 0.8},
+        "system_health": "DEGRADED",
+        "actions_taken": ["compared runs"],
+    }
+    assert agent.stats["llm_analyses"] == 1
+    assert agent.stats["llm_calls"] == 1
+
+
+def test_free_text_answers_are_not_scraped(agent):
+    """Test that only schema-valid answers are accepted"""
+    valid = AIMessage(content=json.dumps({"system_health": "HEALTHY"}))
+    invalid = AIMessage(content='Here you go: ```json {"system_health": "HEALTHY"}```')
+
+    assert agent._extract_analysis({"messages": [valid]}).system_health == "HEALTHY"
+    assert agent._extract_analysis({"messages": [invalid]}).system_health == "UNKNOWN"
+
+
+def test_llm_cache_is_attached_to_a_model_copy(monkeypatch, tmp_path):
+    """Test that enabling the LLM cache leaves the given model untouched"""
+    monkeypatch.chdir(tmp_path)
+    model = ToolCallingFakeModel(messages=iter([]))
+    agent = MonitoringAgent(
+        model=model,
+        monitoring_config={"llm_cache": {"path": str(tmp_path / "llm.sqlite")}},
+    )
+
+    cached = agent._with_cache(model, agent.llm_cache)
+
+    assert cached.cache is agent.llm_cache
+    assert model.cache is None
+
+
+@pytest.mark.asyncio
+async def test_token_hard_cap_stops_analysis_gracefully(monkeypatch, tmp_path):
+    """Test that exceeding the token cap returns a result instead of raising"""
+    monkeypatch.chdir(tmp_path)
+    model = ToolCallingFakeModel(messages=iter([AIMessage(content="unused")]))
+    agent = MonitoringAgent(
+        model=model, monitoring_config={"compaction": {"hard_cap_tokens": 10}}
+    )
+
+    result = await agent.run({"experiment_id": "1"})
+
+    assert result["system_health"] == "UNKNOWN"
+    assert result["actions_taken"] == ["LLM analysis stopped at its token budget"]
+    assert agent.stats["llm_budget_aborts"] == 1
+
+
+def test_models_are_routed_unless_given(agent):
+    """Test that the default agent picks its model per cycle"""
+    assert agent.model_router is not None
+    assert agent.model_router.select("analysis", prompt_tokens=500) == "gpt-4.1-nano"
+    assert agent.model_router.select("investigation") == "gpt-4.1-mini"
+    assert MonitoringAgent(model="openai:gpt-4o-mini").model_router is None
+
+    # Routed models are wrapped with fallbacks the ReAct agent can bind tools to
+    assert agent._get_react_agent("gpt-4.1-nano", [make_tool("list_runs")])
+
+
+@pytest.mark.asyncio
+async def test_workflow_nodes_keep_separate_histories(monkeypatch, tmp_path):
+    """Test that two monitoring nodes of a workflow persist to their own file"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    config = MonitoringAgent()._get_default_config()
+    config["history"].update(persist=True, root=str(tmp_path))
+    logic = "cartai.agents.observability.monitoring_agent.MonitoringAgent"
+    agents = [
+        await AgentProvider(
+            {"name": name, "logic": logic, "params": {"monitoring_config": config}}
+        ).get()
+        for name in ("monitor_prod", "monitor_staging")
+    ]
+
+    assert [agent.metrics_history.path for agent in agents] == [
+        tmp_path / "monitor_prod.sqlite",
+        tmp_path / "monitor_staging.sqlite",
+    ]
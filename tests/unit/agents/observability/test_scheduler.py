@@ -0,0 +1,81 @@
+import asyncio
+
+import pytest
+
+from cartai.agents.observability.monitoring_agent import MonitoringAgent
+from cartai.agents.observability.scheduler import (
+    HEALTH_CHECK,
+    METRICS_COLLECTION,
+    MonitoringScheduler,
+)
+
+
+@pytest.fixture
+def agent(monkeypatch, tmp_path):
+    """Create a monitoring agent whose jobs only record their concurrency"""
+    monkeypatch.chdir(tmp_path)
+    agent = MonitoringAgent()
+    agent.active = 0
+    agent.max_active = 0
+
+    def job(duration):
+        async def run(state):
+            agent.active += 1
+            agent.max_active = max(agent.max_active, agent.active)
+            await asyncio.sleep(duration)
+            agent.active -= 1
+            return {"system_health": "HEALTHY", "experiment": state["experiment_id"]}
+
+        return run
+
+    monkeypatch.setattr(agent, "health_check", job(0.001))
+    monkeypatch.setattr(agent, "run", job(0.15))
+    return agent
+
+
+@pytest.mark.asyncio
+async def test_jobs_run_at_their_intervals_without_overlap(agent):
+    """Test that both jobs run, never overlap and overruns back off"""
+    results = []
+    scheduler = MonitoringScheduler(
+        agent,
+        {"experiment_id": "1"},
+        health_check_seconds=0.02,
+        collection_seconds=0.05,
+        jitter=0.0,
+        on_result=lambda name, result: results.append(name),
+    )
+
+    await asyncio.wait_for(scheduler.run(duration_seconds=0.5), 5)
+    stats = scheduler.get_stats()
+
+    assert agent.max_active == 1
+    assert stats[HEALTH_CHECK]["runs"] > 0 and stats[HEALTH_CHECK]["skipped"] > 0
+    assert stats[METRICS_COLLECTION]["overruns"] >= 1
+    # Missed ticks are not replayed: at most one collection per backed-off slot
+    assert stats[METRICS_COLLECTION]["runs"] <= 4
+    assert results.count(METRICS_COLLECTION) == stats[METRICS_COLLECTION]["runs"]
+
+
+@pytest.mark.asyncio
+async def test_failures_and_timeouts_do_not_stop_the_loop(agent, monkeypatch):
+    """Test that failing cycles are counted and the scheduler keeps going"""
+
+    async def failing(state):
+        raise RuntimeError("MLflow unavailable")
+
+    monkeypatch.setattr(agent, "health_check", failing)
+    scheduler = MonitoringScheduler(
+        agent,
+        {"experiment_id": "1"},
+        health_check_seconds=0.02,
+        collection_seconds=10,
+        cycle_timeout_seconds=0.05,
+    )
+
+    await asyncio.wait_for(scheduler.run(duration_seconds=0.3), 5)
+    stats = scheduler.get_stats()
+
+    assert stats[HEALTH_CHECK]["failures"] >= 2
+    assert stats[HEALTH_CHECK]["last_error"] == "MLflow unavailable"
+    assert stats[METRICS_COLLECTION]["failures"] == 1  # timed out
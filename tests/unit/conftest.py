@@ -0,0 +1,4 @@
+import os
+
+# Console-only logging: the development config also writes logs/cartai.log
+os.environ.setdefault("CARTAI_ENV", "testing")
@@ -1,9 +1,12 @@
 import pytest
 import os
 from pathlib import Path
+from types import SimpleNamespace
 from jinja2 import Template
 
+from cartai.deprecated.llm_agents import documenter as documenter_module
 from cartai.deprecated.llm_agents.documenter import AIDocumenter
+from cartai.utils.llm_cache import LLMResponseCache
 from cartai.utils.model_client_utils import LowCostOpenAIModels
 
 
@@ -40,3 +43,27 @@ async def test_generate_readme_no_api_key(documenter):
     os.environ["OPENAI_API_KEY"] = ""
     with pytest.raises(ValueError):
         await documenter.generate("readme.jinja", {})
+
+
+@pytest.mark.asyncio
+async def test_generate_uses_llm_cache(monkeypatch, tmp_path):
+    """Test that identical generations hit the LLM only once"""
+    calls = []
+
+    async def fake_acompletion(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content="# README")
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+    monkeypatch.setattr(documenter_module, "acompletion", fake_acompletion)
+    documenter = AIDocumenter(
+        api_key="sk-test",
+        template_dir=Path("cartai/deprecated/llm_agents/templates"),
+        llm_cache=LLMResponseCache(path=tmp_path / "llm.sqlite"),
+    )
+
+    first = await documenter.generate("readme.jinja", {"project_name": "cartai"})
+    second = await documenter.generate("readme.jinja", {"project_name": "cartai"})
+
+    assert first == second == "# README"
+    assert len(calls) == 1
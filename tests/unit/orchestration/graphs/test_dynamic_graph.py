@@ -0,0 +1,514 @@
+import asyncio
+import json
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from cartai.agents.base.mcp_aware_agent import MCPAwareAgent
+from cartai.orchestration.graphs.dynamic_graph import CartaiGraph
+from cartai.orchestration.runtime.agent_pool import AgentPool
+from cartai.orchestration.runtime.streaming import emit_event
+from cartai.orchestration.runtime.telemetry import current_report
+from cartai.orchestration.states.reducers import OmittedMessages
+from cartai.utils.blob_store import BlobRef
+
+
+class CountingAgent(MCPAwareAgent):
+    """Test agent that records how often it runs"""
+
+    input_fields = ("experiment_id",)
+    runs = 0
+
+    async def run(self, state):
+        CountingAgent.runs += 1
+        return {"system_health": "HEALTHY", "model_metrics": {"accuracy": 0.9}}
+
+
+class ConstructionCountingAgent(MCPAwareAgent):
+    """Test agent that records how often it is constructed"""
+
+    constructed = 0
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        ConstructionCountingAgent.constructed += 1
+
+    async def run(self, state):
+        return {"system_health": "HEALTHY"}
+
+
+class ChattyAgent(MCPAwareAgent):
+    """Test agent that makes a single LLM call"""
+
+    async def run(self, state):
+        model = FakeListChatModel(responses=["HEALTHY"])
+        response = await model.ainvoke("How is the system?")
+        return {"system_health": response.content}
+
+
+class FlakyAgent(MCPAwareAgent):
+    """Test agent that hangs on its first attempt"""
+
+    attempts = 0
+
+    async def run(self, state):
+        FlakyAgent.attempts += 1
+        if FlakyAgent.attempts == 1:
+            await asyncio.sleep(10)
+        return {"system_health": "HEALTHY"}
+
+
+class UpstreamTimeoutAgent(MCPAwareAgent):
+    """Test agent whose upstream service times out"""
+
+    async def run(self, state):
+        raise TimeoutError("MLflow read timed out")
+
+
+class HangingAgent(MCPAwareAgent):
+    """Test agent that never finishes"""
+
+    async def run(self, state):
+        await asyncio.sleep(10)
+        return {}
+
+
+class TalkativeAgent(MCPAwareAgent):
+    """Test agent that appends a batch of messages"""
+
+    async def run(self, state):
+        return {"messages": [f"step {i}" for i in range(5)]}
+
+
+class BulkyAgent(MCPAwareAgent):
+    """Test agent that writes a large value to the state"""
+
+    async def run(self, state):
+        return {"model_metrics": {f"metric_{i}": float(i) for i in range(2000)}}
+
+
+class ProgressAgent(MCPAwareAgent):
+    """Test agent that reports progress, then waits until cancelled"""
+
+    cancelled = False
+
+    async def run(self, state):
+        emit_event({"progress": 0.5})
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            ProgressAgent.cancelled = True
+            raise
+        return {}
+
+
+class LegacyAgent(MCPAwareAgent):
+    """Test agent that returns the whole state plus an unknown key"""
+
+    async def run(self, state):
+        return {**state, "system_health": "DEGRADED", "not_a_state_key": 1}
+
+
+def write_config(
+    tmp_path,
+    agent_block: str = "",
+    logic: str = "CountingAgent",
+    workflow_block: str = "",
+    agent_pool: AgentPool | None = None,
+) -> "CartaiGraph":
+    """Write a single-agent workflow config and build the graph"""
+    config_file = tmp_path / "workflow.yaml"
+    config_file.write_text(
+        f"""
+name: "Test workflow"
+{workflow_block}
+agents:
+  - name: test_agent
+    logic: "test_dynamic_graph.{logic}"
+{agent_block}
+"""
+    )
+    if agent_pool is None:
+        agent_pool = AgentPool()
+    return CartaiGraph(config_file=config_file, agent_pool=agent_pool)
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    CountingAgent.runs = 0
+    FlakyAgent.attempts = 0
+    ConstructionCountingAgent.constructed = 0
+
+
+@pytest.mark.asyncio
+async def test_agent_results_are_merged(tmp_path):
+    """Test that agent state updates end up in the workflow result"""
+    graph = write_config(tmp_path)
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert result["system_health"] == "HEALTHY"
+    assert result["model_metrics"] == {"accuracy": 0.9}
+    assert CountingAgent.runs == 1
+
+
+@pytest.mark.asyncio
+async def test_node_cache_skips_unchanged_inputs(tmp_path):
+    """Test that memoized agents only run once per distinct input"""
+    graph = write_config(
+        tmp_path,
+        f"""    cache:
+      enabled: true
+      path: "{tmp_path / "nodes.sqlite"}"
+""",
+    )
+
+    first = await graph.ainvoke({"experiment_id": "exp1"})
+    second = await graph.ainvoke({"experiment_id": "exp1"})
+    assert CountingAgent.runs == 1
+    assert second["model_metrics"] == first["model_metrics"]
+
+    await graph.ainvoke({"experiment_id": "exp2"})
+    assert CountingAgent.runs == 2
+
+
+@pytest.mark.asyncio
+async def test_run_report_records_node_spans(tmp_path):
+    """Test that each node execution produces a span with LLM usage"""
+    graph = write_config(tmp_path, logic="ChattyAgent")
+    result, report = await graph.ainvoke_with_report({"experiment_id": "exp1"})
+
+    assert result["system_health"] == "HEALTHY"
+    assert [span.name for span in report.spans] == ["test_agent"]
+
+    span = report.spans[0]
+    assert span.llm_calls == 1
+    assert span.state_delta_bytes > 0
+    assert span.wall_time_s >= span.llm_latency_s > 0
+
+    otel = json.loads(report.to_otel_json())
+    spans = otel["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == 2
+    assert spans[1]["parentSpanId"] == spans[0]["spanId"]
+
+
+@pytest.mark.asyncio
+async def test_agent_timeout_is_retried(tmp_path):
+    """Test that a hung attempt times out and the retry succeeds"""
+    graph = write_config(
+        tmp_path,
+        """    timeout_seconds: 0.1
+    retry:
+      max_attempts: 2
+      backoff_seconds: 0.01
+""",
+        logic="FlakyAgent",
+    )
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert FlakyAgent.attempts == 2
+    assert result["system_health"] == "HEALTHY"
+    assert result["error_messages"] == []
+
+
+@pytest.mark.asyncio
+async def test_agent_timeouts_keep_their_message(tmp_path):
+    """Test that timeouts raised by the agent are not reported as its timeout"""
+    graph = write_config(tmp_path, logic="UpstreamTimeoutAgent")
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert result["error_messages"] == [
+        "Agent test_agent failed: MLflow read timed out"
+    ]
+
+
+@pytest.mark.asyncio
+async def test_workflow_deadline_bounds_agents(tmp_path):
+    """Test that the workflow deadline stops an agent without a timeout"""
+    graph = write_config(
+        tmp_path,
+        logic="HangingAgent",
+        workflow_block="""execution:
+  deadline_seconds: 0.1
+""",
+    )
+    result = await asyncio.wait_for(graph.ainvoke({"experiment_id": "exp1"}), 5)
+
+    assert len(result["error_messages"]) == 1
+    assert "deadline" in result["error_messages"][0]
+
+
+@pytest.mark.asyncio
+async def test_halt_on_error_raises(tmp_path):
+    """Test that agents configured to halt propagate their errors"""
+    graph = write_config(
+        tmp_path,
+        """    timeout_seconds: 0.05
+    halt_on_error: true
+""",
+        logic="HangingAgent",
+    )
+    with pytest.raises(TimeoutError):
+        await graph.ainvoke({"experiment_id": "exp1"})
+
+
+@pytest.mark.asyncio
+async def test_astream_yields_tokens_updates_and_final_state(tmp_path):
+    """Test that streaming surfaces LLM tokens and node deltas before the end"""
+    graph = write_config(tmp_path, logic="ChattyAgent")
+    events = [event async for event in graph.astream({"experiment_id": "exp1"})]
+
+    tokens = [event for event in events if event["type"] == "token"]
+    assert "".join(event["content"] for event in tokens) == "HEALTHY"
+    assert {event["node"] for event in tokens} == {"test_agent"}
+
+    updates = [event for event in events if event["type"] == "update"]
+    assert updates[0]["node"] == "test_agent"
+    assert updates[0]["delta"]["system_health"] == "HEALTHY"
+
+    assert events[-1]["type"] == "end"
+    assert events[-1]["state"]["system_health"] == "HEALTHY"
+    assert events[-1]["report"].spans[0].llm_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_astream_custom_events_and_early_close(tmp_path):
+    """Test that custom events name their node and closing stops the run"""
+    ProgressAgent.cancelled = False
+    # Outside a workflow run there is no stream to write to
+    emit_event({"progress": 0.0})
+    graph = write_config(tmp_path, logic="ProgressAgent")
+    stream = graph.astream({"experiment_id": "exp1"})
+
+    event = await anext(stream)
+    assert event == {"type": "custom", "node": "test_agent", "data": {"progress": 0.5}}
+    # The run scopes do not leak into the consumer between events
+    assert current_report() is None
+
+    await stream.aclose()
+    assert ProgressAgent.cancelled
+
+
+@pytest.mark.asyncio
+async def test_only_validated_deltas_are_forwarded(tmp_path):
+    """Test that whole-state returns do not re-apply reducers or unknown keys"""
+    graph = write_config(tmp_path, logic="LegacyAgent")
+    result, report = await graph.ainvoke_with_report(
+        {"experiment_id": "exp1", "messages": ["hello"]}
+    )
+
+    assert result["system_health"] == "DEGRADED"
+    assert result["messages"] == ["hello"]
+    assert "not_a_state_key" not in result
+    assert report.spans[0].state_delta_bytes == len('{"system_health": "DEGRADED"}')
+
+
+@pytest.mark.asyncio
+async def test_agents_are_built_lazily_and_shared(tmp_path):
+    """Test that agents are constructed on first run, once per shared config"""
+    pool = AgentPool()
+    first = write_config(tmp_path, logic="ConstructionCountingAgent", agent_pool=pool)
+    second = write_config(tmp_path, logic="ConstructionCountingAgent", agent_pool=pool)
+    assert ConstructionCountingAgent.constructed == 0
+    assert len(pool) == 1
+
+    await first.ainvoke({"experiment_id": "exp1"})
+    await second.ainvoke({"experiment_id": "exp1"})
+    assert ConstructionCountingAgent.constructed == 1
+
+
+class LabelAgent(MCPAwareAgent):
+    """Test agent that writes its label param to the state"""
+
+    def __init__(self, label: str = "", **kwargs):
+        super().__init__(**kwargs)
+        self.label = label
+
+    async def run(self, state):
+        return {"actions_taken": [*state["actions_taken"], self.label]}
+
+
+@pytest.mark.asyncio
+async def test_param_overrides_are_not_shared_across_agents(tmp_path):
+    """Test that same-config agents keep their own param overrides"""
+    config_file = tmp_path / "workflow.yaml"
+    config_file.write_text(
+        """
+name: "Overridden workflow"
+agents:
+  - name: first
+    logic: "test_dynamic_graph.LabelAgent"
+  - name: second
+    logic: "test_dynamic_graph.LabelAgent"
+"""
+    )
+    pool = AgentPool(
+        param_overrides={"first": {"label": "one"}, "second": {"label": "two"}}
+    )
+    graph = CartaiGraph(config_file=config_file, agent_pool=pool)
+
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert result["actions_taken"] == ["one", "two"]
+    assert len(pool) == 2
+
+
+class HistoryAgent(MCPAwareAgent):
+    """Test agent that keeps the experiments it has seen"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.seen = []
+
+    async def run(self, state):
+        self.seen.append(state["experiment_id"])
+        return {"actions_taken": list(self.seen)}
+
+
+@pytest.mark.asyncio
+async def test_graphs_do_not_share_agent_state_by_default(tmp_path):
+    """Test that graphs without an explicit pool get their own agents"""
+    config_file = write_config(tmp_path, logic="HistoryAgent").config_file
+    first = CartaiGraph(config_file=config_file)
+    second = CartaiGraph(config_file=config_file)
+
+    await first.ainvoke({"experiment_id": "exp1"})
+    result = await second.ainvoke({"experiment_id": "exp2"})
+
+    assert result["actions_taken"] == ["exp2"]
+
+
+def test_agent_pool_evicts_least_recently_used_providers():
+    """Test that a bounded pool forgets its oldest providers"""
+    pool = AgentPool(max_providers=2)
+    configs = [{"name": f"agent_{i}", "logic": f"module.Agent{i}"} for i in range(3)]
+    first = pool.get_provider(configs[0])
+    pool.get_provider(configs[1])
+    pool.get_provider(configs[0])
+    pool.get_provider(configs[2])
+
+    assert len(pool) == 2
+    assert pool.get_provider(configs[0]) is first
+    assert pool.evict(configs[0])
+    assert len(pool) == 1
+
+
+class InitCountingAgent(MCPAwareAgent):
+    """Test agent that records how often it warms up"""
+
+    warmups = 0
+
+    async def warmup(self):
+        InitCountingAgent.warmups += 1
+        await super().warmup()
+
+    async def run(self, state):
+        return {"system_health": "HEALTHY"}
+
+
+@pytest.mark.asyncio
+async def test_agents_are_warmed_up_once_at_start(tmp_path):
+    """Test that agents are initialized before the first node, not per execution"""
+    InitCountingAgent.warmups = 0
+    graph = write_config(tmp_path, logic="InitCountingAgent")
+
+    await graph.warmup()
+    assert InitCountingAgent.warmups == 1
+
+    await graph.ainvoke({"experiment_id": "exp1"})
+    await graph.ainvoke({"experiment_id": "exp2"})
+    assert InitCountingAgent.warmups == 1
+
+
+@pytest.mark.asyncio
+async def test_warmup_skips_agents_behind_conditional_routes(tmp_path):
+    """Test that an agent of a branch that is not taken is never built"""
+    config_file = tmp_path / "workflow.yaml"
+    config_file.write_text(
+        """
+name: "Routed workflow"
+execution:
+  warmup: true
+agents:
+  - name: a
+    logic: "test_dynamic_graph.InitCountingAgent"
+  - name: b
+    logic: "test_dynamic_graph.ConstructionCountingAgent"
+routing:
+  - from: __start__
+    logic: "'a'"
+    conditions:
+      a: a
+      b: b
+"""
+    )
+    InitCountingAgent.warmups = 0
+    graph = CartaiGraph(config_file=config_file, agent_pool=AgentPool())
+
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert result["system_health"] == "HEALTHY"
+    assert InitCountingAgent.warmups == 1
+    assert ConstructionCountingAgent.constructed == 0
+
+
+@pytest.mark.asyncio
+async def test_compact_state_workflow(tmp_path):
+    """Test that agents run unchanged on the compact state representation"""
+    graph = write_config(
+        tmp_path,
+        workflow_block="""execution:
+  state: compact
+""",
+    )
+
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+    await graph.ainvoke({"experiment_id": "exp2"})
+
+    assert result["system_health"] == "HEALTHY"
+    assert result["current_agent"] == "test_agent"
+    assert graph.compile() is graph.compile()
+    with pytest.raises(TypeError):
+        await graph.ainvoke({"drift_score": "high"})
+
+
+@pytest.mark.asyncio
+async def test_messages_are_bounded_by_the_workflow_window(tmp_path):
+    """Test that only the last messages are kept in the state"""
+    graph = write_config(
+        tmp_path,
+        logic="TalkativeAgent",
+        workflow_block="""execution:
+  messages:
+    max_messages: 3
+""",
+    )
+
+    result = await graph.ainvoke({"experiment_id": "exp1"})
+
+    assert result["messages"] == [
+        OmittedMessages(count=2),
+        "step 2",
+        "step 3",
+        "step 4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_large_values_are_offloaded_from_state(tmp_path):
+    """Test that state updates carry blob references, resolved in the result"""
+    graph = write_config(
+        tmp_path,
+        logic="BulkyAgent",
+        workflow_block=f"""execution:
+  offload:
+    path: "{tmp_path / "blobs"}"
+""",
+    )
+
+    events = [event async for event in graph.astream({"experiment_id": "exp1"})]
+
+    delta = next(e for e in events if e["type"] == "update")["delta"]
+    assert isinstance(delta["model_metrics"], BlobRef)
+    result = events[-1]["state"]
+    assert result["model_metrics"]["metric_1999"] == 1999.0
+    assert events[-1]["report"].spans[0].state_delta_bytes < 1024
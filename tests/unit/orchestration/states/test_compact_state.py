@@ -0,0 +1,77 @@
+import pytest
+from langchain_core.messages import AIMessage, HumanMessage
+
+from cartai.orchestration.states import (
+    CompactMLPipelineState,
+    MLPipelineState,
+    OmittedMessages,
+)
+
+
+def test_fields_match_the_typed_state():
+    """Test that both state representations have the same fields"""
+    assert list(CompactMLPipelineState.from_initial({})) == list(
+        MLPipelineState.__annotations__
+    )
+
+
+def test_from_initial_validates_values():
+    """Test that unknown keys and wrong types are rejected at entry"""
+    with pytest.raises(ValueError, match="not_a_field"):
+        CompactMLPipelineState.from_initial({"not_a_field": 1})
+    with pytest.raises(TypeError, match="drift_score"):
+        CompactMLPipelineState.from_initial({"drift_score": "high"})
+    with pytest.raises(TypeError, match="data_quality_score"):
+        CompactMLPipelineState.from_initial({"data_quality_score": True})
+
+    state = CompactMLPipelineState.from_initial({"drift_score": 1})
+    assert state["drift_score"] == 1
+    assert CompactMLPipelineState.from_initial({"drift_detected": True})[
+        "drift_detected"
+    ]
+    assert state.get("missing") is None
+
+
+def test_snapshot_round_trip():
+    """Test that a state survives serialization and is smaller than a dict"""
+    state = CompactMLPipelineState.from_initial(
+        {"experiment_id": "exp1", "model_metrics": {"accuracy": 0.9}}
+    )
+
+    data = state.to_bytes()
+
+    assert CompactMLPipelineState.from_bytes(data) == state
+    assert len(data) < len(str(state.to_dict()))
+
+
+def test_snapshot_keeps_trimmed_messages_marker():
+    """Test that the placeholder of trimmed messages survives a round trip"""
+    state = CompactMLPipelineState.from_initial(
+        {"messages": [OmittedMessages(count=2, refs=("abc",)), "m2"]}
+    )
+
+    restored = CompactMLPipelineState.from_bytes(state.to_bytes())
+
+    assert restored["messages"] == state["messages"]
+
+
+def test_snapshot_round_trips_langchain_messages():
+    """Test that LangChain messages are serialized and restored"""
+    state = CompactMLPipelineState.from_initial(
+        {"messages": [HumanMessage("check exp1"), AIMessage("hi")]}
+    )
+
+    restored = CompactMLPipelineState.from_bytes(state.to_bytes())
+
+    assert restored["messages"] == state["messages"]
+    assert isinstance(restored["messages"][1], AIMessage)
+
+
+def test_snapshot_keeps_marker_shaped_messages():
+    """Test that only the tagged placeholder is restored as a marker"""
+    message = {"count": 1, "refs": []}
+    state = CompactMLPipelineState.from_initial({"messages": [message]})
+
+    restored = CompactMLPipelineState.from_bytes(state.to_bytes())
+
+    assert restored["messages"] == [message]
@@ -0,0 +1,57 @@
+import pytest
+
+from cartai.utils.blob_store import BlobStore
+from cartai.orchestration.states.reducers import (
+    MessageWindow,
+    OmittedMessages,
+    bounded_messages,
+    message_window_scope,
+)
+
+
+def test_summarize_keeps_last_messages_with_a_count():
+    """Test that trimmed messages are counted across merges"""
+    window = MessageWindow(max_messages=3)
+
+    messages = window.merge(["m0", "m1"], ["m2", "m3"])
+    messages = window.merge(messages, ["m4"])
+
+    assert messages == [OmittedMessages(count=2), "m2", "m3", "m4"]
+
+
+def test_drop_keeps_only_the_window():
+    """Test that the drop policy leaves no placeholder"""
+    window = MessageWindow(max_messages=2, overflow="drop")
+
+    assert window.merge(["m0", "m1"], ["m2"]) == ["m1", "m2"]
+
+
+def test_spilled_messages_can_be_loaded(tmp_path):
+    """Test that spilled messages are referenced and loaded back in order"""
+    window = MessageWindow(
+        max_messages=1, overflow="spill", store=BlobStore(root=tmp_path)
+    )
+
+    messages = window.merge(["m0"], ["m1"])
+    messages = window.merge(messages, ["m2", "m3"])
+
+    head = messages[0]
+    assert messages[1:] == ["m3"]
+    assert head.count == 3 and len(head.refs) == 2
+    assert window.load(head) == ["m0", "m1", "m2"]
+
+
+def test_reducer_follows_the_scope():
+    """Test that a workflow without a window keeps every message"""
+    assert MessageWindow.from_config(None) is None
+    assert bounded_messages(["m0"] * 300, ["m1"]) == ["m0"] * 300 + ["m1"]
+    with message_window_scope(None):
+        assert bounded_messages(["m0"] * 300, ["m1"]) == ["m0"] * 300 + ["m1"]
+    with message_window_scope(MessageWindow(max_messages=2, overflow="drop")):
+        assert bounded_messages(["m0"] * 300, ["m1"]) == ["m0", "m1"]
+
+
+def test_unknown_policy_is_rejected():
+    """Test that configuration errors surface when the window is built"""
+    with pytest.raises(ValueError, match="truncate"):
+        MessageWindow.from_config({"overflow": "truncate"})
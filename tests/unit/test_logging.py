@@ -0,0 +1,143 @@
+import atexit
+import logging
+import queue
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from cartai.logging import InProcessQueueHandler, LoggerFactory
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class ThreadRecordingHandler(logging.Handler):
+    """Handler recording the thread each record is handled on"""
+
+    threads: list = []
+
+    def emit(self, record):
+        ThreadRecordingHandler.threads.append(threading.current_thread().name)
+
+
+class BufferHandler(logging.Handler):
+    """Handler validating its constructor options"""
+
+    def __init__(self, capacity: int = 10):
+        if not isinstance(capacity, int):
+            raise TypeError("capacity must be an int")
+        super().__init__()
+        self.capacity = capacity
+
+
+def make_config(handler: dict, use_queue: bool) -> dict:
+    return {
+        "handlers": {"test": {"level": "DEBUG", "queue": use_queue, **handler}},
+        "root": {"level": "DEBUG", "handlers": ["test"]},
+    }
+
+
+@pytest.fixture(autouse=True)
+def restore_root_logger(monkeypatch):
+    monkeypatch.delenv("CARTAI_LOG_QUEUE", raising=False)
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    yield
+    LoggerFactory.reset()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+
+
+def test_import_does_not_configure_logging():
+    """Test that the config is only loaded by the first get_logger call"""
+    script = (
+        "import logging, cartai.logging as cl;"
+        "assert cl._factory is None and not logging.getLogger().handlers;"
+        "cl.get_logger('test');"
+        "assert cl._factory is not None"
+    )
+    subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=True)
+
+
+def test_queue_mode_handles_records_on_the_listener_thread():
+    """Test that callers only enqueue records"""
+    ThreadRecordingHandler.threads = []
+    factory = LoggerFactory(
+        make_config({"class": "test_logging.ThreadRecordingHandler"}, True)
+    )
+
+    factory.get_logger("test").info("Agent %s finished", "monitoring")
+    factory.shutdown()
+
+    assert ThreadRecordingHandler.threads
+    assert threading.current_thread().name not in ThreadRecordingHandler.threads
+
+
+def test_only_queued_handlers_run_on_the_listener_thread(tmp_path):
+    """Test that handlers without ``queue: true`` stay synchronous"""
+    ThreadRecordingHandler.threads = []
+    log_file = tmp_path / "cartai.log"
+    config = make_config({"class": "test_logging.ThreadRecordingHandler"}, True)
+    config["handlers"]["file"] = {
+        "class": "logging.FileHandler",
+        "filename": str(log_file),
+    }
+    config["root"]["handlers"].append("file")
+    factory = LoggerFactory(config)
+
+    factory.get_logger("test").info("written synchronously")
+
+    assert "written synchronously" in log_file.read_text()
+    factory.shutdown()
+    assert threading.current_thread().name not in ThreadRecordingHandler.threads
+
+
+def test_listener_shutdown_hooks_do_not_pile_up(monkeypatch):
+    """Test that reconfiguring logging keeps one exit hook at most"""
+    hooks: list = []
+    monkeypatch.setattr(atexit, "register", hooks.append)
+    monkeypatch.setattr(atexit, "unregister", hooks.remove)
+    config = make_config({"class": "test_logging.ThreadRecordingHandler"}, True)
+
+    for _ in range(3):
+        LoggerFactory.reset()
+        LoggerFactory(config)
+
+    assert len(hooks) == 1
+    LoggerFactory.reset()
+    assert hooks == []
+
+
+def test_handler_options_are_constructor_arguments(tmp_path):
+    """Test that file handlers get their filename, directories included"""
+    log_file = tmp_path / "logs" / "cartai.log"
+    factory = LoggerFactory(
+        make_config({"class": "logging.FileHandler", "filename": str(log_file)}, False)
+    )
+
+    factory.get_logger("test").info("written synchronously")
+
+    assert "written synchronously" in log_file.read_text()
+
+
+def test_queue_handler_leaves_the_caller_record_unchanged():
+    """Test that the queued copy, not the original record, is frozen"""
+    handler = InProcessQueueHandler(queue.SimpleQueue())
+    record = logging.LogRecord("test", logging.INFO, "", 0, "run %s", ("a",), None)
+
+    prepared = handler.prepare(record)
+
+    assert prepared is not record
+    assert (prepared.msg, prepared.args) == ("run a", None)
+    assert (record.msg, record.args) == ("run %s", ("a",))
+
+
+def test_invalid_handler_options_are_reported(capsys):
+    """Test that constructor errors are not retried without the options"""
+    LoggerFactory(
+        make_config({"class": "test_logging.BufferHandler", "capacity": "10"}, False)
+    )
+
+    assert "capacity must be an int" in capsys.readouterr().out
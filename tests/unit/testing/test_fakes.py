@@ -0,0 +1,73 @@
+from pathlib import Path
+
+import pytest
+from langchain_core.messages import HumanMessage, ToolMessage
+
+from cartai.agents.base.tool_cache import default_tool_cache
+from cartai.mcps.registry.mcp_registry import MCPRegistry
+from cartai.orchestration.graphs.dynamic_graph import CartaiGraph
+from cartai.orchestration.runtime.agent_pool import AgentPool
+from cartai.testing import InProcessMCPClient, ScriptedChatModel, monitoring_script
+
+ROOT = Path(__file__).resolve().parents[3]
+
+
+@pytest.mark.asyncio
+async def test_scripted_model_replays_its_script_every_run():
+    """Test that the script step follows the conversation, not the call count"""
+    model = ScriptedChatModel(script=monitoring_script())
+    messages = [HumanMessage(content="Check the experiment")]
+
+    first = await model.ainvoke(messages)
+    tool_result = ToolMessage(content="{}", tool_call_id=first.tool_calls[0]["id"])
+    second = await model.ainvoke([*messages, first, tool_result])
+    again = await model.ainvoke(messages)
+
+    assert first.tool_calls[0]["name"] == "mlflow_get_system_info"
+    assert second.tool_calls[0]["name"] == "submit_analysis"
+    assert again.tool_calls == first.tool_calls
+    assert first.usage_metadata["total_tokens"] > 0
+
+
+@pytest.mark.asyncio
+async def test_in_process_client_lists_and_calls_tools():
+    """Test that in-process servers are served like remote MCP servers"""
+    client = InProcessMCPClient({"mlflow": {}, "notion": {}})
+
+    mlflow_tools = await client.get_tools(server_name="mlflow")
+    all_tools = await client.get_tools()
+    list_runs = next(t for t in mlflow_tools if t.name == "mlflow_list_runs")
+    payload = await list_runs.ainvoke({"experiment_id": "1"})
+
+    assert len(all_tools) == len(mlflow_tools) + 2
+    assert '"run_id": "run-0"' in payload
+    assert client.timings["mcp_connect"] > 0
+
+
+@pytest.mark.asyncio
+async def test_example_workflow_runs_offline(tmp_path, monkeypatch):
+    """Test the ML pipeline example end to end with the fake LLM and MCPs"""
+    monkeypatch.chdir(tmp_path)
+    default_tool_cache().clear()
+    pool = AgentPool(
+        mcp_client_factory=InProcessMCPClient,
+        param_overrides={
+            "monitoring_agent": {
+                "model": ScriptedChatModel(script=monitoring_script("DEGRADED"))
+            }
+        },
+    )
+    graph = CartaiGraph(
+        config_file=ROOT
+        / "cartai/orchestration/configs/ml_pipeline_example minimal.yaml",
+        mcp_registry=MCPRegistry(
+            mcp_config_path=ROOT / "cartai/mcps/configs/mcp_configs.yaml"
+        ),
+        agent_pool=pool,
+    )
+
+    result, report = await graph.ainvoke_with_report({"experiment_id": "1"})
+
+    assert result["system_health"] == "DEGRADED"
+    assert result["actions_taken"] == ["checked MLflow server"]
+    assert report.spans[0].llm_calls == 2
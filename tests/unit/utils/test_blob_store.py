@@ -0,0 +1,65 @@
+import pytest
+
+from cartai.utils.blob_store import BlobRef, BlobStore, ResolvingView
+
+
+def test_values_are_stored_once_by_content(tmp_path):
+    """Test that equal values share a single blob"""
+    store = BlobStore(root=tmp_path)
+
+    first = store.put({"runs": list(range(1000))})
+    second = store.put({"runs": list(range(1000))})
+
+    assert first == second
+    assert store.writes == 1
+    assert first in store
+    assert BlobStore(root=tmp_path).get(first) == {"runs": list(range(1000))}
+
+
+def test_stored_value_does_not_follow_the_caller_object(tmp_path):
+    """Test that changing the stored object afterwards leaves the blob intact"""
+    store = BlobStore(root=tmp_path)
+    value = {"runs": [1, 2, 3]}
+
+    ref = store.put(value)
+    value["runs"].append(4)
+
+    assert store.get(ref) == {"runs": [1, 2, 3]}
+
+
+def test_only_reads_fill_the_memory_cache(tmp_path):
+    """Test that puts do not unpickle values into memory, reads do once"""
+    store = BlobStore(root=tmp_path)
+    ref = store.put({"runs": list(range(1000))})
+    store.put({"runs": list(range(1000))})
+    assert store.stats()["in_memory"] == 0
+
+    assert store.get(ref) is store.get(ref)
+    assert store.reads == 1
+
+
+def test_offload_only_replaces_large_values(tmp_path):
+    """Test that small values stay inline"""
+    store = BlobStore(root=tmp_path, min_size_bytes=1024)
+
+    assert store.offload({"accuracy": 0.9}) == {"accuracy": 0.9}
+    ref = store.offload("x" * 2048)
+    assert isinstance(ref, BlobRef)
+    assert store.resolve(ref) == "x" * 2048
+
+
+def test_missing_blob_raises_key_error(tmp_path):
+    """Test that unknown digests are reported"""
+    with pytest.raises(KeyError):
+        BlobStore(root=tmp_path).get("0" * 64)
+
+
+def test_resolving_view_loads_values_on_access(tmp_path):
+    """Test that only the values read are loaded"""
+    store = BlobStore(root=tmp_path, memory_entries=0)
+    view = ResolvingView({"small": 1, "large": store.put([0] * 1000)}, store)
+
+    assert view["small"] == 1
+    assert store.reads == 0
+    assert view["large"] == [0] * 1000
+    assert store.reads == 1
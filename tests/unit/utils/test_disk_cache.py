@@ -0,0 +1,56 @@
+import pytest
+
+from cartai.utils.disk_cache import DiskCache, stable_hash
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create a cache backed by a temporary database"""
+    disk_cache = DiskCache(path=tmp_path / "cache.sqlite", namespace="test")
+    yield disk_cache
+    disk_cache.close()
+
+
+def test_stable_hash_ignores_key_order():
+    """Test that logically equal dicts hash identically"""
+    assert stable_hash({"a": 1, "b": [1, 2]}) == stable_hash({"b": [1, 2], "a": 1})
+    assert stable_hash({"a": 1}) != stable_hash({"a": 2})
+
+
+def test_set_and_get(cache):
+    """Test round-tripping a value"""
+    cache.set("key", {"metrics": [0.1, 0.2]})
+    assert cache.get("key") == {"metrics": [0.1, 0.2]}
+    assert cache.get("missing", "default") == "default"
+    assert cache.stats()["hits"] == 1
+
+
+def test_expired_entries_are_misses(cache):
+    """Test that entries past their TTL are not returned"""
+    cache.set("key", "value", ttl_seconds=-1)
+    assert cache.get("key") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_eviction_by_entry_count(tmp_path):
+    """Test that the least recently used entry is evicted first"""
+    cache = DiskCache(path=tmp_path / "cache.sqlite", max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_namespaces_are_isolated(tmp_path):
+    """Test that caches sharing a file do not see each other's entries"""
+    first = DiskCache(path=tmp_path / "cache.sqlite", namespace="first")
+    second = DiskCache(path=tmp_path / "cache.sqlite", namespace="second")
+    first.set("key", "first")
+
+    assert second.get("key") is None
+    second.clear()
+    assert first.get("key") == "first"
@@ -0,0 +1,69 @@
+import pytest
+from langchain_core.language_models.fake_chat_models import GenericFakeChatModel
+from langchain_core.messages import AIMessage
+
+from cartai.utils.llm_cache import LLMResponseCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an LLM cache backed by a temporary database"""
+    llm_cache = LLMResponseCache(path=tmp_path / "llm.sqlite")
+    yield llm_cache
+    llm_cache.store.close()
+
+
+def test_from_config_is_opt_in(tmp_path):
+    """Test that the cache is only built when enabled"""
+    assert LLMResponseCache.from_config(None) is None
+    assert LLMResponseCache.from_config({"enabled": False}) is None
+    cache = LLMResponseCache.from_config({"path": str(tmp_path / "llm.sqlite")})
+    assert isinstance(cache, LLMResponseCache)
+
+
+def test_completion_key_normalizes_messages():
+    """Test that keys ignore formatting and transport arguments"""
+    key = LLMResponseCache.completion_key(
+        "gpt-4o-mini", [{"role": "user", "content": "Hello "}], temperature=0
+    )
+    same = LLMResponseCache.completion_key(
+        "gpt-4o-mini",
+        [{"role": "user", "content": "Hello", "name": None}],
+        temperature=0,
+        api_key="sk-other",
+    )
+    hotter = LLMResponseCache.completion_key(
+        "gpt-4o-mini", [{"role": "user", "content": "Hello"}], temperature=0.7
+    )
+    assert key == same
+    assert key != hotter
+
+
+@pytest.mark.asyncio
+async def test_acompletion_calls_the_llm_once(cache):
+    """Test that a repeated completion request is answered from the cache"""
+    calls = []
+
+    async def completion(**kwargs):
+        calls.append(kwargs)
+        return {"content": "docs"}
+
+    messages = [{"role": "user", "content": "Write a README"}]
+    first = await cache.acompletion(completion, "gpt-4o-mini", messages, temperature=0)
+    second = await cache.acompletion(completion, "gpt-4o-mini", messages, temperature=0)
+
+    assert first == second == {"content": "docs"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_chat_model_uses_cache(cache):
+    """Test that a LangChain chat model answers repeated prompts from the cache"""
+    model = GenericFakeChatModel(
+        messages=iter([AIMessage(content="first"), AIMessage(content="second")]),
+        cache=cache,
+    )
+
+    assert (await model.ainvoke("status?")).content == "first"
+    assert (await model.ainvoke("status?")).content == "first"
+    assert (await model.ainvoke("other?")).content == "second"
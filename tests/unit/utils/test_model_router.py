@@ -0,0 +1,86 @@
+from types import SimpleNamespace
+
+import pytest
+from langchain_core.runnables.fallbacks import RunnableWithFallbacks
+
+from cartai.utils.model_router import ModelRouter
+
+
+class RateLimited(Exception):
+    """Provider error carrying an HTTP 429 status"""
+
+    status_code = 429
+
+
+@pytest.fixture
+def router():
+    """Create a router sending small analyses to the nano model"""
+    return ModelRouter.from_config(
+        {
+            "default": "gpt-4o-mini",
+            "rules": [
+                {"task": "health_check", "model": "gpt-4.1-nano"},
+                {"max_prompt_tokens": 100, "max_tools": 2, "model": "gpt-4.1-nano"},
+                {"task": ["investigation"], "model": "gpt-4.1-mini"},
+            ],
+            "fallbacks": ["gpt-4.1-mini", "gpt-4o-mini"],
+        }
+    )
+
+
+def test_rules_are_matched_in_order(router):
+    """Test that the first matching rule picks the model"""
+    assert router.select("health_check", prompt_tokens=10_000) == "gpt-4.1-nano"
+    assert router.select("analysis", prompt_tokens=50, num_tools=1) == "gpt-4.1-nano"
+    assert router.select("analysis", prompt_tokens=50, num_tools=5) == "gpt-4o-mini"
+    assert router.select("investigation", prompt_tokens=500) == "gpt-4.1-mini"
+    assert ModelRouter.from_config({"enabled": False}) is None
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_calls_fall_back(router):
+    """Test that a rate-limited model hands the call to the next fallback"""
+    calls = []
+
+    async def completion(model, messages, **params):
+        calls.append(model)
+        if model == "gpt-4.1-nano":
+            raise RateLimited("slow down")
+        usage = SimpleNamespace(prompt_tokens=1000, completion_tokens=500)
+        return SimpleNamespace(model=model, usage=usage)
+
+    response = await router.acompletion(
+        completion, [{"role": "user", "content": "ok?"}], task="health_check"
+    )
+
+    assert response.model == "gpt-4.1-mini"
+    assert calls == ["gpt-4.1-nano", "gpt-4.1-mini"]
+    stats = router.get_stats()
+    assert stats["gpt-4.1-nano"]["rate_limited"] == 1
+    assert stats["gpt-4.1-mini"]["cost_usd"] == pytest.approx(0.0012)
+
+
+@pytest.mark.asyncio
+async def test_other_errors_are_not_retried(router):
+    """Test that only rate limits trigger fallbacks"""
+
+    async def completion(model, messages, **params):
+        raise ValueError("bad request")
+
+    with pytest.raises(ValueError):
+        await router.acompletion(completion, [], task="health_check")
+    assert router.get_stats()["gpt-4.1-nano"]["failures"] == 1
+
+
+def test_chat_model_has_fallbacks(router, monkeypatch):
+    """Test that LangChain models get rate-limit fallbacks"""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+
+    model = router.chat_model("gpt-4.1-nano")
+
+    assert isinstance(model, RunnableWithFallbacks)
+    assert [m.model_name for m in [model.runnable, *model.fallbacks]] == [
+        "gpt-4.1-nano",
+        "gpt-4.1-mini",
+        "gpt-4o-mini",
+    ]